@@ -23,7 +23,53 @@ class CreateRequestError(Exception):
             "error_message": self.error_message,
             "response_body": self.response_body,
         }
-    
+
+
+class AuthenticationError(Exception):
+    """
+    Exception raised when the Spire server rejects the client's credentials (401 Unauthorized).
+    """
+
+    def __init__(self, url: str, status_code: int = 401, error_message: str = ""):
+        self.url = url
+        self.status_code = status_code
+        self.error_message = error_message or "Invalid username or password"
+
+        super().__init__(self.__str__())
+
+    def __str__(self):
+        return f"Authentication failed for '{self.url}' with status {self.status_code}: {self.error_message}"
+
+    def to_dict(self):
+        return {
+            "url": self.url,
+            "status_code": self.status_code,
+            "error_message": self.error_message,
+        }
+
+
+class CompanyNotFoundError(Exception):
+    """
+    Exception raised when the Spire server has no company with the client's company name.
+    """
+
+    def __init__(self, company: str, url: str, error_message: str = ""):
+        self.company = company
+        self.url = url
+        self.error_message = error_message or "No such company"
+
+        super().__init__(self.__str__())
+
+    def __str__(self):
+        return f"No company entries for '{self.company}' at '{self.url}': {self.error_message}"
+
+    def to_dict(self):
+        return {
+            "company": self.company,
+            "url": self.url,
+            "error_message": self.error_message,
+        }
+
 
 """
 Other Common Exceptions that occur during us of the Spire API includes but not limited to the following
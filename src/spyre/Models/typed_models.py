@@ -0,0 +1,94 @@
+import types
+from decimal import Decimal
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, BeforeValidator, PlainSerializer, create_model
+
+from .customers_models import Customer
+from .inventory_models import InventoryItem
+from .purchasing_models import PurchaseOrder, PurchaseOrderItem
+from .sales_models import Invoice, SalesOrder, SalesOrderItem
+
+# ``X | Y`` unions have their own origin from Python 3.10
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+# Money and quantity fields the API sends as decimal strings ("12.50")
+DECIMAL_FIELDS: FrozenSet[str] = frozenset({
+    "availableQty", "averageCost", "backorderQty", "committedQty", "creditApprovedAmount",
+    "creditBalance", "creditLimit", "currentCost", "deposit", "discountAmt", "discountPct",
+    "dutyPct", "extendedPriceCommitted", "extendedPriceOrdered", "freight", "freightPct",
+    "grossProfit", "minimumBuyQty", "onHandQty", "onPurchaseQty", "orderQty", "quantityFactor",
+    "receiveQty", "receivedQty", "reorderPoint", "retailPrice", "standardCost", "subtotal",
+    "subtotalOrdered", "total", "totalCostAverage", "totalCostCurrent", "totalDiscount",
+    "totalOrdered", "unitPrice", "volume", "weight",
+})
+
+# An optional Decimal parsed from the API's string, and sent back as a string so payloads keep full precision
+Amount = Annotated[
+    Optional[Decimal],
+    BeforeValidator(lambda value: None if value == "" else value),
+    PlainSerializer(lambda value: None if value is None else str(value), return_type=Optional[str]),
+]
+
+_decimal_models: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+
+def decimal_model(model_cls: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Return a subclass of a model whose `DECIMAL_FIELDS` are `Decimal` instead of `str`.
+
+    Nested models (order items, addresses...) are converted the same way. The subclass keeps the
+    validators of the original model, dumps amounts back to strings, and is built once per model.
+
+    Example:
+        TypedSalesOrder = decimal_model(SalesOrder)
+        order = TypedSalesOrder(**record)
+        margin = order.total - sum(line.orderQty * line.currentCost for line in order.items)
+    """
+    typed = _decimal_models.get(model_cls)
+    if typed is not None:
+        return typed
+
+    overrides = {}
+    for name, field in model_cls.model_fields.items():
+        if name in DECIMAL_FIELDS and field.annotation == Optional[str]:
+            annotation = Amount
+        else:
+            annotation = _decimal_annotation(field.annotation)
+            if annotation is field.annotation:
+                continue
+        overrides[name] = (annotation, field)
+
+    typed = create_model(f"Typed{model_cls.__name__}", __base__=model_cls, __module__=__name__, **overrides) if overrides else model_cls
+    _decimal_models[model_cls] = typed
+    return typed
+
+
+def _decimal_annotation(annotation: Any) -> Any:
+    """Replace the models nested in an annotation (``List[Item]``, ``Optional[Address]``...) with their decimal versions."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        typed = decimal_model(annotation)
+        return typed if typed is not annotation else annotation
+    args = get_args(annotation)
+    if not args:
+        return annotation
+    typed_args = tuple(_decimal_annotation(arg) for arg in args)
+    if all(typed is arg for typed, arg in zip(typed_args, args)):
+        return annotation
+    origin = get_origin(annotation)
+    if origin in _UNION_ORIGINS:
+        return Union[typed_args]
+    if origin is list:
+        return List[typed_args[0]]
+    if origin is dict:
+        return Dict[typed_args[0], typed_args[1]]
+    return annotation
+
+
+TypedSalesOrder = decimal_model(SalesOrder)
+TypedSalesOrderItem = decimal_model(SalesOrderItem)
+TypedInvoice = decimal_model(Invoice)
+TypedInventoryItem = decimal_model(InventoryItem)
+TypedPurchaseOrder = decimal_model(PurchaseOrder)
+TypedPurchaseOrderItem = decimal_model(PurchaseOrderItem)
+TypedCustomer = decimal_model(Customer)
@@ -1,14 +1,20 @@
-from .client import SpireClient
-from .spire import Spire
-from .inventory import InventoryClient, ItemsClient
-from .sales import OrdersClient, InvoiceClient, salesOrder, invoice
-from .customers import CustomerClient, customer
+from .client import SpireClient, AsyncSpireClient
+from .spire import Spire, AsyncSpire
+from .cache import ResponseCache
+from .mirror import SQLiteMirror, MirrorTable
+from .transport import TransportPolicy, RateLimiter
+from .bulk import BulkResult, BulkCheckpoint
+from .query import Query
+from .sync import SyncEngine, SyncResource, SyncResult, WatermarkStore, JSONWatermarkStore
+from .inventory import InventoryClient, ItemsClient, AsyncInventoryClient, AsyncItemsClient
+from .sales import OrdersClient, InvoiceClient, salesOrder, invoice, AsyncOrdersClient, AsyncInvoiceClient
+from .customers import CustomerClient, customer, AsyncCustomerClient
 from .Models.sales_models import SalesOrder, SalesOrderItem
 from .Models.inventory_models import InventoryItem, Vendor, UnitOfMeasure, Pricing, UPC
 from .Models.shared_models import Currency, Address
-from .Exceptions import CreateRequestError
+from .Exceptions import CreateRequestError, AuthenticationError, CompanyNotFoundError
 from .Models.purchasing_models import PurchaseOrderItem, PurchaseOrder, InventoryRef
-from .purchasing import purchaseOrder, PurchasingClient, PurchasingHistoryClient
+from .purchasing import purchaseOrder, PurchasingClient, PurchasingHistoryClient, AsyncPurchasingClient
 
 __all__ = [
     "SpireClient",
@@ -29,13 +35,36 @@ __all__ = [
     "invoice",
     "CustomerClient",
     "customer",
-    "CreateRequestError"
+    "CreateRequestError",
+    "AuthenticationError",
+    "CompanyNotFoundError",
     "PurchaseOrder",
-    "purchaseOrder"
-    "PurchaseOrderItem"
+    "purchaseOrder",
+    "PurchaseOrderItem",
     "PurchasingClient",
     "PurchasingHistoryClient",
     "InventoryRef",
     "Currency",
-    "Address"
+    "Address",
+    "AsyncSpireClient",
+    "AsyncSpire",
+    "AsyncOrdersClient",
+    "AsyncInvoiceClient",
+    "AsyncCustomerClient",
+    "AsyncInventoryClient",
+    "AsyncItemsClient",
+    "AsyncPurchasingClient",
+    "ResponseCache",
+    "SyncEngine",
+    "SyncResource",
+    "SyncResult",
+    "WatermarkStore",
+    "JSONWatermarkStore",
+    "SQLiteMirror",
+    "MirrorTable",
+    "TransportPolicy",
+    "RateLimiter",
+    "BulkResult",
+    "BulkCheckpoint",
+    "Query"
 ]
\ No newline at end of file
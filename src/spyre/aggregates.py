@@ -0,0 +1,157 @@
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from .client import APIResource
+
+
+def field_value(record: Any, path: str) -> Any:
+    """
+    Read a dotted field path from a wrapped resource, a model or a raw JSON record.
+
+    Lazily validated resources that were never read are looked up in their raw JSON, so
+    aggregating them never triggers validation. Missing fields return None.
+    """
+    return _lookup(_unwrap(record), path.split("."))
+
+
+def _unwrap(record: Any) -> Any:
+    """Return the raw JSON of a lazy resource, the model of any other resource, or the record itself."""
+    if isinstance(record, APIResource):
+        return record._raw if record._raw is not None else record.model
+    return record
+
+
+def _lookup(record: Any, parts: List[str]) -> Any:
+    for part in parts:
+        if record is None:
+            return None
+        record = record.get(part) if type(record) is dict else getattr(record, part, None)
+    return record
+
+
+def _values(records: List[Any], path: str) -> List[Any]:
+    """Read a field from unwrapped records, with a fast path for top-level fields of raw JSON."""
+    parts = path.split(".")
+    if len(parts) == 1:
+        name = parts[0]
+        if all(type(record) is dict for record in records):
+            return [record.get(name) for record in records]
+        return [record.get(name) if type(record) is dict else getattr(record, name, None) for record in records]
+    return [_lookup(record, parts) for record in records]
+
+
+def lines(records: Iterable[Any], field: str = "items") -> List[Any]:
+    """
+    Collect the elements of a list field across records, such as every line of a list of invoices.
+
+    Example:
+        invoice_lines = lines(client.invoices.query_invoices(all=True))
+        revenue_by_part = sum_by(invoice_lines, "partNo", "unitPrice", multiply="orderQty")
+    """
+    collected = []
+    for record in records:
+        collected.extend(field_value(record, field) or [])
+    return collected
+
+
+def column(records: Iterable[Any], path: str) -> np.ndarray:
+    """
+    Return a numeric field of every record as a float64 array.
+
+    Decimal strings, Decimals and numbers are accepted; missing or unparseable values become NaN.
+    Strings are parsed by NumPy in a single conversion when they are all valid.
+    """
+    return _column([_unwrap(record) for record in records], path)
+
+
+def _column(records: List[Any], path: str) -> np.ndarray:
+    values = _values(records, path)
+    try:
+        # NumPy parses numeric strings and turns None into NaN itself
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.fromiter((_to_float(value) for value in values), dtype=np.float64, count=len(values))
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _amounts(records: List[Any], field: str, multiply: Optional[str]) -> np.ndarray:
+    """Return a field of unwrapped records as floats, multiplied by a second field when given."""
+    amounts = _column(records, field)
+    if multiply is not None:
+        amounts = amounts * _column(records, multiply)
+    return amounts
+
+
+def total(records: Iterable[Any], field: str, *, multiply: Optional[str] = None, exact: bool = False) -> Union[float, Decimal]:
+    """
+    Sum a numeric field over records, ignoring missing values.
+
+    Args:
+        records (Iterable): Wrapped resources, models or raw JSON records.
+        field (str): The dotted field to sum (e.g. ``"total"``).
+        multiply (str, optional): A second field multiplied into each value first, e.g.
+            ``total(items, "onHandQty", multiply="averageCost")`` for an inventory valuation.
+        exact (bool, optional): Sum as `Decimal` instead of float64. Slower, but free of rounding. Default is False.
+
+    Returns:
+        float | Decimal: The sum.
+    """
+    records = [_unwrap(record) for record in records]
+    if exact:
+        result = Decimal(0)
+        for record in records:
+            value = _lookup(record, field.split("."))
+            if value is None or value == "":
+                continue
+            amount = Decimal(str(value))
+            if multiply is not None:
+                factor = _lookup(record, multiply.split("."))
+                if factor is None or factor == "":
+                    continue
+                amount *= Decimal(str(factor))
+            result += amount
+        return result
+    return float(np.nansum(_amounts(records, field, multiply)))
+
+
+def sum_by(records: Iterable[Any], by: str, field: str, *, multiply: Optional[str] = None) -> Dict[Any, float]:
+    """
+    Sum a numeric field per group, such as sales per customer or stock value per warehouse.
+
+    Groups are factorised once and summed with a single ``numpy.bincount``.
+
+    Args:
+        records (Iterable): Wrapped resources, models or raw JSON records.
+        by (str): The dotted field to group by (e.g. ``"whse"`` or ``"customer.customerNo"``).
+        field (str): The dotted field to sum.
+        multiply (str, optional): A second field multiplied into each value first.
+
+    Returns:
+        Dict[Any, float]: The sum of each group, in order of first appearance.
+
+    Example:
+        sum_by(client.invoices.query_invoices(all=True), "customer.customerNo", "total")
+        sum_by(client.inventory.items.query_inventory_items(all=True), "whse", "onHandQty", multiply="averageCost")
+    """
+    records = [_unwrap(record) for record in records]
+    keys = _values(records, by)
+    groups: Dict[Any, int] = {key: code for code, key in enumerate(dict.fromkeys(keys))}
+    codes = np.fromiter(map(groups.__getitem__, keys), dtype=np.intp, count=len(keys))
+    sums = np.bincount(codes, weights=np.nan_to_num(_amounts(records, field, multiply)), minlength=len(groups))
+    return {key: float(sums[code]) for key, code in groups.items()}
+
+
+def count_by(records: Iterable[Any], by: str) -> Dict[Any, int]:
+    """Count records per group, in order of first appearance."""
+    counts: Dict[Any, int] = {}
+    for key in _values([_unwrap(record) for record in records], by):
+        counts[key] = counts.get(key, 0) + 1
+    return counts
@@ -0,0 +1,213 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+
+# Response statuses of a failed write that are worth another attempt
+TRANSIENT_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class BulkCheckpoint():
+    """
+    Append-only record of the writes a bulk run has completed, so an interrupted run can resume.
+
+    Each completed record is appended to a JSON-lines file as ``{"key": ..., "id": ...}`` and
+    flushed immediately. Passing the same checkpoint to the next run skips every key it lists.
+    Keys are stored as strings, so ``7`` and ``"7"`` name the same record.
+
+    Example:
+        checkpoint = BulkCheckpoint("catalog-load.jsonl")
+        result = client.inventory.items.create_many(items, key=lambda i: f"{i.partNo}|{i.whse}", checkpoint=checkpoint)
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Path of the checkpoint file. It is created on the first completed write.
+        """
+        self.path = path
+        self._completed: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    line = line.strip()
+                    # A crash can leave a partial last line behind
+                    try:
+                        entry = json.loads(line) if line else None
+                    except ValueError:
+                        continue
+                    if entry is not None:
+                        self._completed[entry["key"]] = entry.get("id")
+
+    def __contains__(self, key: Any) -> bool:
+        return str(key) in self._completed
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def get(self, key: Any) -> Any:
+        """Return the ID recorded for a completed key, or None."""
+        return self._completed.get(str(key))
+
+    def mark(self, key: Any, id: Any = None):
+        """Record a completed write."""
+        key = str(key)
+        with self._lock:
+            self._completed[key] = id
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(json.dumps({"key": key, "id": id}) + "\n")
+                file.flush()
+
+    def reset(self):
+        """Forget every completed key and delete the checkpoint file."""
+        with self._lock:
+            self._completed.clear()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class BulkResult():
+    """Outcome of a bulk create or update: the records that succeeded, failed or were skipped."""
+
+    def __init__(self):
+        self.succeeded: Dict[Any, Any] = {}
+        self.failed: Dict[Any, Exception] = {}
+        self.skipped: List[Any] = []
+
+    @property
+    def ok(self) -> bool:
+        """True if no record failed."""
+        return not self.failed
+
+    def __len__(self) -> int:
+        return len(self.succeeded) + len(self.failed) + len(self.skipped)
+
+    def __repr__(self):
+        return f"BulkResult(succeeded={len(self.succeeded)}, failed={len(self.failed)}, skipped={len(self.skipped)})"
+
+    def errors(self) -> List[Dict[str, Any]]:
+        """
+        Return the failures in a serialisable form.
+
+        Returns:
+            List[dict]: ``key`` and ``error`` of each failed record, plus the fields of
+                `CreateRequestError.to_dict()` when available.
+        """
+        errors = []
+        for key, error in self.failed.items():
+            entry = {"key": key, "error": str(error)}
+            if hasattr(error, "to_dict"):
+                entry.update(error.to_dict())
+            errors.append(entry)
+        return errors
+
+
+def run_bulk(
+    write: Callable[[Any], Any],
+    records: Iterable[Any],
+    *,
+    key: Optional[Callable[[Any], Any]] = None,
+    max_workers: int = 4,
+    checkpoint: Optional[BulkCheckpoint] = None,
+    retries: int = 0,
+    backoff: float = 1.0,
+) -> BulkResult:
+    """
+    Run a write for every record through a bounded worker pool, collecting errors instead of raising.
+
+    At most ``2 * max_workers`` records are in flight at once, so large inputs can be streamed
+    from a generator without being materialised.
+
+    Args:
+        write (callable): Performs the write for one record and returns the resulting resource.
+        records (Iterable): The records to write.
+        key (callable, optional): Returns the stable key of a record, used as is in the result and
+            as a string in the checkpoint. Defaults to the record's position in ``records``.
+        max_workers (int, optional): Number of writes running concurrently. Default is 4.
+        checkpoint (BulkCheckpoint, optional): Completed keys are skipped and new ones are recorded.
+        retries (int, optional): Number of times a record is written again after a transient failure
+            (see `is_transient`). Each retry repeats the whole write, including the client's own
+            `TransportPolicy` retries, so a request can be sent up to ``(retries + 1) * (max_retries + 1)``
+            times, and methods the policy never retries (POST) are sent again. Default is 0.
+        backoff (float, optional): Delay before the first retry of a record, in seconds, doubled for
+            each further retry. Default is 1.
+
+    Returns:
+        BulkResult: The written resources and the errors, keyed by record key.
+    """
+    result = BulkResult()
+    workers = max(1, max_workers)
+
+    def attempt(record: Any) -> Any:
+        for retry in range(retries + 1):
+            try:
+                return write(record)
+            except Exception as err:
+                if retry >= retries or not is_transient(err):
+                    raise
+            time.sleep(backoff * (2 ** retry))
+
+    def keyed() -> Iterable[Tuple[Any, Any]]:
+        for index, record in enumerate(records):
+            record_key = key(record) if key is not None else index
+            if checkpoint is not None and record_key in checkpoint:
+                result.skipped.append(record_key)
+                continue
+            yield record_key, record
+
+    def collect(record_key: Any, future):
+        try:
+            resource = future.result()
+        except Exception as err:
+            result.failed[record_key] = err
+            return
+        result.succeeded[record_key] = resource
+        if checkpoint is not None:
+            checkpoint.mark(record_key, getattr(resource, "id", None))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Dict[Any, Any] = {}
+        for record_key, record in keyed():
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(pending.pop(future), future)
+            pending[executor.submit(attempt, record)] = record_key
+        for future in list(pending):
+            future_key = pending.pop(future)
+            wait([future])
+            collect(future_key, future)
+
+    return result
+
+
+def is_transient(error: Exception) -> bool:
+    """Return True for failures that may succeed when retried: connection errors, timeouts and 429/5xx gateway responses."""
+    if isinstance(error, HTTPError):
+        return error.response is not None and error.response.status_code in TRANSIENT_STATUSES
+    return isinstance(error, (ConnectionError, Timeout))
+
+
+def update_one(update: Callable[[int, Any], Any]) -> Callable[[Union[Any, Tuple[int, Any]]], Any]:
+    """
+    Adapt a client's ``update_*(id, model)`` method for `run_bulk`.
+
+    The returned function accepts either a wrapped resource, which is saved with its own
+    ``update()``, or an ``(id, model)`` pair passed to ``update``.
+    """
+    def write(record):
+        if isinstance(record, tuple):
+            id, model = record
+            return update(id, model)
+        return record.update()
+    return write
+
+
+def update_key(record: Union[Any, Tuple[int, Any]]) -> int:
+    """Return the ID of a record passed to ``update_many``."""
+    return record[0] if isinstance(record, tuple) else record.id
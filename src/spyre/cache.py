@@ -0,0 +1,197 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+class CacheEntry():
+    """A cached response body with its expiry time and HTTP validators."""
+    __slots__ = ("body", "expires", "etag", "last_modified")
+
+    def __init__(self, body: bytes, expires: float, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.body = body
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires > time.monotonic()
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the ``If-None-Match``/``If-Modified-Since`` headers that revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class ResponseCache():
+    """
+    Thread-safe TTL + LRU cache for Spire GET responses.
+
+    Pass an instance to `SpireClient` (or `Spire`) to cache single-record GETs. Entries are keyed
+    on the endpoint path and query parameters, expire after a TTL that can be set per endpoint,
+    and the least recently used entry is evicted once ``max_entries`` is reached. Any POST, PUT or
+    DELETE sent through the client invalidates the cached entries of the resource path it touches.
+    Paged list queries always go to the server and are never cached.
+
+    When the server sends ``ETag`` or ``Last-Modified`` headers, expired entries are kept and
+    revalidated with a conditional request; a ``304 Not Modified`` answer renews the entry
+    without downloading the record again.
+
+    Example:
+        cache = ResponseCache(ttl=300, endpoint_ttls={"sales/orders": 30, "customers": 0})
+        client = Spire(host, company, username, password, cache=cache)
+        client.inventory.get_item(1101)
+        cache.stats()   # {'hits': 0, 'misses': 1, ...}
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1024, endpoint_ttls: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            ttl (float, optional): Default time to live of an entry, in seconds. Default is 60.
+            max_entries (int, optional): Maximum number of cached responses. Default is 1024.
+            endpoint_ttls (dict, optional): TTL overrides keyed by endpoint prefix (e.g. ``{"inventory/items": 300}``).
+                The longest matching prefix wins, and a TTL of 0 disables caching for that endpoint.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.endpoint_ttls = {prefix.strip("/"): value for prefix, value in (endpoint_ttls or {}).items()}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.revalidations = 0
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(path: str, params: Any = None) -> CacheKey:
+        """Build the cache key of a GET request from its endpoint path and query parameters."""
+        if isinstance(params, dict):
+            params = params.items()
+        return (path.strip("/"), tuple((str(k), str(v)) for k, v in (params or ())))
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL that applies to an endpoint path."""
+        path = path.strip("/")
+        matches = [prefix for prefix in self.endpoint_ttls if _is_path_prefix(prefix, path)]
+        if not matches:
+            return self.ttl
+        return self.endpoint_ttls[max(matches, key=len)]
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Return the decoded JSON of a fresh cached response, or None on a miss.
+
+        A new object is decoded on every hit so callers can never mutate the cached copy.
+        """
+        entry = self.lookup(key)
+        if entry is None or not entry.fresh:
+            return None
+        return entry.json()
+
+    def lookup(self, key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Return the entry stored for a key, even if it has expired, and count the hit or miss.
+
+        Expired entries without validators cannot be revalidated and are dropped. Expired entries
+        with validators are returned so the caller can send a conditional request.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.fresh and not (entry.etag or entry.last_modified):
+                del self._entries[key]
+                entry = None
+            if entry is None or not entry.fresh:
+                self.misses += 1
+                return entry
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: CacheKey, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Store a response body, evicting the least recently used entries if the cache is full."""
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = CacheEntry(body, time.monotonic() + ttl, etag, last_modified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def renew(self, key: CacheKey):
+        """Restart the TTL of an entry after the server confirmed it is unchanged (``304 Not Modified``)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires = time.monotonic() + self.ttl_for(key[0])
+                self._entries.move_to_end(key)
+                self.revalidations += 1
+
+    def invalidate(self, path: str, descendants: bool = True):
+        """
+        Drop every entry related to a resource path.
+
+        This removes the path itself, the resources above it (e.g. ``inventory/items`` and
+        ``inventory/items/5`` for ``inventory/items/5/uoms``) and, unless ``descendants`` is False,
+        its sub-resources (e.g. ``inventory/items/5/uoms`` for ``inventory/items/5``).
+
+        Args:
+            path (str): The endpoint path that was written to.
+            descendants (bool, optional): Also drop sub-resources of the path. POSTs that create a record
+                in a collection pass False so the other records of the collection stay cached.
+        """
+        path = path.strip("/")
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if _is_path_prefix(key[0], path) or (descendants and _is_path_prefix(path, key[0]))
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        """Remove every entry. Counters are left untouched."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``hit_rate``, ``evictions``, ``invalidations``, ``revalidations``
+                and current ``size``.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "revalidations": self.revalidations,
+                "size": len(self._entries),
+            }
+
+
+def _is_path_prefix(prefix: str, path: str) -> bool:
+    """Return True if ``prefix`` is ``path`` or one of its parent paths, compared segment by segment."""
+    return path == prefix or path.startswith(prefix + "/")
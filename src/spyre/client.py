@@ -1,50 +1,335 @@
+import asyncio
+import types
+import httpx
 import requests
-from typing import TypeVar, Optional, Type, Generic, List, Union, Tuple, Dict, Any
-from pydantic import BaseModel
-import json
-from requests.exceptions import HTTPError, ConnectionError, Timeout, RequestException
+from typing import TypeVar, Optional, Type, Generic, List, Union, Tuple, Dict, Any, Iterator, Iterable, get_args, get_origin
+from pydantic import BaseModel, TypeAdapter
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.exceptions import HTTPError, ConnectionError, Timeout
+from .Exceptions import AuthenticationError, CompanyNotFoundError
+from .cache import ResponseCache
+from .mirror import SQLiteMirror
+from .transport import TransportPolicy, RateLimiter, PooledAdapter
+from .utils import diff_payload, compile_projection, project_record
+from .query import Query, as_query
+from .Models.typed_models import decimal_model
 
 T = TypeVar('T', bound=BaseModel)
 
-class SpireClient():    
+class BaseSpireClient():
+    """Behaviour shared by the synchronous and asynchronous Spire clients: URLs, query parameters and paging."""
+
+    # Query parameter that asks the API for a subset of fields; None trims responses client-side only
+    fields_param: Optional[str] = "fields"
+
+    def __init__(self, host, company, max_workers: int = 4):
+        self.company = company
+        self.base_url = f"https://{host}/api/v2/companies/{company}"
+        self.max_workers = max_workers
+
+    def _url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{self._path(endpoint)}"
+
+    def _path(self, endpoint: str) -> str:
+        """Normalise an endpoint to ``a/b/c`` so URLs, cache keys and mirror lookups agree."""
+        return "/".join(part for part in endpoint.split("/") if part)
+
+    def _check_access(self, response):
+        """
+        Raise a dedicated exception when a response shows the credentials or company are wrong.
+
+        Raises:
+            AuthenticationError: If the server answered 401 Unauthorized.
+            CompanyNotFoundError: If the server does not know the client's company.
+        """
+        if response.status_code == 401:
+            raise AuthenticationError(str(response.url), error_message=response.text)
+        if response.status_code == 404 and response.text.startswith("No such company"):
+            raise CompanyNotFoundError(self.company, str(response.url), error_message=response.text)
+
+    def _handle_response(self, response):
+        
+        try:
+            content = response.json()
+        except ValueError:
+            content = response.text
+        return{
+            "status_code": response.status_code,
+            "url": response.url,
+            "content": content,
+            "headers" : response.headers
+        }
+
+    def _build_query_params(
+        self,
+        resource_cls: Type["APIResource[T]"],
+        query: Optional[Union[str, Query]],
+        filter: Optional[Dict[str, Any]],
+        sort: Optional[Dict[str, str]],
+        extra_params: Dict[str, Any],
+        projection: Optional[dict] = None
+    ) -> List[Tuple[str, Any]]:
+        """
+        Build the query parameters shared by every page of a query.
+
+        Parameters are built as a list of tuples to allow repeated keys like 'sort'. The search,
+        filter and sort come from `Query.params`, so a reused `Query` is only validated and
+        encoded once.
+
+        Raises:
+            ValueError: If the filter references fields that are not on the resource model, or unknown operators.
+        """
+        params = as_query(query, filter, sort).params(resource_cls.Model)
+
+        params.extend(self._projection_params(projection))
+
+        # Add any additional custom parameters
+        for k, v in extra_params.items():
+            params.append((k, v))
+
+        return params
+
+    def _projection(self, resource_cls: Type["APIResource[T]"], fields: Optional[Iterable[str]]) -> Optional[dict]:
+        """
+        Validate a field projection against the resource model and compile it with `utils.compile_projection`.
+
+        Raises:
+            ValueError: If a field path does not start with a field of the resource model.
+        """
+        if not fields:
+            return None
+        fields = list(fields)
+        model_fields = resource_cls.Model.model_fields.keys()
+        invalid_fields = [field for field in fields if field.split(".")[0] not in model_fields]
+        if invalid_fields:
+            raise ValueError(f"Invalid projection field(s): {invalid_fields}. for {resource_cls.Model.__name__} ")
+        return compile_projection(fields)
+
+    def _column_projection(self, resource_cls: Type["APIResource[T]"], columns: Optional[List[str]], explode: Optional[str]) -> Optional[dict]:
+        """Return the projection fetching the fields behind a list of flattened columns, keeping the exploded list."""
+        if not columns:
+            return None
+        fields = list(columns)
+        if explode is not None and not any(column.startswith(f"{explode}.") for column in columns):
+            fields.append(explode)
+        return self._projection(resource_cls, fields)
+
+    def _projection_params(self, projection: Optional[dict]) -> List[Tuple[str, Any]]:
+        """Return the query parameter asking the API for the top-level fields of a projection."""
+        if not projection or not self.fields_param:
+            return []
+        return [(self.fields_param, ",".join(["id"] + [field for field in projection if field != "id"]))]
+
+    def _with_projection(self, params: Any, projection: Optional[dict]) -> Any:
+        """Return GET parameters with the field projection parameter added, or unchanged without a projection."""
+        if projection is None:
+            return params
+        return list(_param_items(params)) + self._projection_params(projection)
+
+    def _wrap_records(
+        self,
+        resource_cls: Type["APIResource[T]"],
+        records: Iterable[dict],
+        projection: Optional[dict] = None,
+        lazy: bool = False
+    ) -> List["APIResource[T]"]:
+        """Wrap raw records in resources, trimming them to a projection first when one is given."""
+        if projection is not None:
+            records = (project_record(item, projection) for item in records)
+        return [resource_cls.from_json(item, self, lazy=lazy) for item in records]
+
+    def _id_chunks(self, ids: Iterable[Union[int, str]], chunk_size: int) -> Tuple[List[int], List[List[int]]]:
+        """Return the distinct IDs of a `_get_many` call, and the chunks of its ``$in`` filter queries."""
+        ids = list(dict.fromkeys(int(id) for id in ids))
+        size = max(1, min(chunk_size, 1000))
+        return ids, [ids[i:i + size] for i in range(0, len(ids), size)]
+
+    def _page_params(self, base_params: List[Tuple[str, Any]], start: int, limit: int) -> List[Tuple[str, Any]]:
+        return [("start", start), ("limit", limit)] + base_params
+
+    def _page_offsets(self, start: int, limit: int, page_size: int, count: int, all: bool) -> List[Tuple[int, int]]:
+        """Return the ``(start, limit)`` pair of every page after the first one."""
+        # Without 'all' we stop once the requested 'limit' has been collected
+        end = count if all else min(count, start + limit)
+        return [
+            (offset, min(page_size, end - offset))
+            for offset in range(start + page_size, end, page_size)
+        ]
+
+
+class SpireClient(BaseSpireClient):    
     """A lightweight to interact with the Spire API using requests sessions for connection reuse and authenticated calls."""
     
-    def __init__(self, host, company, username, password,):
+    def __init__(
+        self,
+        host,
+        company,
+        username,
+        password,
+        max_workers: int = 4,
+        cache: Optional[ResponseCache] = None,
+        mirror: Optional[SQLiteMirror] = None,
+        read_from_mirror: bool = False,
+        policy: Optional[TransportPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_connections: int = 10,
+        pool_maxsize: Optional[int] = None,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        thread_local_sessions: bool = False,
+        lazy_models: bool = False,
+    ):
         """
         Initialize a SpireClient instance.
 
+        No request is sent until the client is first used. Call `ping()` to check the
+        credentials up front; otherwise a rejected login raises `AuthenticationError` and an
+        unknown company raises `CompanyNotFoundError` from the first request.
+
         Args:
             host (str): Spire Server host.
             company (str): Spire company.
             username (str): Spire user username.
             password (str): Spire user password.
+            max_workers (int, optional): Maximum number of pages fetched concurrently by `_query`. Default is 4.
+            cache (ResponseCache, optional): Opt-in cache for single-record GET responses. Default is None (no caching).
+            mirror (SQLiteMirror, optional): Local store that every record fetched from a mirrored endpoint is saved to.
+                Default is None (no mirror).
+            read_from_mirror (bool, optional): Answer single-record GETs and filtered queries from the mirror
+                instead of the network. Default is False.
+            policy (TransportPolicy, optional): Timeouts and retry rules. Defaults to `TransportPolicy()`
+                (5s connect / 60s read timeouts, 3 retries of idempotent requests).
+            rate_limiter (RateLimiter, optional): Token bucket every request waits on. Default is None (no limit).
+            pool_connections (int, optional): Number of per-host connection pools to keep. Default is 10.
+            pool_maxsize (int, optional): Maximum number of connections kept per host. Defaults to
+                ``max(10, max_workers)`` so concurrent page fetches never wait for a connection.
+            pool_block (bool, optional): Wait for a free connection instead of opening a throwaway one
+                when the pool is exhausted. Default is False.
+            keep_alive (bool, optional): Reuse connections between requests. Set to False to close each
+                connection after its response. Default is True.
+            ssl_context (ssl.SSLContext, optional): TLS context shared by every pooled connection, e.g. to pin
+                certificates or TLS versions. Default is None (the requests default).
+            thread_local_sessions (bool, optional): Give every thread its own `requests.Session` while all of
+                them share one connection pool, so many worker threads can use a single client safely.
+                Default is False (one session shared by all threads).
+            lazy_models (bool, optional): Wrap query results without validating them until a field is read
+                (see `APIResource.from_json`). Can be overridden per query with ``lazy``. Default is False.
         """
-        self.session = requests.Session()
-        self.session.auth = (username, password)
-        self.session.headers.update({
+        super().__init__(host, company, max_workers=max_workers)
+        self.thread_local_sessions = thread_local_sessions
+        self.lazy_models = lazy_models
+        self._auth = (username, password)
+        self._headers = {
             "accept": "application/json",
             "content-type": "application/json"
-        })
-        self.base_url = f"https://{host}/api/v2/companies/{company}"
+        }
+        if not keep_alive:
+            self._headers["connection"] = "close"
+        # A single adapter (and so a single urllib3 pool) is mounted on every session
+        self._adapter = PooledAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize if pool_maxsize is not None else max(10, max_workers),
+            pool_block=pool_block,
+            ssl_context=ssl_context,
+        )
+        self._local = threading.local()
+        self._session = None if thread_local_sessions else self._new_session()
+        self.cache = cache
+        self.mirror = mirror
+        self.read_from_mirror = read_from_mirror
+        self.policy = policy if policy is not None else TransportPolicy()
+        self.rate_limiter = rate_limiter
+
+    @property
+    def session(self) -> requests.Session:
+        """The `requests.Session` used by the calling thread."""
+        if not self.thread_local_sessions:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.auth = self._auth
+        session.headers.update(self._headers)
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def close(self):
+        """Close the connection pool. Sessions created for other threads stop working as well."""
+        if self._session is not None:
+            self._session.close()
+        self._adapter.close()
+
+    def __enter__(self) -> "SpireClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the client's transport policy and rate limiter.
+
+        Connection errors, timeouts and retryable status codes are retried with backoff
+        according to `TransportPolicy`. The last response is returned, or the last error is
+        raised, once the retries are used up.
 
-        try: 
-            response = self.session.get(self.base_url)
-            if response.text == 'No such company intertes':
-                raise ValueError(f"No company entries for {company}")
-            if response.text == 'Unauthorized':
-                raise ValueError(f"Invalid Authorization")
+        Args:
+            method (str): The HTTP method.
+            url (str): The full request URL.
+            **kwargs: Passed to `requests.Session.request` (params, json, headers...).
 
-        except ConnectionError as conn_err:
-            print(f"Connection error occurred for : {conn_err}")
+        Returns:
+            requests.Response: The server's response.
+        """
+        policy = self.policy
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.request(method, url, timeout=policy.timeout, **kwargs)
+            except (ConnectionError, Timeout) as err:
+                if not policy.should_retry(method, attempt, error=err):
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                if not policy.should_retry(method, attempt, status_code=response.status_code):
+                    return response
+                delay = policy.backoff(attempt, response.headers.get("Retry-After"))
+                response.close()
+            attempt += 1
+            time.sleep(delay)
 
-        except Timeout as timeout_err:
-            print(f"Request timed out: {timeout_err}")
+    def ping(self) -> bool:
+        """
+        Check the connection, credentials and company with a single request.
 
-        except RequestException as req_err:
-            print(f"General error occurred: {req_err}")
+        The client does not contact the server when it is created; without a ping,
+        bad credentials surface on the first real request instead.
 
+        Returns:
+            bool: True if the server accepted the credentials and knows the company.
 
-    def _get(self, endpoint, params=None):
+        Raises:
+            AuthenticationError: If the credentials are rejected.
+            CompanyNotFoundError: If the company does not exist on the server.
+            requests.exceptions.RequestException: If the server cannot be reached or answers with another error.
+        """
+        response = self._request("GET", self.base_url)
+        self._check_access(response)
+        response.raise_for_status()
+        return True
+
+    def _get(self, endpoint, params=None, use_cache: bool = True, revalidate: bool = False, fields: Optional[Iterable[str]] = None):
 
         """
         Send a GET request to the Spire API.
@@ -54,10 +339,24 @@ class SpireClient():
         the parsed JSON response. Raises an HTTPError if the response contains
         an unsuccessful status code.
 
+        When the client has a `ResponseCache`, fresh cached responses are returned
+        without a round trip and successful responses are stored in the cache.
+        Expired entries that carry an ETag or Last-Modified validator are revalidated
+        with a conditional request, and a 304 answer reuses the cached body.
+
+        When the client has a `SQLiteMirror`, fetched records are saved to it, and with
+        ``read_from_mirror`` enabled, full records already in the mirror are returned locally.
+        Projected requests (``fields``) are trimmed from full mirror records but never saved to the mirror.
+
         Args:
             endpoint (str): The relative API endpoint (e.g., 'inventory/items/123').
             params (dict, optional): A dictionary of query parameters to include
                 in the request (e.g., {'status': 'active'}). Defaults to None.
+            use_cache (bool, optional): Set to False to bypass the response cache. Defaults to True.
+            revalidate (bool, optional): Ignore the freshness of a cached response and the mirror, and always
+                ask the server, conditionally when validators are available. Defaults to False.
+            fields (Iterable[str], optional): Only return these fields of the record. Dotted paths select
+                nested fields (see `utils.compile_projection`). Defaults to the full record.
 
         Returns:
             dict: The JSON-decoded response from the API.
@@ -65,10 +364,46 @@ class SpireClient():
         Raises:
             requests.exceptions.HTTPError: If the response contains an HTTP error status.
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.get(url , params=params)
-        response.raise_for_status()
-        return response.json()
+        endpoint = self._path(endpoint)
+        projection = compile_projection(fields) if fields else None
+        projected = projection is not None or any(key == self.fields_param for key, _ in _param_items(params))
+
+        if use_cache and not revalidate and self._reads_mirror() and not params:
+            mirror_endpoint, id = self.mirror.match(endpoint)
+            if id is not None:
+                record = self.mirror.get(mirror_endpoint, id)
+                if record is not None:
+                    return project_record(record, projection) if projection is not None else record
+
+        params = self._with_projection(params, projection)
+
+        cache = self.cache if use_cache else None
+        entry = None
+        headers = None
+        if cache is not None:
+            key = cache.make_key(endpoint, params)
+            entry = cache.lookup(key)
+            if entry is not None:
+                if entry.fresh and not revalidate:
+                    content = entry.json()
+                    return project_record(content, projection) if projection is not None else content
+                headers = entry.conditional_headers()
+
+        url = self._url(endpoint)
+        response = self._request("GET", url, params=params, headers=headers)
+        self._check_access(response)
+        if response.status_code == 304 and entry is not None:
+            cache.renew(key)
+            content = entry.json()
+        else:
+            response.raise_for_status()
+            if cache is not None:
+                cache.set(key, response.content, etag=response.headers.get("ETag"), last_modified=response.headers.get("Last-Modified"))
+            content = response.json()
+        # Partial records would overwrite complete ones in the mirror
+        if not projected:
+            self._save_to_mirror(endpoint, content)
+        return project_record(content, projection) if projection is not None else content
 
     def _post(self, endpoint, data=None, json=None):
         """
@@ -85,9 +420,12 @@ class SpireClient():
         Raises:
             requests.exceptions.HTTPError: If the response contains an HTTP error status.
         """
+        endpoint = self._path(endpoint)
         
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.post(url, data=data, json=json)
+        url = self._url(endpoint)
+        response = self._request("POST", url, data=data, json=json)
+        self._check_access(response)
+        self._invalidate(endpoint, descendants=False)
         response.raise_for_status()
         return self._handle_response(response)
 
@@ -106,10 +444,15 @@ class SpireClient():
         Raises:
             requests.exceptions.HTTPError: If the response contains an HTTP error status.
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.put(url, data=data, json=json)
+        endpoint = self._path(endpoint)
+        url = self._url(endpoint)
+        response = self._request("PUT", url, data=data, json=json)
+        self._check_access(response)
+        self._invalidate(endpoint)
         response.raise_for_status()
-        return response.json()
+        content = response.json()
+        self._save_to_mirror(endpoint, content)
+        return content
 
     def _delete(self, endpoint):
         """
@@ -121,23 +464,69 @@ class SpireClient():
         Returns:
             bool: True if the deletion was successful (status code 200, 202, or 204), False otherwise.
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        response = self.session.delete(url)
-        return response.status_code in (200, 202, 204)
-    
-    def _handle_response(self, response):
-        
-        try:
-            content = response.json()
-        except ValueError:
-            content = response.text
-        return{
-            "status_code": response.status_code,
-            "url": response.url,
-            "content": content,
-            "headers" : response.headers
-        }
+        endpoint = self._path(endpoint)
+        url = self._url(endpoint)
+        response = self._request("DELETE", url)
+        self._check_access(response)
+        self._invalidate(endpoint)
+        deleted = response.status_code in (200, 202, 204)
+        if deleted and self.mirror is not None:
+            mirror_endpoint, id = self.mirror.match(endpoint)
+            if id is not None:
+                self.mirror.delete(mirror_endpoint, [id])
+        return deleted
+
+    def _invalidate(self, endpoint, descendants: bool = True):
+        """Drop cached responses related to a resource path after a write."""
+        if self.cache is not None:
+            self.cache.invalidate(endpoint, descendants=descendants)
+
+    def _reads_mirror(self) -> bool:
+        return self.mirror is not None and self.read_from_mirror
+
+    def _save_to_mirror(self, endpoint, content):
+        """Save a record, or the records of a list page, fetched from a mirrored endpoint."""
+        if self.mirror is None or not isinstance(content, dict):
+            return
+        mirror_endpoint, id = self.mirror.match(endpoint)
+        if mirror_endpoint is None:
+            return
+        if id is None:
+            self.mirror.save(mirror_endpoint, content.get("records", []))
+        else:
+            self.mirror.save(mirror_endpoint, [content], complete=True)
 
+    def _query_mirror(
+        self,
+        endpoint: str,
+        resource_cls: Type["APIResource[T]"],
+        all: bool,
+        limit: int,
+        start: int,
+        query: Optional[Union[str, Query]],
+        filter: Optional[Dict[str, Any]],
+        sort: Optional[Dict[str, str]],
+        extra_params: Dict[str, Any],
+        lazy: bool = False,
+        projection: Optional[dict] = None
+    ) -> Optional[List["APIResource[T]"]]:
+        """Answer a query from the mirror, or return None if it has to go to the server."""
+        # Free-text search and custom parameters are only understood by the server
+        if not self._reads_mirror() or extra_params:
+            return None
+        compiled = as_query(query, filter, sort)
+        if compiled.search:
+            return None
+        # Validate the filter exactly as a server query would
+        compiled.params(resource_cls.Model)
+        result = self.mirror.query(endpoint, filter=compiled.filter, sort=compiled.sort, limit=None if all else limit, start=start)
+        if result is None:
+            return None
+        records, _ = result
+        if projection is not None:
+            records = [project_record(item, projection) for item in records]
+        return [resource_cls.from_json(item, self, lazy=lazy) for item in records]
+    
     def _query(
         self,
         endpoint: str,
@@ -146,84 +535,696 @@ class SpireClient():
         all: bool = False,
         limit: int = 1000,
         start: int = 0,
-        query: Optional[str] = None,
+        query: Optional[Union[str, Query]] = None,
         filter: Optional[Dict[str, Any]] = None,
         sort: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+        use_mirror: bool = True,
+        lazy: Optional[bool] = None,
+        fields: Optional[Iterable[str]] = None,
         **extra_params
     ) -> List["APIResource[T]"]:
         """
         Query a list of resources from a Spire API endpoint with support for
         pagination, searching, filtering, and multi-level sorting.
 
+        The first page is always fetched on its own so the total ``count`` is known.
+        The remaining ``start`` offsets are then fetched concurrently by a bounded
+        worker pool, and the results are returned in offset order.
+
+        With ``read_from_mirror`` enabled, queries without free-text search are answered
+        from the client's `SQLiteMirror` when it can evaluate the filter.
+
         Args:
             endpoint (str): The API endpoint (e.g., 'sales/orders').
             resource_cls (Type[APIResource[T]]): The resource wrapper class (e.g., SalesOrderResource).
             all (bool, optional): If True, fetches all available pages of results.
             limit (int, optional): Number of results per page (max 1000). Default is 1000.
             start (int, optional): Starting offset for pagination. Default is 0.
-            q (str, optional): Free-text search query.
+            query (str | Query, optional): Free-text search query, or a compiled `Query` carrying the search,
+                filter and sort (in which case ``filter`` and ``sort`` must be omitted).
             filter (dict, optional): Dictionary of filter criteria, which will be JSON-encoded.
             sort (dict, optional): Dictionary of sorting rules (e.g., {"orderDate": "desc", "orderNo": "asc"}).
+            max_workers (int, optional): Number of pages fetched concurrently after the first one.
+                Defaults to the client's ``max_workers``. Use 1 to fetch pages sequentially.
+            use_mirror (bool, optional): Set to False to always query the server, even when reading from the mirror.
+            lazy (bool, optional): Defer validation of each record until it is read. Defaults to the client's ``lazy_models``.
+            fields (Iterable[str], optional): Only return these fields of each record, as partial models. Dotted
+                paths select nested fields (e.g. ``["orderNo", "total", "customer.customerNo"]``). The top-level
+                fields are sent to the API in the ``fields`` parameter, and records are trimmed before validation.
             **extra_params: Any additional query parameters to pass to the API.
 
         Returns:
             List[APIResource[T]]: A list of wrapped resource instances.
         """
-        collected = []
-        current_start = start
-        remaining = limit
-        while True:
+        endpoint = endpoint.rstrip("/")
+        lazy = self.lazy_models if lazy is None else lazy
+        projection = self._projection(resource_cls, fields)
+        if use_mirror:
+            mirrored = self._query_mirror(endpoint, resource_cls, all, limit, start, query, filter, sort, extra_params, lazy, projection)
+            if mirrored is not None:
+                return mirrored
+
+        base_params = self._build_query_params(resource_cls, query, filter, sort, extra_params, projection)
+        page_size = min(limit, 1000)
+
+        response = self._get(endpoint, params=self._page_params(base_params, start, page_size), use_cache=False)
+        first_page = response.get("records", [])
+        count = response.get("count", 0)
+
+        pages = [first_page]
+        if first_page:
+            offsets = self._page_offsets(start, limit, page_size, count, all)
+            pages.extend(self._fetch_pages(endpoint, base_params, offsets, max_workers))
+
+        if self.mirror is not None and all and start == 0 and not base_params:
+            # An unfiltered 'all' query has saved every record of the endpoint
+            self.mirror.mark_loaded(endpoint)
+
+        return self._wrap_records(resource_cls, (item for page in pages for item in page), projection, lazy)
+
+    def _fetch_pages(
+        self,
+        endpoint: str,
+        base_params: List[Tuple[str, Any]],
+        offsets: List[Tuple[int, int]],
+        max_workers: Optional[int] = None
+    ) -> List[List[dict]]:
+        """
+        Fetch the records of several pages, returned in the same order as ``offsets``.
+
+        Args:
+            endpoint (str): The API endpoint.
+            base_params (list): Query parameters shared by every page.
+            offsets (list): ``(start, limit)`` pairs, one per page.
+            max_workers (int, optional): Size of the worker pool. Defaults to the client's ``max_workers``.
+
+        Returns:
+            List[List[dict]]: The raw records of each page.
+        """
+        workers = min(max_workers or self.max_workers, len(offsets))
+
+        def fetch(offset: Tuple[int, int]) -> List[dict]:
+            response = self._get(endpoint, params=self._page_params(base_params, *offset), use_cache=False)
+            return response.get("records", [])
+
+        if workers <= 1:
+            pages = []
+            for offset in offsets:
+                records = fetch(offset)
+                # Exit if there are no more items available
+                if not records:
+                    break
+                pages.append(records)
+            return pages
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, offsets))
+
+    def _get_many(
+        self,
+        endpoint: str,
+        resource_cls: Type["APIResource[T]"],
+        ids: Iterable[Union[int, str]],
+        *,
+        chunk_size: int = 100,
+        detail: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Dict[int, "APIResource[T]"]:
+        """
+        Retrieve many resources by ID with as few round trips as possible.
+
+        IDs are chunked into ``{"id": {"$in": [...]}}`` filter queries that run concurrently.
+        IDs that the filter queries do not return are retried with single GETs in parallel,
+        and IDs that still cannot be found are left out of the result.
+
+        Args:
+            endpoint (str): The API endpoint (e.g., 'sales/orders').
+            resource_cls (Type[APIResource[T]]): The resource wrapper class.
+            ids (Iterable[int | str]): The IDs to retrieve. Duplicates are ignored.
+            chunk_size (int, optional): Number of IDs per filter query (max 1000). Default is 100.
+            detail (bool, optional): If True, skip the filter queries and GET every record individually.
+                List records can omit details such as line items; single GETs return the full record.
+            max_workers (int, optional): Number of requests in flight at once. Defaults to the client's ``max_workers``.
+
+        Returns:
+            Dict[int, APIResource[T]]: The wrapped resources keyed by ID, in the order the IDs were given.
+        """
+        endpoint = endpoint.rstrip("/")
+        ids, chunks = self._id_chunks(ids, chunk_size)
+        workers = max(1, max_workers or self.max_workers)
+        found: Dict[int, APIResource[T]] = {}
+
+        def query_chunk(chunk: List[int]) -> List["APIResource[T]"]:
+            return self._query(endpoint, resource_cls, filter={"id": {"$in": chunk}}, limit=len(chunk), max_workers=1)
+
+        def get_one(id: int) -> Optional["APIResource[T]"]:
+            try:
+                return resource_cls.from_json(self._get(f"{endpoint}/{id}"), self)
+            except HTTPError as http_err:
+                if http_err.response is not None and http_err.response.status_code == 404:
+                    return None
+                raise
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if not detail:
+                for resources in executor.map(query_chunk, chunks):
+                    for resource in resources:
+                        found[resource.id] = resource
+
+            missing = [id for id in ids if id not in found]
+            for resource in executor.map(get_one, missing):
+                if resource is not None:
+                    found[resource.id] = resource
+
+        return {id: found[id] for id in ids if id in found}
+
+    def _iter_query(
+        self,
+        endpoint: str,
+        resource_cls: Type["APIResource[T]"],
+        *,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        query: Optional[Union[str, Query]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, str]] = None,
+        prefetch: bool = True,
+        lazy: Optional[bool] = None,
+        fields: Optional[Iterable[str]] = None,
+        **extra_params
+    ) -> Iterator["APIResource[T]"]:
+        """
+        Stream resources from a Spire API endpoint page by page.
+
+        Accepts the same arguments as `_query`, but yields wrapped resources as each
+        page arrives instead of collecting every page first, so at most one or two
+        pages are held in memory at a time.
+
+        Args:
+            endpoint (str): The API endpoint (e.g., 'sales/orders').
+            resource_cls (Type[APIResource[T]]): The resource wrapper class.
+            all (bool, optional): If True, streams all available pages of results.
+            limit (int, optional): Number of results per page (max 1000). Default is 1000.
+            start (int, optional): Starting offset for pagination. Default is 0.
+            query (str | Query, optional): Free-text search query, or a compiled `Query` (see `_query`).
+            filter (dict, optional): Dictionary of filter criteria, which will be JSON-encoded.
+            sort (dict, optional): Dictionary of sorting rules.
+            prefetch (bool, optional): If True, the next page is fetched in the background
+                while the caller processes the current one. Default is True.
+            lazy (bool, optional): Defer validation of each record until it is read. Defaults to the client's ``lazy_models``.
+            fields (Iterable[str], optional): Only return these fields of each record (see `_query`).
+            **extra_params: Any additional query parameters to pass to the API.
+
+        Yields:
+            APIResource[T]: Wrapped resource instances in offset order.
+        """
+        lazy = self.lazy_models if lazy is None else lazy
+        projection = self._projection(resource_cls, fields)
+        mirrored = self._query_mirror(endpoint.rstrip("/"), resource_cls, all, limit, start, query, filter, sort, extra_params, lazy, projection)
+        if mirrored is not None:
+            yield from mirrored
+            return
+
+        base_params = self._build_query_params(resource_cls, query, filter, sort, extra_params, projection)
+        for page in self._iter_pages(endpoint, base_params, all=all, limit=limit, start=start, prefetch=prefetch):
+            for item in page:
+                if projection is not None:
+                    item = project_record(item, projection)
+                yield resource_cls.from_json(item, self, lazy=lazy)
+
+    def _select_ids(
+        self,
+        endpoint: str,
+        resource_cls: Type["APIResource[T]"],
+        ids: Optional[Iterable[Union[int, str]]],
+        query: Optional[Union[str, Query]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[int]:
+        """
+        Return the IDs a bulk operation acts on: the IDs given, or those of every record matching a query or filter.
+
+        Matching records are fetched with an ``id`` projection, and every ID is collected before the
+        operation starts, so records leaving the query as they change cannot shift the pages.
+
+        Raises:
+            ValueError: If neither ids nor a query or filter is provided.
+        """
+        if ids is not None:
+            return list(dict.fromkeys(int(id) for id in ids))
+        if query is None and filter is None:
+            raise ValueError("Either 'ids' or a 'query' or 'filter' must be provided.")
+        records = self._iter_query(endpoint, resource_cls, all=True, query=query, filter=filter, fields=["id"])
+        return list(dict.fromkeys(record.id for record in records))
+
+    def _query_frame(
+        self,
+        endpoint: str,
+        resource_cls: Type["APIResource[T]"],
+        *,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        query: Optional[Union[str, Query]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, str]] = None,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+        prefetch: bool = True,
+        **extra_params
+    ):
+        """
+        Query a Spire API endpoint into a pandas DataFrame, built page by page from the raw JSON.
+
+        Records are never validated into models or wrapped: each page is turned into a columnar
+        frame as it arrives (see `frames.records_frame`) and released, so only the frames and one
+        or two raw pages are held in memory. When ``columns`` are given, only their top-level
+        fields are requested from the API.
+
+        Args:
+            endpoint (str): The API endpoint (e.g., 'sales/invoices').
+            resource_cls (Type[APIResource[T]]): The resource wrapper class, used to validate filters and columns.
+            all, limit, start, query, filter, sort: See `_query`.
+            columns (List[str], optional): Dotted column paths to keep (e.g. ``["invoiceNo", "customer.customerNo",
+                "items.unitPrice"]``). Defaults to every field.
+            explode (str, optional): A list field turned into one row per element, such as ``"items"`` for line-level extracts.
+            dtype_backend (str, optional): Passed to ``DataFrame.convert_dtypes`` (e.g. ``"pyarrow"``). Default keeps NumPy dtypes.
+            prefetch (bool, optional): Fetch the next page while the current one is converted. Default is True.
+            **extra_params: Any additional query parameters to pass to the API.
+
+        Returns:
+            pandas.DataFrame: One row per record, or per exploded element.
+        """
+        # pandas is only imported when a DataFrame is requested
+        from .frames import concat_frames, records_frame
+
+        projection = self._column_projection(resource_cls, columns, explode)
+        base_params = self._build_query_params(resource_cls, query, filter, sort, extra_params, projection)
+        frames = [
+            records_frame(page, columns=columns, explode=explode)
+            for page in self._iter_pages(endpoint, base_params, all=all, limit=limit, start=start, prefetch=prefetch)
+        ]
+        return concat_frames(frames, columns=columns, dtype_backend=dtype_backend)
+
+    def _export(
+        self,
+        endpoint: str,
+        resource_cls: Type["APIResource[T]"],
+        path: str,
+        *,
+        format: Optional[str] = None,
+        all: bool = True,
+        limit: int = 1000,
+        start: int = 0,
+        query: Optional[Union[str, Query]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, str]] = None,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        prefetch: bool = True,
+        **extra_params
+    ) -> int:
+        """
+        Export the results of a query to a CSV, Excel or Parquet file in constant memory.
+
+        Pages are streamed from `_iter_pages` into `export.export_pages`, which writes and releases
+        each page before the next one is needed. When ``columns`` are given, only their top-level
+        fields are requested from the API.
+
+        Args:
+            endpoint (str): The API endpoint (e.g., 'sales/invoices').
+            resource_cls (Type[APIResource[T]]): The resource wrapper class, used to validate filters and columns.
+            path (str): The file to write.
+            format (str, optional): "csv", "xlsx" or "parquet". Defaults to the extension of ``path``.
+            all (bool, optional): If True, exports every page of results. Default is True.
+            limit, start, query, filter, sort: See `_query`.
+            columns (List[str], optional): Dotted column paths to export. Defaults to the fields of the first page.
+            explode (str, optional): A list field written as one row per element, such as ``"items"``.
+            prefetch (bool, optional): Fetch the next page while the current one is written. Default is True.
+            **extra_params: Any additional query parameters to pass to the API.
+
+        Returns:
+            int: The number of rows written.
+        """
+        from .export import export_format, export_pages
+
+        # Reject unsupported formats before any request is sent
+        export_format(path, format)
+        projection = self._column_projection(resource_cls, columns, explode)
+        base_params = self._build_query_params(resource_cls, query, filter, sort, extra_params, projection)
+        pages = self._iter_pages(endpoint, base_params, all=all, limit=limit, start=start, prefetch=prefetch)
+        return export_pages(pages, path, format=format, columns=columns, explode=explode)
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        base_params: List[Tuple[str, Any]],
+        *,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        prefetch: bool = True
+    ) -> Iterator[List[dict]]:
+        """
+        Yield the raw records of each page of a query, in offset order.
+
+        Args:
+            endpoint (str): The API endpoint.
+            base_params (list): Query parameters shared by every page.
+            all (bool, optional): If True, yields all available pages.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            prefetch (bool, optional): If True, fetches the next page while the current one is being consumed.
+
+        Yields:
+            List[dict]: The raw records of a page.
+        """
+        endpoint = endpoint.rstrip("/")
+        page_size = min(limit, 1000)
+
+        def fetch(offset: Tuple[int, int]) -> List[dict]:
+            response = self._get(endpoint, params=self._page_params(base_params, *offset), use_cache=False)
+            return response.get("records", [])
+
+        response = self._get(endpoint, params=self._page_params(base_params, start, page_size), use_cache=False)
+        records = response.get("records", [])
+        offsets = iter(self._page_offsets(start, limit, page_size, response.get("count", 0), all))
 
-            current_limit = min(remaining, 1000)
-            # Build the query params as a list of tuples to allow repeated keys like 'sort'
-            params: List[Tuple[str, Any]] = [
-                ("start", current_start),
-                ("limit", current_limit)
-            ]
-
-            if query:
-                params.append(("q", query))
-                
-            if filter:
-                model_fields = resource_cls.Model.model_fields.keys()
-                invalid_fields = [key for key in filter.keys() if key not in model_fields]
-                if invalid_fields:
-                    raise ValueError(f"Invalid filter field(s): {invalid_fields}. for {resource_cls.Model.__name__} ")
-
-                encoded_filter = json.dumps(filter)
-                params.append(("filter", encoded_filter))
-
-            if sort:
-                for field, direction in sort.items():
-                    prefix = "-" if direction.lower() == "desc" else ""
-                    params.append(("sort", f"{prefix}{field}"))
-
-            # Add any additional custom parameters
-            for k, v in extra_params.items():
-                params.append((k, v))
-
-            response = self._get(endpoint.rstrip("/"), params=params)
-            items = response.get("records", [])
-            count = response.get("count", 0)
-
-            for item in items:
-                collected.append(resource_cls.from_json(item, self))
-
-            # Exit if:
-            # - 'all' is False and we reached the requested 'limit'
-            # - no more items are returned
-            if not all:
-                remaining -= len(items)
-                if remaining <= 0 or len(items) == 0:
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            while records:
+                next_offset = next(offsets, None)
+                pending = executor.submit(fetch, next_offset) if executor and next_offset else None
+                yield records
+                # Drop our reference so the consumed page can be freed before the next one arrives
+                records = None
+                if next_offset is None:
                     break
+                records = pending.result() if pending else fetch(next_offset)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+class AsyncSpireClient(BaseSpireClient):
+    """An asyncio client for the Spire API built on a shared `httpx.AsyncClient` connection pool."""
+
+    def __init__(
+        self,
+        host,
+        company,
+        username,
+        password,
+        max_workers: int = 4,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        timeout: float = 30.0,
+        policy: Optional[TransportPolicy] = None,
+        lazy_models: bool = False,
+    ):
+        """
+        Initialize an AsyncSpireClient instance.
+
+        No request is sent until the first coroutine is awaited. Close the client with
+        `aclose()` or use it as an async context manager.
+
+        Args:
+            host (str): Spire Server host.
+            company (str): Spire company.
+            username (str): Spire user username.
+            password (str): Spire user password.
+            max_workers (int, optional): Maximum number of pages fetched concurrently by `_query`. Default is 4.
+            http2 (bool, optional): Enable HTTP/2 (requires the ``h2`` package, e.g. ``httpx[http2]``). Default is False.
+            max_connections (int, optional): Maximum number of open connections in the pool. Default is 100.
+            max_keepalive_connections (int, optional): Maximum number of idle connections kept alive. Default is 20.
+            keepalive_expiry (float, optional): Seconds an idle connection is kept alive. Default is 5.0.
+            timeout (float, optional): Request timeout in seconds, used when no ``policy`` is given. Default is 30.0.
+            policy (TransportPolicy, optional): Timeouts and retry rules, shared with `SpireClient`. Defaults to
+                `TransportPolicy` with ``timeout`` as both the connect and read timeout.
+            lazy_models (bool, optional): Wrap query results without validating them until a field is read
+                (see `APIResource.from_json`). Can be overridden per query with ``lazy``. Default is False.
+        """
+        super().__init__(host, company, max_workers=max_workers)
+        self.lazy_models = lazy_models
+        self.policy = policy if policy is not None else TransportPolicy(connect_timeout=timeout, read_timeout=timeout)
+        self.session = httpx.AsyncClient(
+            auth=(username, password),
+            headers={
+                "accept": "application/json",
+                "content-type": "application/json"
+            },
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(self.policy.read_timeout, connect=self.policy.connect_timeout),
+        )
+
+    async def __aenter__(self) -> "AsyncSpireClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the client's transport policy, as `SpireClient._request` does.
+
+        Connection errors, timeouts and retryable status codes are retried with backoff
+        according to `TransportPolicy`, waiting with ``asyncio.sleep`` so other tasks keep running.
+
+        Returns:
+            httpx.Response: The server's response.
+        """
+        policy = self.policy
+        attempt = 0
+        while True:
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except httpx.TransportError as err:
+                if not policy.should_retry(method, attempt, error=err):
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                if not policy.should_retry(method, attempt, status_code=response.status_code):
+                    return response
+                delay = policy.backoff(attempt, response.headers.get("Retry-After"))
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def ping(self) -> bool:
+        """
+        Check the connection, credentials and company with a single request.
 
-            # Exit if there are no more items available
-            if (current_start + current_limit) >= count or len(items) == 0:
-                break
+        Returns:
+            bool: True if the server accepted the credentials and knows the company.
+
+        Raises:
+            AuthenticationError: If the credentials are rejected.
+            CompanyNotFoundError: If the company does not exist on the server.
+            httpx.HTTPError: If the server cannot be reached or answers with another error.
+        """
+        response = await self._request("GET", self.base_url)
+        self._check_access(response)
+        response.raise_for_status()
+        return True
+
+    async def _get(self, endpoint, params=None, fields: Optional[Iterable[str]] = None):
+        """
+        Send a GET request to the Spire API.
+
+        Args:
+            endpoint (str): The relative API endpoint (e.g., 'inventory/items/123').
+            params (dict, optional): Query parameters to include in the request. Defaults to None.
+            fields (Iterable[str], optional): Only return these fields of the record (see `SpireClient._get`).
+
+        Returns:
+            dict: The JSON-decoded response from the API.
+
+        Raises:
+            httpx.HTTPStatusError: If the response contains an HTTP error status.
+        """
+        projection = compile_projection(fields) if fields else None
+        response = await self._request("GET", self._url(endpoint), params=self._with_projection(params, projection))
+        self._check_access(response)
+        response.raise_for_status()
+        content = response.json()
+        return project_record(content, projection) if projection is not None else content
+
+    async def _post(self, endpoint, data=None, json=None):
+        """
+        Send a POST request to the Spire API.
+
+        Args:
+            endpoint (str): The relative API endpoint (e.g., 'sales/orders').
+            data (dict, optional): Data to send in the body of the request.
+            json (dict, optional): JSON data to send in the body of the request.
 
-            current_start += current_limit
+        Returns:
+            dict: A dictionary containing the response status code, URL, content, and headers.
+
+        Raises:
+            httpx.HTTPStatusError: If the response contains an HTTP error status.
+        """
+        response = await self._request("POST", self._url(endpoint), data=data, json=json)
+        self._check_access(response)
+        response.raise_for_status()
+        return self._handle_response(response)
+
+    async def _put(self, endpoint, data=None, json=None):
+        """
+        Send a PUT request to the Spire API.
+
+        Args:
+            endpoint (str): The relative API endpoint (e.g., 'inventory/items/123').
+            data (dict, optional): Data to send in the body of the request.
+            json (dict, optional): JSON data to send in the body of the request.
 
-        return collected
+        Returns:
+            dict: The JSON-decoded response from the API.
+
+        Raises:
+            httpx.HTTPStatusError: If the response contains an HTTP error status.
+        """
+        response = await self._request("PUT", self._url(endpoint), data=data, json=json)
+        self._check_access(response)
+        response.raise_for_status()
+        return response.json()
+
+    async def _delete(self, endpoint):
+        """
+        Send a DELETE request to the Spire API.
+
+        Args:
+            endpoint (str): The relative API endpoint to delete (e.g., 'inventory/items/123').
+
+        Returns:
+            bool: True if the deletion was successful (status code 200, 202, or 204), False otherwise.
+        """
+        response = await self._request("DELETE", self._url(endpoint))
+        self._check_access(response)
+        return response.status_code in (200, 202, 204)
+
+    async def _query(
+        self,
+        endpoint: str,
+        resource_cls: Type["APIResource[T]"],
+        *,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        query: Optional[Union[str, Query]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+        lazy: Optional[bool] = None,
+        fields: Optional[Iterable[str]] = None,
+        **extra_params
+    ) -> List["APIResource[T]"]:
+        """
+        Query a list of resources from a Spire API endpoint.
+
+        Behaves like `SpireClient._query`, and builds its parameters with the same code: once the
+        first page reveals ``count``, the remaining pages are awaited concurrently (at most
+        ``max_workers`` at a time) and the results are returned in offset order.
+
+        Args:
+            endpoint (str): The API endpoint (e.g., 'sales/orders').
+            resource_cls (Type[APIResource[T]]): The resource wrapper class.
+            all (bool, optional): If True, fetches all available pages of results.
+            limit (int, optional): Number of results per page (max 1000). Default is 1000.
+            start (int, optional): Starting offset for pagination. Default is 0.
+            query (str | Query, optional): Free-text search query, or a compiled `Query` (see `SpireClient._query`).
+            filter (dict, optional): Dictionary of filter criteria, which will be JSON-encoded.
+            sort (dict, optional): Dictionary of sorting rules.
+            max_workers (int, optional): Number of pages in flight at once. Defaults to the client's ``max_workers``.
+            lazy (bool, optional): Defer validation of each record until it is read. Defaults to the client's ``lazy_models``.
+            fields (Iterable[str], optional): Only return these fields of each record (see `SpireClient._query`).
+            **extra_params: Any additional query parameters to pass to the API.
+
+        Returns:
+            List[APIResource[T]]: A list of wrapped resource instances.
+        """
+        endpoint = endpoint.rstrip("/")
+        lazy = self.lazy_models if lazy is None else lazy
+        projection = self._projection(resource_cls, fields)
+        base_params = self._build_query_params(resource_cls, query, filter, sort, extra_params, projection)
+        page_size = min(limit, 1000)
+
+        response = await self._get(endpoint, params=self._page_params(base_params, start, page_size))
+        pages = [response.get("records", [])]
+
+        if pages[0]:
+            semaphore = asyncio.Semaphore(max(1, max_workers or self.max_workers))
+
+            async def fetch(offset: Tuple[int, int]) -> List[dict]:
+                async with semaphore:
+                    page = await self._get(endpoint, params=self._page_params(base_params, *offset))
+                return page.get("records", [])
+
+            offsets = self._page_offsets(start, limit, page_size, response.get("count", 0), all)
+            pages.extend(await asyncio.gather(*(fetch(offset) for offset in offsets)))
+
+        return self._wrap_records(resource_cls, (item for page in pages for item in page), projection, lazy)
+
+    async def _get_many(
+        self,
+        endpoint: str,
+        resource_cls: Type["APIResource[T]"],
+        ids: Iterable[Union[int, str]],
+        *,
+        chunk_size: int = 100,
+        detail: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Dict[int, "APIResource[T]"]:
+        """
+        Retrieve many resources by ID with as few round trips as possible.
+
+        Same batching as `SpireClient._get_many`: ``$in`` filter queries first, then single GETs
+        for the IDs they did not return, at most ``max_workers`` requests in flight.
+
+        Returns:
+            Dict[int, APIResource[T]]: The wrapped resources keyed by ID, in the order the IDs were given.
+        """
+        endpoint = endpoint.rstrip("/")
+        ids, chunks = self._id_chunks(ids, chunk_size)
+        semaphore = asyncio.Semaphore(max(1, max_workers or self.max_workers))
+        found: Dict[int, APIResource[T]] = {}
+
+        async def query_chunk(chunk: List[int]) -> List["APIResource[T]"]:
+            async with semaphore:
+                return await self._query(endpoint, resource_cls, filter={"id": {"$in": chunk}}, limit=len(chunk), max_workers=1)
+
+        async def get_one(id: int) -> Optional["APIResource[T]"]:
+            async with semaphore:
+                try:
+                    return resource_cls.from_json(await self._get(f"{endpoint}/{id}"), self)
+                except httpx.HTTPStatusError as http_err:
+                    if http_err.response.status_code == 404:
+                        return None
+                    raise
+
+        if not detail:
+            for resources in await asyncio.gather(*(query_chunk(chunk) for chunk in chunks)):
+                for resource in resources:
+                    found[resource.id] = resource
+
+        missing = [id for id in ids if id not in found]
+        for resource in await asyncio.gather(*(get_one(id) for id in missing)):
+            if resource is not None:
+                found[resource.id] = resource
+
+        return {id: found[id] for id in ids if id in found}
 
 
 class APIResource(Generic[T]):
@@ -233,9 +1234,13 @@ class APIResource(Generic[T]):
     Model: type
     endpoint: str   
 
-    def __init__(self, model: T, client: SpireClient, **kwargs):
+    def __init__(self, model: T, client: Union[SpireClient, AsyncSpireClient], **kwargs):
         object.__setattr__(self, "_model", model)
         object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_touched", False)
+        object.__setattr__(self, "_deferred", False)
+        object.__setattr__(self, "_original", None)
+        object.__setattr__(self, "_raw", None)
 
         # Let child classes handle extra kwargs
         for k, v in kwargs.items():
@@ -246,7 +1251,15 @@ class APIResource(Generic[T]):
         if you try to access an attribute on your wrapper class that doesn't exist in that class.
         It will automatically forward the request to self._model """
         
-        return getattr(self._model, item)
+        raw = self.__dict__.get("_raw")
+        if raw is not None:
+            # Lazy resources validate plain scalar fields on their own and build the model for anything else
+            adapter = _scalar_adapter(self.Model, item)
+            if adapter is not None:
+                return adapter.validate_python(raw[item]) if item in raw else self.Model.model_fields[item].get_default()
+        if self.__dict__.get("_deferred") and item in self.Model.model_fields and item not in self._model.model_fields_set:
+            self._load_deferred()
+        return getattr(self.model, item)
     
     def __setattr__(self, key, value):
         """
@@ -256,34 +1269,207 @@ class APIResource(Generic[T]):
         if key.startswith("_"):
             object.__setattr__(self, key, value)
         else:
-            setattr(self._model, key, value)
+            setattr(self.model, key, value)
+            object.__setattr__(self, "_touched", True)
   
     def __str__(self):
-        return self._model.model_dump_json(indent=2)
+        return self.model.model_dump_json(indent=2)
+
+    @property
+    def _sync_client(self) -> SpireClient:
+        """
+        The client used by the resource's own request helpers (``update()``, ``refresh()``, ``delete()``...).
+
+        Those helpers send blocking requests, so resources returned by an `AsyncSpireClient` only
+        support reading their fields; send their writes through the async resource clients instead.
+
+        Raises:
+            TypeError: If the resource was returned by an `AsyncSpireClient`.
+        """
+        client = self._client
+        if isinstance(client, AsyncSpireClient):
+            raise TypeError(
+                f"{type(self).__name__} was returned by an AsyncSpireClient and cannot send requests itself. "
+                "Await the async client's methods instead (e.g. 'await spire.orders.update_sales_order(order.id, order.model)')."
+            )
+        return client
     
     @property
     def model(self) -> T:
         """
         Accessor for the underlying Pydantic model.
 
+        Lazy resources validate their record into the model on first access.
+
         Returns:
             T: The internal Pydantic model instance.
         """
+        if self._raw is not None:
+            self._model = self.Model(**self._raw)
+            self._raw = None
         return self._model
     
     @classmethod
-    def from_json(cls, json_data: dict, client: SpireClient, **kwargs) -> "APIResource":
-        model_instance = cls.Model(**json_data)
-        return cls(model_instance, client, **kwargs)
+    def from_json(cls, json_data: dict, client: SpireClient, lazy: bool = False, **kwargs) -> "APIResource":
+        """
+        Wrap a record returned by the API.
+
+        Args:
+            json_data (dict): The raw JSON record.
+            client (SpireClient): The client the record was fetched with.
+            lazy (bool, optional): Keep the raw record and skip validation until it is needed. Plain
+                ``str``/``int``/``bool``/``float`` fields are validated one at a time when read; reading any
+                other field, accessing ``model``, or changing a field validates the whole record. Default is False.
+            **kwargs: Passed to the resource constructor.
+
+        Returns:
+            APIResource: The wrapped resource.
+        """
+        if lazy:
+            resource = cls(None, client, **kwargs)
+            object.__setattr__(resource, "_raw", json_data)
+        else:
+            resource = cls(cls.Model(**json_data), client, **kwargs)
+        # The server's record is kept as the baseline that changes() diffs against
+        object.__setattr__(resource, "_original", json_data)
+        return resource
+
+    @classmethod
+    def deferred(cls, submitted: T, id: Union[int, str], client: SpireClient, **kwargs) -> "APIResource":
+        """
+        Build a lightweight handle for a record that was just created, without fetching it.
+
+        The handle wraps a copy of the submitted model with the new ID set. The full record is
+        only fetched from the server the first time a field that was not submitted is read, or
+        when `refresh()` is called.
+
+        Args:
+            submitted (T): The model that was sent in the create request.
+            id (int | str): The ID of the created record.
+            client (SpireClient): The client the record was created with.
+
+        Returns:
+            APIResource: The deferred resource.
+        """
+        resource = cls(submitted.model_copy(update={"id": int(id)}), client, **kwargs)
+        object.__setattr__(resource, "_deferred", True)
+        return resource
+
+    def _load_deferred(self):
+        """Fetch the full record behind a deferred handle, keeping any fields changed since it was created."""
+        object.__setattr__(self, "_deferred", False)
+        local = self._model
+        record = self._sync_client._get(f"{self.endpoint.rstrip('/')}/{local.id}")
+        self._model = self.Model(**record)
+        self._original = record
+        if self._touched:
+            for field in local.model_fields_set:
+                setattr(self._model, field, getattr(local, field))
     
-    def refresh(self):
-        updated = self._client._get(f"{self.endpoint}/{self.id}")
+    def refresh(self, force: bool = False):
+        """
+        Reload this resource from the server.
+
+        The request is revalidated against the client's response cache, so an unchanged record
+        costs a ``304 Not Modified`` instead of a full download when the server supports it.
+        The mirror is never read, even with ``read_from_mirror``; the fetched record is saved back to it.
+        If the record's ``modified``/``lastModified`` stamp matches the one already loaded, the
+        loaded model already holds every field of the response (it was not built from a partial
+        list record) and it has no local changes, the response is not parsed and validated again.
+        Local changes, including edits to nested models and line items, are always discarded.
+
+        Args:
+            force (bool, optional): Always rebuild the model from the response, even when neither
+                the server record nor the local one changed. Default is False.
+
+        Returns:
+            APIResource: This resource.
+        """
+        updated = self._sync_client._get(f"{self.endpoint.rstrip('/')}/{self.id}", revalidate=True)
+        if not force and not self._touched:
+            stamp = _modified_stamp(updated)
+            loaded = self._raw if self._raw is not None else self._model.model_fields_set
+            complete = all(key in loaded for key in updated if key in self.Model.model_fields)
+            if complete and stamp is not None and stamp == _modified_stamp(self._raw if self._raw is not None else self._model):
+                # Only top-level assignments mark the resource as touched; nested edits show up in changes()
+                if not self.changes():
+                    return self
+        self._raw = None
         self._model = self.Model(**updated)
+        self._original = updated
+        self._touched = False
+        self._deferred = False
         return self
 
     def to_dict(self):
-        return self._model.model_dump(exclude_unset=True, exclude_none=True)
-    
+        return self.model.model_dump(exclude_unset=True, exclude_none=True)
+
+    def typed(self) -> BaseModel:
+        """
+        Return a copy of this resource as its Decimal-typed model (see `Models.typed_models.decimal_model`).
+
+        Money and quantity fields such as ``total``, ``unitPrice`` and ``orderQty`` are `Decimal`
+        instead of strings. The copy is detached: changes to it are not saved by ``update()``.
+        """
+        typed_cls = decimal_model(self.Model)
+        if self._raw is not None:
+            return typed_cls(**self._raw)
+        return typed_cls.model_validate(self.model.model_dump(exclude_unset=True))
+
+    def changes(self) -> dict:
+        """
+        Return the fields changed since this resource was loaded, as an update payload.
+
+        Changes made anywhere in the resource are found, including in nested models and line
+        items (see `utils.diff_payload`). Resources that were not loaded from the server, such as
+        locally built or deferred ones, return every set field.
+
+        Returns:
+            dict: The changed fields, or an empty dict if nothing changed.
+        """
+        if self._raw is not None:
+            # A lazy resource that was never validated cannot have been changed
+            return {}
+        current = self.to_dict()
+        if self._original is None:
+            return current
+        # The baseline is only validated when an update is sent, so reads never pay for it
+        original = self.Model(**self._original).model_dump(exclude_unset=True, exclude_none=True)
+        return diff_payload(original, current)
+
+
+# TypeAdapters of the plain scalar fields of each model, None for fields that need the full model
+_SCALAR_TYPES = (str, int, bool, float, type(None))
+# ``X | Y`` unions have their own origin from Python 3.10
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+_scalar_adapters: Dict[Tuple[type, str], Optional[TypeAdapter]] = {}
+
+
+def _scalar_adapter(model_cls: Type[BaseModel], name: str) -> Optional[TypeAdapter]:
+    """Return a TypeAdapter validating a scalar field of a model on its own, or None if the field is not a plain scalar."""
+    key = (model_cls, name)
+    if key in _scalar_adapters:
+        return _scalar_adapters[key]
+    adapter = None
+    field = model_cls.model_fields.get(name)
+    if field is not None:
+        annotation = field.annotation
+        args = get_args(annotation) if get_origin(annotation) in _UNION_ORIGINS else (annotation,)
+        if args and all(arg in _SCALAR_TYPES for arg in args):
+            adapter = TypeAdapter(annotation)
+    _scalar_adapters[key] = adapter
+    return adapter
+
+
+def _param_items(params: Any) -> Iterable[Tuple[str, Any]]:
+    """Return query parameters given as a dict or a list of pairs as pairs."""
+    if isinstance(params, dict):
+        return params.items()
+    return params or ()
 
-    
 
+def _modified_stamp(record: Union[BaseModel, dict]) -> Optional[str]:
+    """Return the ``modified`` (or ``lastModified``) timestamp of a record or model, if it has one."""
+    if isinstance(record, BaseModel):
+        return getattr(record, "modified", None) or getattr(record, "lastModified", None)
+    return record.get("modified") or record.get("lastModified")
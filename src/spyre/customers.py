@@ -1,8 +1,9 @@
-from .client import SpireClient, APIResource
+from .client import SpireClient, AsyncSpireClient, APIResource
 from .Models.customers_models import Customer
 from .Exceptions import CreateRequestError
 from urllib.parse import urlparse
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Iterable, Callable, Tuple, Union
+from .bulk import BulkResult, BulkCheckpoint, run_bulk, update_one, update_key
 
 class CustomerClient():
 
@@ -10,7 +11,7 @@ class CustomerClient():
         self.client = client
         self.endpoint = "customers"
 
-    def get_customer(self, id: int) -> "customer":
+    def get_customer(self, id: int, fields: Optional[List[str]] = None) -> "customer":
         """
         Retrieve a customer by ID.
 
@@ -18,15 +19,34 @@ class CustomerClient():
 
         Args:
             id (int): The ID of the customer to retrieve.
+            fields (List[str], optional): Only fetch these fields (dotted paths for nested fields). The
+                result is a partial model; other fields are left unset.
 
         Returns:
             Customer: A Customer object populated with the retrieved data.
         """
 
-        response = self.client._get(f"{self.endpoint}/{str(id)}")
+        response = self.client._get(f"{self.endpoint}/{str(id)}", fields=fields)
         return customer.from_json(json_data=response, client=self.client)
-    
-    def create_customer(self, customer : 'Customer') -> "customer":
+
+    def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "customer"]:
+        """
+        Retrieve many customers by ID in a handful of batched requests.
+
+        IDs are looked up through ``{"id": {"$in": [...]}}`` filter queries instead of one GET each.
+
+        Args:
+            ids (Iterable[int]): The IDs of the customers to retrieve.
+            detail (bool, optional): If True, fetch each record with its own GET (in parallel) to get the
+                full record, as list records can omit details.
+            chunk_size (int, optional): Number of IDs per filter query. Default is 100.
+
+        Returns:
+            Dict[int, customer]: The customers keyed by ID. IDs that were not found are left out.
+        """
+        return self.client._get_many(self.endpoint, customer, ids, chunk_size=chunk_size, detail=detail)
+
+    def create_customer(self, customer : 'Customer', fetch: bool = True) -> "customer":
         """
         Create a new customer.
 
@@ -35,6 +55,8 @@ class CustomerClient():
 
         Args:
             customer (Customer): The Customer object containing the data to be created.
+            fetch (bool, optional): If False, skip the follow-up GET and return a deferred handle holding
+                the new ID and the submitted fields; the full record is fetched lazily. Default is True.
 
         Returns:
             Customer: The newly created Customer object returned by the API.
@@ -46,6 +68,8 @@ class CustomerClient():
             parsed_url = urlparse(location)
             path_segments = parsed_url.path.rstrip("/").split("/")
             id = path_segments[-1]
+            if not fetch:
+                return _customer_resource.deferred(customer, id, self.client)
             return self.get_customer(id)
         else:
             error_message = response.get('content')
@@ -67,6 +91,68 @@ class CustomerClient():
         response = self.client._put(f"/{self.endpoint}/{str(id)}", json=customer.model_dump(exclude_none=True, exclude_unset=True))
         return customer.from_json(response, self.client)
     
+    def create_many(
+        self,
+        customers: Iterable['Customer'],
+        *,
+        fetch: bool = False,
+        key: Optional[Callable[['Customer'], Any]] = None,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Create many customers concurrently.
+
+        Writes run through a bounded worker pool, and failures are collected on the result
+        instead of raised, so one rejected record does not stop the run.
+
+        Args:
+            customers (Iterable[Customer]): The customers to create.
+            fetch (bool, optional): Fetch each created customer after its POST, as `create_customer` does by default.
+                Default is False (deferred handles, one request per record).
+            key (callable, optional): Returns the stable key of a customer, used by the result and the checkpoint
+                (e.g. ``lambda c: c.customerNo``). Defaults to the customer's position in ``customers``.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            checkpoint (BulkCheckpoint, optional): Skips customers created by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The created customers and the errors, keyed by customer key.
+        """
+        return run_bulk(
+            lambda model: self.create_customer(model, fetch=fetch),
+            customers,
+            key=key,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+        )
+
+    def update_many(
+        self,
+        customers: Iterable[Union["customer", Tuple[int, 'Customer']]],
+        *,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Update many customers concurrently.
+
+        Args:
+            customers (Iterable[customer | Tuple[int, Customer]]): Wrapped customers saved with their own
+                ``update()``, or ``(id, Customer)`` pairs sent to `update_customer`.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            checkpoint (BulkCheckpoint, optional): Skips customers updated by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The updated customers and the errors, keyed by ID.
+        """
+        return run_bulk(
+            update_one(self.update_customer),
+            customers,
+            key=update_key,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+        )
+
     def delete_customer(self, id : int) -> bool:
         """
         Delete a customer by ID.
@@ -120,6 +206,150 @@ class CustomerClient():
             start=start,
             **extra_params
         )
+
+    def iter_customers(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        prefetch: bool = True,
+        **extra_params
+    ) -> Iterator["customer"]:
+        """
+        Stream customers page by page instead of loading every page into memory.
+
+        Accepts the same arguments as the list query, but yields each customer as its page arrives.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"orderDate": "desc", "orderNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, streams all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            prefetch (bool, optional): If True, fetches the next page while the current one is processed.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Yields:
+            customer: Wrapped customer resources, one at a time.
+        """
+        return self.client._iter_query(
+            endpoint=self.endpoint,
+            resource_cls=customer,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            prefetch=prefetch,
+            **extra_params
+        )
+
+    def query_customers_df(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+        **extra_params
+    ) -> "pandas.DataFrame":
+        """
+        Query customers into a pandas DataFrame built straight from the page JSON, without creating `customer` wrappers.
+
+        Nested fields are flattened into dotted columns and numeric strings such as ``creditBalance`` are
+        converted to float64. Pages are converted as they arrive, so large extracts never hold a
+        list of wrappers in memory.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"customerNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to keep (e.g., ["customerNo", "name", "address.city", "creditBalance"]). Defaults to every field.
+            explode (str, optional): A list field turned into one row per element (e.g., "shippingAddresses").
+            dtype_backend (str, optional): Passed to ``DataFrame.convert_dtypes`` (e.g., "pyarrow"). Default keeps NumPy dtypes.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            pandas.DataFrame: One row per customer, or per exploded element.
+        """
+        return self.client._query_frame(
+            endpoint=self.endpoint,
+            resource_cls=customer,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            dtype_backend=dtype_backend,
+            **extra_params
+        )
+
+    def export_customers(
+        self,
+        path: str,
+        *,
+        format: Optional[str] = None,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = True,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        **extra_params
+    ) -> int:
+        """
+        Export customers to a CSV, Excel (.xlsx) or Parquet file, streaming one page at a time.
+
+        Args:
+            path (str): The file to write. The format is taken from its extension unless ``format`` is given.
+            format (str, optional): "csv", "xlsx" or "parquet".
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"customerNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, exports all pages of results. Default is True.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to export (e.g., ["customerNo", "name", "address.city", "creditBalance"]). Defaults to the fields of the first page.
+            explode (str, optional): A list field written as one row per element (e.g., "shippingAddresses").
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            int: The number of rows written.
+        """
+        return self.client._export(
+            endpoint=self.endpoint,
+            resource_cls=customer,
+            path=path,
+            format=format,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            **extra_params
+        )
     
 
 class customer(APIResource[Customer]):
@@ -136,13 +366,14 @@ class customer(APIResource[Customer]):
         Returns:
             bool: True if the order was successfully deleted (HTTP 204 or 200), False otherwise.
         """
-        return self._client._delete(f"/{self.endpoint}/{str(self.id)}")
+        return self._sync_client._delete(f"/{self.endpoint}/{str(self.id)}")
 
     def update(self, customer: "customer" = None) -> 'customer':
         """
         Update the customer.
 
-        If no order object is provided, updates the current instance on the server.
+        If no order object is provided, sends only the fields changed since the instance was loaded
+        (see `APIResource.changes`), and nothing at all if no field changed.
         If an order object is provided, updates the customer using the given data.
 
         Args:
@@ -151,6 +382,140 @@ class customer(APIResource[Customer]):
         Returns:
             customer: The updated customer object reflecting the new status.
         """
-        data = customer.model_dump(exclude_unset=True, exclude_none=True) if customer else self.model_dump(exclude_unset=True, exclude_none=True)
-        response = self._client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
-        return customer.from_json(response, self._client)
+        data = customer.model_dump(exclude_unset=True, exclude_none=True) if customer else self.changes()
+        if not data:
+            return self
+        response = self._sync_client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
+        return _customer_resource.from_json(response, self._sync_client)
+
+
+# The 'customer' arguments of create_customer and customer.update shadow the wrapper class
+_customer_resource = customer
+
+
+class AsyncCustomerClient():
+    """
+    Asyncio counterpart of `CustomerClient`.
+
+    Returned `customer` resources are read-only: their own request helpers (``update()``,
+    ``delete()``) raise `TypeError`, so send writes through the coroutines on this client
+    (e.g. `update_customer`).
+    """
+
+    def __init__(self, client : AsyncSpireClient):
+        self.client = client
+        self.endpoint = "customers"
+
+    async def get_customer(self, id: int, fields: Optional[List[str]] = None) -> "customer":
+        """
+        Retrieve a customer by ID.
+
+        Args:
+            id (int): The ID of the customer to retrieve.
+            fields (List[str], optional): Only fetch these fields (dotted paths for nested fields).
+
+        Returns:
+            customer: A customer object populated with the retrieved data.
+        """
+        response = await self.client._get(f"{self.endpoint}/{str(id)}", fields=fields)
+        return customer.from_json(json_data=response, client=self.client)
+
+    async def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "customer"]:
+        """
+        Retrieve many customers by ID in a handful of batched requests (see `CustomerClient.get_many`).
+
+        Returns:
+            Dict[int, customer]: The customers keyed by ID. IDs that were not found are left out.
+        """
+        return await self.client._get_many(self.endpoint, customer, ids, chunk_size=chunk_size, detail=detail)
+
+    async def create_customer(self, customer_ : 'Customer') -> "customer":
+        """
+        Create a new customer.
+
+        Args:
+            customer_ (Customer): The Customer object containing the data to be created.
+
+        Returns:
+            customer: The newly created customer returned by the API.
+
+        Raises:
+            CreateRequestError: If the creation fails or response is invalid.
+        """
+        response = await self.client._post(f"/{self.endpoint}", json=customer_.model_dump(exclude_unset=True, exclude_none=True))
+        if response.get('status_code') == 201:
+            location = response.get('headers').get('location')
+            parsed_url = urlparse(location)
+            path_segments = parsed_url.path.rstrip("/").split("/")
+            id = path_segments[-1]
+            return await self.get_customer(id)
+        else:
+            error_message = response.get('content')
+            raise CreateRequestError(self.endpoint, status_code=response.get('status_code'), error_message=error_message)
+
+    async def update_customer(self, id : int, customer_ : 'Customer') -> "customer":
+        """
+        Update an existing customer by ID.
+
+        Args:
+            id (int): The ID of the customer to update.
+            customer_ (Customer): A Pydantic model representing the updated customer data.
+
+        Returns:
+            customer: A customer instance built from the updated response data.
+        """
+        response = await self.client._put(f"/{self.endpoint}/{str(id)}", json=customer_.model_dump(exclude_none=True, exclude_unset=True))
+        return customer.from_json(response, self.client)
+
+    async def delete_customer(self, id : int) -> bool:
+        """
+        Delete a customer by ID.
+
+        Args:
+            id (int): The ID of the customer to delete.
+
+        Returns:
+            bool: True if the customer was successfully deleted, False otherwise.
+        """
+        return await self.client._delete(f"/{self.endpoint}/{str(id)}")
+
+    async def query_customers(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        fields: Optional[List[str]] = None,
+        **extra_params
+    ) -> List["customer"]:
+        """
+        Query customers with optional full-text search, filtering, multi-field sorting, and pagination.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"name": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            fields (List[str], optional): Only fetch these fields of each record (dotted paths for nested fields).
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            List[customer]: List of wrapped customer resources.
+        """
+        return await self.client._query(
+            endpoint=self.endpoint,
+            resource_cls=customer,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            fields=fields,
+            **extra_params
+        )
@@ -0,0 +1,185 @@
+import csv
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .frames import NUMERIC_FIELDS, iter_rows
+
+# Data rows per worksheet; Excel sheets hold 1,048,576 rows including the header
+EXCEL_MAX_ROWS = 1_048_575
+
+EXPORT_FORMATS = {
+    ".csv": "csv",
+    ".xlsx": "xlsx",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def export_format(path: str, format: Optional[str] = None) -> str:
+    """
+    Return the export format of a file: ``format`` when given, otherwise inferred from the extension.
+
+    Raises:
+        ValueError: If the format is not one of csv, xlsx or parquet.
+    """
+    if format is None:
+        format = EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"Cannot infer the export format of '{path}'. Expected one of {sorted(EXPORT_FORMATS)} or pass format=.")
+    format = format.lower()
+    if format not in set(EXPORT_FORMATS.values()):
+        raise ValueError(f"Unsupported export format '{format}'. Expected one of {sorted(set(EXPORT_FORMATS.values()))}")
+    return format
+
+
+def export_pages(
+    pages: Iterable[List[Dict[str, Any]]],
+    path: str,
+    *,
+    format: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    explode: Optional[str] = None,
+    numeric_fields: Iterable[str] = NUMERIC_FIELDS,
+    sheet_name: str = "Export",
+) -> int:
+    """
+    Write pages of raw JSON records to a CSV, Excel or Parquet file, one page at a time.
+
+    Each page is flattened (``customer.customerNo``), written and released before the next one is
+    read, so memory use does not grow with the size of the export. Lists and objects that are not
+    exploded are written as JSON text.
+
+    Without ``columns``, the columns are those of the first page; fields that only appear in later
+    pages are not exported. Pass ``columns`` to fix the layout of large or sparse exports.
+
+    - **csv**: values are written as the API returns them, so decimal strings keep their precision.
+    - **xlsx**: an openpyxl write-only workbook. Fields in ``numeric_fields`` are written as numbers,
+      and a new sheet is started every `EXCEL_MAX_ROWS` rows.
+    - **parquet**: one row group per page, with ``numeric_fields`` as float64 columns. Requires pyarrow.
+
+    Args:
+        pages (Iterable[List[dict]]): Pages of raw records, such as `SpireClient._iter_pages`.
+        path (str): The file to write. It is overwritten if it exists.
+        format (str, optional): "csv", "xlsx" or "parquet". Defaults to the extension of ``path``.
+        columns (List[str], optional): Dotted column paths to export, in this order.
+        explode (str, optional): A list field written as one row per element (e.g. ``"items"``).
+        numeric_fields (Iterable[str], optional): Field names converted to numbers. Defaults to `frames.NUMERIC_FIELDS`.
+        sheet_name (str, optional): Name of the first worksheet of an Excel export. Default is "Export".
+
+    Returns:
+        int: The number of rows written.
+
+    Raises:
+        ValueError: If the format is not supported.
+        ImportError: If a Parquet export is requested and pyarrow is not installed.
+    """
+    format = export_format(path, format)
+    numeric_fields = frozenset(numeric_fields)
+    row_pages = (list(iter_rows(page, explode)) for page in pages)
+
+    first = next(row_pages, [])
+    if columns is None:
+        columns = list(dict.fromkeys(key for row in first for key in row))
+    columns = list(columns)
+
+    def all_pages() -> Iterator[List[Dict[str, Any]]]:
+        if first:
+            yield first
+        yield from row_pages
+
+    writer = {"csv": _write_csv, "xlsx": _write_xlsx, "parquet": _write_parquet}[format]
+    return writer(all_pages(), path, columns, numeric_fields, sheet_name)
+
+
+def _cell(value: Any, numeric: bool) -> Any:
+    """Convert a flattened value for export: nested values become JSON, numeric strings become floats."""
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if numeric and isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _write_csv(pages, path, columns, numeric_fields, sheet_name) -> int:
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        for rows in pages:
+            writer.writerows([_cell(row.get(column), False) for column in columns] for row in rows)
+            count += len(rows)
+    return count
+
+
+def _write_xlsx(pages, path, columns, numeric_fields, sheet_name) -> int:
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+    numeric = [column.rsplit(".", 1)[-1] in numeric_fields for column in columns]
+
+    def cell(value, is_numeric):
+        value = _cell(value, is_numeric)
+        # openpyxl refuses control characters in strings
+        return ILLEGAL_CHARACTERS_RE.sub("", value) if isinstance(value, str) else value
+
+    workbook = Workbook(write_only=True)
+    sheets = 0
+    sheet = None
+    sheet_rows = EXCEL_MAX_ROWS
+    count = 0
+    for rows in pages:
+        for row in rows:
+            if sheet_rows >= EXCEL_MAX_ROWS:
+                sheets += 1
+                sheet = workbook.create_sheet(sheet_name if sheets == 1 else f"{sheet_name} ({sheets})")
+                sheet.append(columns)
+                sheet_rows = 0
+            sheet.append([cell(row.get(column), is_numeric) for column, is_numeric in zip(columns, numeric)])
+            sheet_rows += 1
+        count += len(rows)
+    if sheet is None:
+        workbook.create_sheet(sheet_name).append(columns)
+    workbook.save(path)
+    return count
+
+
+def _write_parquet(pages, path, columns, numeric_fields, sheet_name) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow. Install it with 'pip install pyarrow'.") from None
+
+    numeric = [column.rsplit(".", 1)[-1] in numeric_fields for column in columns]
+    writer = None
+    schema = None
+    count = 0
+    try:
+        for rows in pages:
+            data = {
+                column: [_cell(row.get(column), is_numeric) for row in rows]
+                for column, is_numeric in zip(columns, numeric)
+            }
+            if schema is None:
+                # Columns without a value on the first page default to strings
+                inferred = pa.Table.from_pydict(data).schema
+                schema = pa.schema([
+                    pa.field(column, pa.float64() if is_numeric else (pa.string() if pa.types.is_null(field.type) else field.type))
+                    for column, is_numeric, field in zip(columns, numeric, inferred)
+                ])
+                writer = pq.ParquetWriter(path, schema)
+            writer.write_table(pa.Table.from_pydict(data).cast(schema))
+            count += len(rows)
+        if writer is None:
+            schema = pa.schema([pa.field(column, pa.float64() if is_numeric else pa.string()) for column, is_numeric in zip(columns, numeric)])
+            writer = pq.ParquetWriter(path, schema)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
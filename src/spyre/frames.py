@@ -0,0 +1,138 @@
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+from .Models.typed_models import DECIMAL_FIELDS
+
+# Fields the API returns as decimal strings ("12.50"), converted to float64 columns
+NUMERIC_FIELDS: FrozenSet[str] = DECIMAL_FIELDS
+
+
+def flatten_record(record: Dict[str, Any], prefix: str = "", sep: str = ".", out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Flatten nested objects of a raw JSON record into dotted keys.
+
+    Lists are kept as values; use ``explode`` in `records_frame` to turn a list into rows.
+
+    Example:
+        flatten_record({"orderNo": "1", "customer": {"customerNo": "C1"}})
+        # {"orderNo": "1", "customer.customerNo": "C1"}
+    """
+    if out is None:
+        out = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flatten_record(value, f"{name}{sep}", sep, out)
+        else:
+            out[name] = value
+    return out
+
+
+def iter_rows(records: Iterable[Dict[str, Any]], explode: Optional[str] = None, sep: str = ".") -> Iterator[Dict[str, Any]]:
+    """Yield the flat rows of raw records, one per element of the exploded list when given."""
+    if explode is None:
+        for record in records:
+            yield flatten_record(record, sep=sep)
+        return
+    for record in records:
+        children = record.get(explode) or []
+        parent = flatten_record({key: value for key, value in record.items() if key != explode}, sep=sep)
+        if not children:
+            yield parent
+        for child in children:
+            row = dict(parent)
+            if isinstance(child, dict):
+                flatten_record(child, f"{explode}{sep}", sep, row)
+            else:
+                row[explode] = child
+            yield row
+
+
+def records_frame(
+    records: Iterable[Dict[str, Any]],
+    *,
+    columns: Optional[List[str]] = None,
+    explode: Optional[str] = None,
+    numeric_fields: Iterable[str] = NUMERIC_FIELDS,
+    sep: str = ".",
+) -> pd.DataFrame:
+    """
+    Build a DataFrame straight from raw JSON records, without validating them into models.
+
+    Nested objects become dotted columns (``customer.customerNo``). Columns whose last path
+    segment is in ``numeric_fields`` are converted from decimal strings to float64 in one
+    vectorised pass; values that do not parse become NaN.
+
+    Args:
+        records (Iterable[dict]): Raw records, such as one page of a query.
+        columns (List[str], optional): Only keep these columns, in this order. Missing columns are filled with NaN.
+        explode (str, optional): A list field (e.g. ``"items"``) turned into one row per element. Parent
+            fields are repeated on every row and element fields are prefixed (``items.partNo``).
+        numeric_fields (Iterable[str], optional): Field names converted to numbers. Defaults to `NUMERIC_FIELDS`.
+        sep (str, optional): Separator of flattened column names. Default is ".".
+
+    Returns:
+        pandas.DataFrame: One row per record, or per exploded element.
+    """
+    frame = pd.DataFrame.from_records(list(iter_rows(records, explode, sep)))
+    if columns is not None:
+        frame = frame.reindex(columns=list(columns))
+    numeric_fields = numeric_fields if isinstance(numeric_fields, (set, frozenset)) else frozenset(numeric_fields)
+    for column in frame.columns:
+        if column.rsplit(sep, 1)[-1] in numeric_fields and not pd.api.types.is_numeric_dtype(frame[column]):
+            # Always float64, so pages whose values happen to be whole numbers concatenate cleanly
+            frame[column] = pd.to_numeric(frame[column], errors="coerce").astype("float64")
+    return frame
+
+
+def concat_frames(frames: Iterable[pd.DataFrame], columns: Optional[List[str]] = None, dtype_backend: Optional[str] = None) -> pd.DataFrame:
+    """
+    Concatenate page frames built by `records_frame` into one frame.
+
+    Args:
+        frames (Iterable[pandas.DataFrame]): The page frames.
+        columns (List[str], optional): Columns of the empty frame returned when there are no pages.
+        dtype_backend (str, optional): Convert the result with ``DataFrame.convert_dtypes``, e.g.
+            ``"pyarrow"`` for Arrow-backed columns or ``"numpy_nullable"``. Default keeps NumPy dtypes.
+    """
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        frame = pd.DataFrame(columns=list(columns or []))
+    elif len(frames) == 1:
+        frame = frames[0]
+    else:
+        frame = pd.concat(frames, ignore_index=True)
+    if dtype_backend is not None:
+        frame = frame.convert_dtypes(dtype_backend=dtype_backend)
+    return frame
+
+
+def to_dataframe(
+    resources: Iterable[Any],
+    *,
+    columns: Optional[List[str]] = None,
+    explode: Optional[str] = None,
+    numeric_fields: Iterable[str] = NUMERIC_FIELDS,
+    dtype_backend: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from wrapped resources already in memory (e.g. the result of ``query_sales_orders``).
+
+    Lazily validated resources that were never read use their raw JSON directly. For large
+    extracts, prefer the ``query_*_df`` methods, which never create the wrappers at all.
+
+    Args:
+        resources (Iterable[APIResource]): The wrapped resources.
+        columns, explode, numeric_fields: See `records_frame`.
+        dtype_backend (str, optional): See `concat_frames`.
+
+    Returns:
+        pandas.DataFrame: One row per resource, or per exploded element.
+    """
+    records = (
+        resource._raw if getattr(resource, "_raw", None) is not None else resource.model.model_dump(mode="json", exclude_none=True)
+        for resource in resources
+    )
+    frame = records_frame(records, columns=columns, explode=explode, numeric_fields=numeric_fields)
+    return concat_frames([frame], columns=columns, dtype_backend=dtype_backend)
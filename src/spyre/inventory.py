@@ -1,8 +1,9 @@
 from .Models.inventory_models import InventoryItem, UnitOfMeasure, UPC
-from .client import SpireClient, APIResource
+from .client import SpireClient, AsyncSpireClient, APIResource
 from urllib.parse import urlparse 
 from .Exceptions import CreateRequestError
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Iterator, Iterable, Callable, Tuple, Union
+from .bulk import BulkResult, BulkCheckpoint, run_bulk, update_one, update_key
 from typing import TYPE_CHECKING
 
 class InventoryClient():
@@ -28,7 +29,7 @@ class ItemsClient():
         self.client = client
         self.endpoint = 'inventory/items'
 
-    def get_item(self, id: int = None, part_no: str = None, warehouse: str = None) -> "item":
+    def get_item(self, id: int = None, part_no: str = None, warehouse: str = None, fields: Optional[List[str]] = None) -> "item":
         """
         Retrieve an inventory item by ID or (part_no + warehouse).
 
@@ -41,6 +42,8 @@ class ItemsClient():
             id (int, optional): The ID of the inventory item to retrieve.
             part_no (str, optional): The part number of the item to retrieve.
             warehouse (str, optional): The warehouse code where the item is located.
+            fields (List[str], optional): Only fetch these fields (dotted paths for nested fields). The
+                result is a partial model; other fields are left unset.
 
         Returns:
             item: An `item` wrapper instance containing the retrieved data.
@@ -50,11 +53,14 @@ class ItemsClient():
                         or if no matching item is found.
         """
         if id is not None:
-            response = self.client._get(f"/{self.endpoint}/{str(id)}")
+            response = self.client._get(f"/{self.endpoint}/{str(id)}", fields=fields)
             return item.from_json(response, self.client)
 
         elif part_no and warehouse:
-            items = self.query_inventory_items(filter={"partNo": part_no, "whse": warehouse})
+            items = self.query_inventory_items(
+                filter={"partNo": part_no, "whse": warehouse},
+                fields=list(fields) + ["partNo", "whse"] if fields else None,
+            )
             for itm in items:
                 if getattr(itm, "partNo", None) == part_no and getattr(itm, "whse", None) == warehouse:
                     return itm
@@ -62,8 +68,25 @@ class ItemsClient():
 
         else:
             raise ValueError("You must provide either 'id' or both 'part_no' and 'warehouse'.")
-    
-    def create_item(self, item : 'InventoryItem') -> 'item':
+
+    def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "item"]:
+        """
+        Retrieve many inventory items by ID in a handful of batched requests.
+
+        IDs are looked up through ``{"id": {"$in": [...]}}`` filter queries instead of one GET each.
+
+        Args:
+            ids (Iterable[int]): The IDs of the inventory items to retrieve.
+            detail (bool, optional): If True, fetch each record with its own GET (in parallel) to get the
+                full record, as list records can omit details.
+            chunk_size (int, optional): Number of IDs per filter query. Default is 100.
+
+        Returns:
+            Dict[int, item]: The inventory items keyed by ID. IDs that were not found are left out.
+        """
+        return self.client._get_many(self.endpoint, item, ids, chunk_size=chunk_size, detail=detail)
+
+    def create_item(self, item : 'InventoryItem', fetch: bool = True) -> 'item':
         """
         Create a new Inventory Item in Spire.
 
@@ -71,6 +94,8 @@ class ItemsClient():
 
         Args:
             item (dict): A InventoryItem instace containing the sales order details.
+            fetch (bool, optional): If False, skip the follow-up GET and return a deferred handle holding
+                the new ID and the submitted fields; the full record is fetched lazily. Default is True.
 
         Returns:
             item: The created InventoryItem instance.
@@ -85,6 +110,8 @@ class ItemsClient():
             parsed_url = urlparse(location)
             path_segments = parsed_url.path.rstrip("/").split("/")
             id = path_segments[-1]
+            if not fetch:
+                return _item_resource.deferred(item, id, self.client)
             return self.get_item(id)
         else:
             error_message = response.get('content')
@@ -110,6 +137,68 @@ class ItemsClient():
         response = self.client._put(f"/{self.endpoint}/{str(id)}", json=inventory_item.model_dump(exclude_none=True, exclude_unset=True))
         return item.from_json(response, self.client)
     
+    def create_many(
+        self,
+        items: Iterable['InventoryItem'],
+        *,
+        fetch: bool = False,
+        key: Optional[Callable[['InventoryItem'], Any]] = None,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Create many inventory items concurrently.
+
+        Writes run through a bounded worker pool, and failures are collected on the result
+        instead of raised, so one rejected record does not stop the run.
+
+        Args:
+            items (Iterable[InventoryItem]): The inventory items to create.
+            fetch (bool, optional): Fetch each created item after its POST, as `create_item` does by default.
+                Default is False (deferred handles, one request per record).
+            key (callable, optional): Returns the stable key of a item, used by the result and the checkpoint
+                (e.g. ``lambda i: f"{i.partNo}|{i.whse}"``). Defaults to the item's position in ``items``.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            checkpoint (BulkCheckpoint, optional): Skips inventory items created by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The created inventory items and the errors, keyed by item key.
+        """
+        return run_bulk(
+            lambda model: self.create_item(model, fetch=fetch),
+            items,
+            key=key,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+        )
+
+    def update_many(
+        self,
+        items: Iterable[Union["item", Tuple[int, 'InventoryItem']]],
+        *,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Update many inventory items concurrently.
+
+        Args:
+            items (Iterable[item | Tuple[int, InventoryItem]]): Wrapped inventory items saved with their own
+                ``update()``, or ``(id, InventoryItem)`` pairs sent to `update_item`.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            checkpoint (BulkCheckpoint, optional): Skips inventory items updated by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The updated inventory items and the errors, keyed by ID.
+        """
+        return run_bulk(
+            update_one(self.update_item),
+            items,
+            key=update_key,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+        )
+
     def delete_item(self, id: int) -> bool:
         """
         Delete a inventory_item by its ID.
@@ -163,6 +252,150 @@ class ItemsClient():
             start=start,
             **extra_params
         )
+
+    def iter_inventory_items(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        prefetch: bool = True,
+        **extra_params
+    ) -> Iterator["item"]:
+        """
+        Stream inventory items page by page instead of loading every page into memory.
+
+        Accepts the same arguments as the list query, but yields each item as its page arrives.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"partNo": "asc", "whse": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, streams all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            prefetch (bool, optional): If True, fetches the next page while the current one is processed.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Yields:
+            item: Wrapped inventory item resources, one at a time.
+        """
+        return self.client._iter_query(
+            endpoint=self.endpoint,
+            resource_cls=item,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            prefetch=prefetch,
+            **extra_params
+        )
+
+    def query_inventory_items_df(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+        **extra_params
+    ) -> "pandas.DataFrame":
+        """
+        Query inventory items into a pandas DataFrame built straight from the page JSON, without creating `item` wrappers.
+
+        Nested fields are flattened into dotted columns and numeric strings such as ``availableQty`` are
+        converted to float64. Pages are converted as they arrive, so large extracts never hold a
+        list of wrappers in memory.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"partNo": "asc", "whse": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to keep (e.g., ["partNo", "whse", "availableQty", "primaryVendor.vendorNo"]). Defaults to every field.
+            explode (str, optional): A list field turned into one row per element (e.g., "images").
+            dtype_backend (str, optional): Passed to ``DataFrame.convert_dtypes`` (e.g., "pyarrow"). Default keeps NumPy dtypes.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            pandas.DataFrame: One row per item, or per exploded element.
+        """
+        return self.client._query_frame(
+            endpoint=self.endpoint,
+            resource_cls=item,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            dtype_backend=dtype_backend,
+            **extra_params
+        )
+
+    def export_inventory_items(
+        self,
+        path: str,
+        *,
+        format: Optional[str] = None,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = True,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        **extra_params
+    ) -> int:
+        """
+        Export inventory items to a CSV, Excel (.xlsx) or Parquet file, streaming one page at a time.
+
+        Args:
+            path (str): The file to write. The format is taken from its extension unless ``format`` is given.
+            format (str, optional): "csv", "xlsx" or "parquet".
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"partNo": "asc", "whse": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, exports all pages of results. Default is True.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to export (e.g., ["partNo", "whse", "availableQty", "primaryVendor.vendorNo"]). Defaults to the fields of the first page.
+            explode (str, optional): A list field written as one row per element (e.g., "images").
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            int: The number of rows written.
+        """
+        return self.client._export(
+            endpoint=self.endpoint,
+            resource_cls=item,
+            path=path,
+            format=format,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            **extra_params
+        )
     
     def get_item_uoms(self, id : int) -> List["uom"]:
         """
@@ -388,13 +621,14 @@ class item(APIResource[InventoryItem]):
             bool: True if the order was successfully deleted (HTTP 204 or 200), False otherwise.
         """
         
-        return self._client._delete(f"/{self.endpoint}/{str(self.id)}")
+        return self._sync_client._delete(f"/{self.endpoint}/{str(self.id)}")
     
     def update(self, inventory_item: "item" = None) -> 'item':
         """
         Update the inventory item.
 
-        If no item object is provided, updates the current instance on the server.
+        If no item object is provided, sends only the fields changed since the instance was loaded
+        (see `APIResource.changes`), and nothing at all if no field changed.
         If an item object is provided, updates the item using the given data.
 
         Args:
@@ -403,9 +637,11 @@ class item(APIResource[InventoryItem]):
         Returns:
             item: The updated item object reflecting the new status.
         """
-        data = inventory_item.model_dump(exclude_unset=True, exclude_none=True) if inventory_item else self.model_dump(exclude_unset=True, exclude_none=True)
-        response = self._client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
-        return item.from_json(response, self._client)    
+        data = inventory_item.model_dump(exclude_unset=True, exclude_none=True) if inventory_item else self.changes()
+        if not data:
+            return self
+        response = self._sync_client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
+        return item.from_json(response, self._sync_client)    
     
     def get_uoms(self) -> List["uom"]:
         """
@@ -418,10 +654,10 @@ class item(APIResource[InventoryItem]):
             List[uom]: A list of `uom` instances representing the available units of measure.
         """       
         uoms = []
-        response = self._client._get(f"{self.endpoint}/{self.id}/uoms")
+        response = self._sync_client._get(f"{self.endpoint}/{self.id}/uoms")
         items = response.get('records')
         for item in items:
-            uoms.append(uom.from_json(json_data=item, client = self._client, item_id = self.id))
+            uoms.append(uom.from_json(json_data=item, client = self._sync_client, item_id = self.id))
 
         return uoms
     
@@ -436,10 +672,10 @@ class item(APIResource[InventoryItem]):
             List[upc]: A list of `upc` instances representing the available units of measure.
         """     
         upcs = []
-        response = self._client._get(f"{self.endpoint}/{self.id}/upcs")
+        response = self._sync_client._get(f"{self.endpoint}/{self.id}/upcs")
         items = response.get('records')
         for item in items:
-            upcs.append(upc.from_json(json_data=item, client = self._client, item_id = id))
+            upcs.append(upc.from_json(json_data=item, client = self._sync_client, item_id = id))
 
         return upcs
 
@@ -460,13 +696,13 @@ class item(APIResource[InventoryItem]):
         Raises:
             CreateRequestError: If the API returns a non-201 status code during creation.
         """
-        response =  self._client._post(f"/{self.endpoint}/{str(self.id)}/uoms", json=uom_record.model_dump(exclude_unset=True, exclude_none=True))
+        response =  self._sync_client._post(f"/{self.endpoint}/{str(self.id)}/uoms", json=uom_record.model_dump(exclude_unset=True, exclude_none=True))
         if response.get('status_code') == 201:
             location = response.get('headers').get('location')
             parsed_url = urlparse(location)
             path_segments = parsed_url.path.rstrip("/").split("/")
             id = path_segments[-1]
-            return InventoryClient(self._client).items.get_uom(id)
+            return InventoryClient(self._sync_client).items.get_uom(id)
         else:
             error_message = response.get('content')
             raise CreateRequestError(self.endpoint, status_code=response.get('status_code'), error_message=error_message)
@@ -488,17 +724,22 @@ class item(APIResource[InventoryItem]):
         Raises:
             CreateRequestError: If the API returns a non-201 status code during creation.
         """
-        response =  self._client._post(f"/{self.endpoint}/{str(self.id)}/upcs", json=upc_record.model_dump(exclude_unset=True, exclude_none=True))
+        response =  self._sync_client._post(f"/{self.endpoint}/{str(self.id)}/upcs", json=upc_record.model_dump(exclude_unset=True, exclude_none=True))
         if response.get('status_code') == 201:
             location = response.get('headers').get('location')
             parsed_url = urlparse(location)
             path_segments = parsed_url.path.rstrip("/").split("/")
             id = path_segments[-1]
-            return InventoryClient(self._client).items.get_upc(id)
+            return InventoryClient(self._sync_client).items.get_upc(id)
         else:
             error_message = response.get('content')
             raise CreateRequestError(self.endpoint, status_code=response.get('status_code'), error_message=error_message)
-    
+
+
+# The 'item' argument of create_item shadows the wrapper class inside that method
+_item_resource = item
+
+
 class uom(APIResource[UnitOfMeasure]):
     Model = UnitOfMeasure
     _endpoint = ''  # Will be dynamically set in __init__
@@ -522,7 +763,7 @@ class uom(APIResource[UnitOfMeasure]):
             bool: True if the uom was successfully deleted (HTTP 204 or 200), False otherwise.
         """
         
-        return self._client._delete(f"/{self._endpoint}")
+        return self._sync_client._delete(f"/{self._endpoint}")
     
     def update(self, _uom: "uom" = None) -> 'uom':
         """
@@ -538,8 +779,8 @@ class uom(APIResource[UnitOfMeasure]):
             uom: The updated uom object reflecting the new status.
         """
         data = _uom.model_dump(exclude_unset=True, exclude_none=True) if _uom else self.model_dump(exclude_unset=True, exclude_none=True)
-        response = self._client._put(f"/{self._endpoint}", json=data)
-        return uom.from_json(response, self._client, item_id = self._item_id)    
+        response = self._sync_client._put(f"/{self._endpoint}", json=data)
+        return uom.from_json(response, self._sync_client, item_id = self._item_id)    
 
 class UpcClient():
 
@@ -651,7 +892,7 @@ class upc(APIResource[UPC]):
             bool: True if the upc was successfully deleted (HTTP 204 or 200), False otherwise.
         """
         
-        return self._client._delete(f"/{self._endpoint}")
+        return self._sync_client._delete(f"/{self._endpoint}")
     
     def update(self, _upc: "upc" = None) -> 'upc':
         """
@@ -667,5 +908,166 @@ class upc(APIResource[UPC]):
             upc: The updated upc object reflecting the new status.
         """
         data = _upc.model_dump(exclude_unset=True, exclude_none=True) if _upc else self.model_dump(exclude_unset=True, exclude_none=True)
-        response = self._client._put(f"/{self._endpoint}", json=data)
-        return upc.from_json(response, self._client, item_id = self._item_id)    
\ No newline at end of file
+        response = self._sync_client._put(f"/{self._endpoint}", json=data)
+        return upc.from_json(response, self._sync_client, item_id = self._item_id)    
+
+class AsyncInventoryClient():
+    """Asyncio counterpart of `InventoryClient`, grouping the async inventory clients."""
+
+    def __init__(self, client : AsyncSpireClient):
+        self.client = client
+        self.endpoint = 'inventory'
+        self.items = AsyncItemsClient(client=client)
+
+    def __getattr__(self, name):
+
+        if hasattr(self.items, name):
+            return getattr(self.items, name)
+        raise AttributeError(f"'AsyncInventoryClient' object has no attribute '{name}'")
+
+class AsyncItemsClient():
+    """
+    Asyncio counterpart of `ItemsClient`.
+
+    Returned `item` resources are read-only: their own request helpers (``update()``,
+    ``delete()``...) raise `TypeError`, so send writes through the coroutines on this client
+    (e.g. `update_item`).
+    """
+
+    def __init__(self, client : AsyncSpireClient):
+        self.client = client
+        self.endpoint = 'inventory/items'
+
+    async def get_item(self, id: int = None, part_no: str = None, warehouse: str = None, fields: Optional[List[str]] = None) -> "item":
+        """
+        Retrieve an inventory item by ID or (part_no + warehouse).
+
+        Args:
+            id (int, optional): The ID of the inventory item to retrieve.
+            part_no (str, optional): The part number of the item to retrieve.
+            warehouse (str, optional): The warehouse code where the item is located.
+            fields (List[str], optional): Only fetch these fields (dotted paths for nested fields).
+
+        Returns:
+            item: An `item` wrapper instance containing the retrieved data.
+
+        Raises:
+            ValueError: If neither ID nor (part_no and warehouse) are provided,
+                        or if no matching item is found.
+        """
+        if id is not None:
+            response = await self.client._get(f"/{self.endpoint}/{str(id)}", fields=fields)
+            return item.from_json(response, self.client)
+
+        elif part_no and warehouse:
+            items = await self.query_inventory_items(
+                filter={"partNo": part_no, "whse": warehouse},
+                fields=list(fields) + ["partNo", "whse"] if fields else None,
+            )
+            for itm in items:
+                if getattr(itm, "partNo", None) == part_no and getattr(itm, "whse", None) == warehouse:
+                    return itm
+            raise ValueError(f"No item found with part_no='{part_no}' and warehouse='{warehouse}'.")
+
+        else:
+            raise ValueError("You must provide either 'id' or both 'part_no' and 'warehouse'.")
+
+    async def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "item"]:
+        """
+        Retrieve many inventory items by ID in a handful of batched requests (see `ItemsClient.get_many`).
+
+        Returns:
+            Dict[int, item]: The items keyed by ID. IDs that were not found are left out.
+        """
+        return await self.client._get_many(self.endpoint, item, ids, chunk_size=chunk_size, detail=detail)
+
+    async def create_item(self, inventory_item : 'InventoryItem') -> 'item':
+        """
+        Create a new Inventory Item in Spire.
+
+        Args:
+            inventory_item (InventoryItem): An InventoryItem instance containing the item details.
+
+        Returns:
+            item: The created inventory item.
+
+        Raises:
+            CreateRequestError: If the creation fails or response is invalid.
+        """
+        response = await self.client._post(f"/{self.endpoint}", json=inventory_item.model_dump(exclude_unset=True, exclude_none=True))
+        if response.get('status_code') == 201:
+            location = response.get('headers').get('location')
+            parsed_url = urlparse(location)
+            path_segments = parsed_url.path.rstrip("/").split("/")
+            id = path_segments[-1]
+            return await self.get_item(id)
+        else:
+            error_message = response.get('content')
+            raise CreateRequestError(self.endpoint, status_code=response.get('status_code'), error_message=error_message)
+
+    async def update_item(self, id: int, inventory_item : 'InventoryItem') -> "item":
+        """
+        Update an existing Inventory Item by ID.
+
+        Args:
+            id (int): The ID of the item to update.
+            inventory_item (InventoryItem): An InventoryItem instance with the updated details.
+
+        Returns:
+            item: The updated inventory item.
+        """
+        response = await self.client._put(f"/{self.endpoint}/{str(id)}", json=inventory_item.model_dump(exclude_none=True, exclude_unset=True))
+        return item.from_json(response, self.client)
+
+    async def delete_item(self, id: int) -> bool:
+        """
+        Delete an inventory item by its ID.
+
+        Args:
+            id (int): The ID of the inventory item to delete.
+
+        Returns:
+            bool: True if the item was successfully deleted, False otherwise.
+        """
+        return await self.client._delete(f"/{self.endpoint}/{str(id)}")
+
+    async def query_inventory_items(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        fields: Optional[List[str]] = None,
+        **extra_params
+    ) -> List["item"]:
+        """
+        Query inventory items with optional full-text search, filtering, multi-field sorting, and pagination.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"partNo": "asc", "whse": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            fields (List[str], optional): Only fetch these fields of each record (dotted paths for nested fields).
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            List[item]: List of wrapped inventory item resources.
+        """
+        return await self.client._query(
+            endpoint=self.endpoint,
+            resource_cls=item,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            fields=fields,
+            **extra_params
+        )
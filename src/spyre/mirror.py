@@ -0,0 +1,356 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .Models.typed_models import DECIMAL_FIELDS
+
+# Operators of the Spire filter syntax that can be answered from the mirror; NULL never equals a value, so $ne keeps it
+_COMPARISONS = {"$eq": "=", "$ne": "IS NOT", "$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+class MirrorTable():
+    """Describes the SQLite table that mirrors one Spire endpoint and the fields it indexes."""
+
+    def __init__(self, name: str, columns: List[str], indexes: Optional[List[Tuple[str, ...]]] = None):
+        """
+        Args:
+            name (str): Name of the SQLite table.
+            columns (list): Top-level record fields stored in their own indexed columns.
+            indexes (list, optional): Column tuples to index together. Defaults to one index per column.
+        """
+        self.name = name
+        self.columns = columns
+        self.indexes = indexes if indexes is not None else [(column,) for column in columns]
+
+
+# The endpoints mirrored out of the box
+MIRROR_TABLES: Dict[str, MirrorTable] = {
+    "inventory/items": MirrorTable("inventory_items", ["partNo", "whse"], indexes=[("partNo", "whse"), ("whse",)]),
+    "customers": MirrorTable("customers", ["customerNo"]),
+    "sales/orders": MirrorTable("sales_orders", ["orderNo"]),
+    "sales/invoices": MirrorTable("invoices", ["invoiceNo", "orderNo"]),
+    "purchasing/orders": MirrorTable("purchase_orders", ["number"]),
+}
+
+
+class SQLiteMirror():
+    """
+    Local SQLite copy of the records returned by the Spire API.
+
+    Pass an instance to `SpireClient` (or `Spire`) and every record returned by queries, GETs and
+    PUTs on a mirrored endpoint is saved. Records are stored as JSON next to indexed key columns
+    (``partNo``/``whse``, ``customerNo``, ``orderNo``, ``invoiceNo`` and ``number``). With
+    ``read_from_mirror`` enabled on the client, single-record GETs and filtered queries are then
+    answered locally instead of over the network.
+
+    List records can omit details such as line items, so a record is only served to a GET once a
+    full record has been saved for it. Saving a record merges it into the stored JSON. Queries are
+    only answered for endpoints marked as loaded, which happens after an unfiltered ``all=True``
+    query or a `SyncEngine` sync, so a partly filled mirror never returns partial results.
+
+    Example:
+        mirror = SQLiteMirror("spire.db")
+        client = Spire(host, company, username, password, mirror=mirror)
+        client.inventory.query_inventory_items(all=True)          # fills the mirror
+        client.client.read_from_mirror = True
+        client.inventory.query_inventory_items(filter={"whse": "00"})   # answered locally
+    """
+
+    def __init__(self, path: str = ":memory:", tables: Optional[Dict[str, MirrorTable]] = None):
+        """
+        Args:
+            path (str, optional): Path of the SQLite database file. Defaults to an in-memory database.
+            tables (dict, optional): The mirrored endpoints and their tables. Defaults to `MIRROR_TABLES`.
+        """
+        self.path = path
+        self.tables = {endpoint.strip("/"): table for endpoint, table in (tables if tables is not None else MIRROR_TABLES).items()}
+        self._lock = threading.RLock()
+        # Pages are saved from the query worker threads, so access is serialised by the lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._create_tables()
+        with self._lock:
+            self._loaded = {endpoint for (endpoint,) in self._connection.execute("SELECT endpoint FROM mirror_state")}
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _create_tables(self):
+        with self._lock, self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS mirror_state (endpoint TEXT PRIMARY KEY, loaded_at TEXT NOT NULL)")
+            for table in self.tables.values():
+                columns = "".join(f', "{column}"' for column in table.columns)
+                self._connection.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{table.name}" '
+                    f'(id INTEGER PRIMARY KEY, complete INTEGER NOT NULL DEFAULT 0, modified TEXT{columns}, data TEXT NOT NULL)'
+                )
+                for index in table.indexes:
+                    index_name = f"ix_{table.name}_{'_'.join(index)}"
+                    index_columns = ", ".join(f'"{column}"' for column in index)
+                    self._connection.execute(f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table.name}" ({index_columns})')
+
+    def match(self, path: str) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Split an API path into its mirrored endpoint and record ID.
+
+        Returns:
+            Tuple[Optional[str], Optional[int]]: ``(endpoint, id)`` for a record path, ``(endpoint, None)``
+                for a collection path, and ``(None, None)`` if the path is not mirrored.
+        """
+        path = path.strip("/")
+        if path in self.tables:
+            return path, None
+        endpoint, _, id = path.rpartition("/")
+        if endpoint in self.tables and id.isdigit():
+            return endpoint, int(id)
+        return None, None
+
+    def is_loaded(self, endpoint: str) -> bool:
+        """Return True if every record of the endpoint has been saved, so queries can be answered locally."""
+        return endpoint.strip("/") in self._loaded
+
+    def mark_loaded(self, endpoint: str):
+        """Record that every record of a mirrored endpoint has been saved."""
+        endpoint = endpoint.strip("/")
+        if endpoint not in self.tables:
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO mirror_state (endpoint, loaded_at) VALUES (?, ?)",
+                (endpoint, datetime.now(timezone.utc).isoformat()),
+            )
+            self._loaded.add(endpoint)
+
+    def save(self, endpoint: str, records: Iterable[dict], complete: bool = False):
+        """
+        Save records of a mirrored endpoint, merging them into the stored copies.
+
+        Records flagged ``deleted`` (cancelled sales orders) are removed from the mirror instead.
+
+        Args:
+            endpoint (str): The API endpoint the records came from.
+            records (Iterable[dict]): The raw JSON records.
+            complete (bool, optional): True if these are full records from a single-record GET or PUT.
+        """
+        table = self.tables.get(endpoint.strip("/"))
+        if table is None:
+            return
+        columns = ["id", "complete", "modified"] + table.columns + ["data"]
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        updates = "".join(f', "{column}" = excluded."{column}"' for column in table.columns)
+        upsert = (
+            f'INSERT INTO "{table.name}" ({column_list}) VALUES ({placeholders}) '
+            # A list record with a newer stamp means the stored details (e.g. line items) may be stale
+            f'ON CONFLICT(id) DO UPDATE SET complete = CASE WHEN excluded.complete = 1 THEN 1 '
+            f'WHEN modified IS excluded.modified THEN complete ELSE 0 END, '
+            f'modified = excluded.modified{updates}, data = json_patch(data, excluded.data)'
+        )
+
+        rows = []
+        deleted = []
+        for record in records:
+            if record.get("id") is None:
+                continue
+            if record.get("deleted"):
+                deleted.append(record["id"])
+                continue
+            rows.append(
+                [record["id"], int(complete), record.get("modified") or record.get("lastModified")]
+                + [record.get(column) for column in table.columns]
+                + [json.dumps(record)]
+            )
+
+        with self._lock, self._connection:
+            self._connection.executemany(upsert, rows)
+            self._connection.executemany(f'DELETE FROM "{table.name}" WHERE id = ?', [(id,) for id in deleted])
+
+    def delete(self, endpoint: str, ids: Iterable[int]):
+        """Remove records of a mirrored endpoint by ID."""
+        table = self.tables.get(endpoint.strip("/"))
+        if table is None:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(f'DELETE FROM "{table.name}" WHERE id = ?', [(int(id),) for id in ids])
+
+    def clear(self, endpoint: Optional[str] = None):
+        """Remove every record of one mirrored endpoint, or of all of them."""
+        endpoints = [endpoint.strip("/")] if endpoint else list(self.tables)
+        with self._lock, self._connection:
+            for name in endpoints:
+                self._connection.execute(f'DELETE FROM "{self.tables[name].name}"')
+                self._connection.execute("DELETE FROM mirror_state WHERE endpoint = ?", (name,))
+                self._loaded.discard(name)
+
+    def get(self, endpoint: str, id: int, complete: bool = True) -> Optional[dict]:
+        """
+        Return a mirrored record by ID.
+
+        Args:
+            endpoint (str): The API endpoint (e.g. 'inventory/items').
+            id (int): The record ID.
+            complete (bool, optional): Only return records saved from a full GET or PUT. Default is True.
+
+        Returns:
+            dict: The raw JSON record, or None if it is not mirrored.
+        """
+        table = self.tables.get(endpoint.strip("/"))
+        if table is None:
+            return None
+        sql = f'SELECT data FROM "{table.name}" WHERE id = ?' + (" AND complete = 1" if complete else "")
+        with self._lock:
+            row = self._connection.execute(sql, (int(id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query(
+        self,
+        endpoint: str,
+        filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, str]] = None,
+        limit: Optional[int] = None,
+        start: int = 0,
+    ) -> Optional[Tuple[List[dict], int]]:
+        """
+        Answer a Spire-style filtered query from the mirror.
+
+        Supports equality, ``$eq``, ``$ne``, ``$gt``, ``$gte``, ``$lt``, ``$lte``, ``$in``, ``$nin``,
+        ``$and`` and ``$or`` on top-level and dotted fields. Decimal-string fields (`DECIMAL_FIELDS`)
+        and numeric operands are compared as numbers, and ``$ne``/``$nin`` match records without the
+        field, as the server does.
+
+        Args:
+            endpoint (str): The API endpoint (e.g. 'inventory/items').
+            filter (dict, optional): Filter in the Spire JSON filter syntax.
+            sort (dict, optional): Sorting rules (e.g., {"partNo": "asc"}).
+            limit (int, optional): Maximum number of records to return. Defaults to all.
+            start (int, optional): Number of matching records to skip.
+
+        Returns:
+            Tuple[List[dict], int]: The matching raw records and the total match count, or None if the
+                endpoint is not mirrored or loaded, or the filter uses syntax the mirror cannot evaluate.
+        """
+        table = self.tables.get(endpoint.strip("/"))
+        if table is None or not self.is_loaded(endpoint):
+            return None
+        compiled = _compile_filter(filter or {}, table)
+        if compiled is None:
+            return None
+        where, args = compiled
+
+        order = " ORDER BY id"
+        order_args: List[Any] = []
+        if sort:
+            terms = []
+            for field, direction in sort.items():
+                compiled_field = _field_sql(field, table)
+                if compiled_field is None:
+                    return None
+                terms.append(f"{compiled_field[0]} {'DESC' if direction.lower() == 'desc' else 'ASC'}")
+                order_args.extend(compiled_field[1])
+            order = " ORDER BY " + ", ".join(terms)
+
+        with self._lock:
+            count = self._connection.execute(f'SELECT count(*) FROM "{table.name}" WHERE {where}', args).fetchone()[0]
+            rows = self._connection.execute(
+                f'SELECT data FROM "{table.name}" WHERE {where}{order} LIMIT ? OFFSET ?',
+                args + order_args + [-1 if limit is None else limit, start],
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows], count
+
+
+def _field_sql(field: str, table: MirrorTable) -> Optional[Tuple[str, List[Any]]]:
+    """
+    Return the SQL expression reading a field and its arguments, or None if the field name cannot be used.
+
+    Indexed columns are known names; any other field is read with ``json_extract`` and its JSON
+    path is passed as a bound argument, never pasted into the SQL.
+    """
+    if field == "id" or field in table.columns:
+        return f'"{field}"', []
+    parts = field.split(".")
+    if any(not part or '"' in part for part in parts):
+        return None
+    return "json_extract(data, ?)", ["$" + "".join(f'."{part}"' for part in parts)]
+
+
+def _compile_filter(filter: Dict[str, Any], table: MirrorTable) -> Optional[Tuple[str, List[Any]]]:
+    """Translate a Spire JSON filter into a SQL WHERE clause, or None if it cannot be translated."""
+    clauses: List[str] = []
+    args: List[Any] = []
+
+    for key, value in filter.items():
+        if key in ("$and", "$or"):
+            if not isinstance(value, list):
+                return None
+            parts = [_compile_filter(part, table) for part in value]
+            if not parts or any(part is None for part in parts):
+                return None
+            joiner = " AND " if key == "$and" else " OR "
+            clauses.append("(" + joiner.join(sql for sql, _ in parts) + ")")
+            for _, part_args in parts:
+                args.extend(part_args)
+            continue
+        if key.startswith("$"):
+            return None
+
+        compiled_field = _field_sql(key, table)
+        if compiled_field is None:
+            return None
+        field, field_args = compiled_field
+        decimal = key.split(".")[-1] in DECIMAL_FIELDS
+        conditions = value if isinstance(value, dict) else {"$eq": value}
+        for operator, operand in conditions.items():
+            if operator in _COMPARISONS:
+                if operand is None:
+                    clauses.append(f"{field} IS {'NOT ' if operator == '$ne' else ''}NULL")
+                    args.extend(field_args)
+                    continue
+                compared = _comparison(field, [operand], decimal)
+                if compared is None:
+                    return None
+                sql, operands = compared
+                clauses.append(f"{sql} {_COMPARISONS[operator]} ?")
+                args.extend(field_args)
+                args.extend(operands)
+            elif operator in ("$in", "$nin") and isinstance(operand, list):
+                if not operand:
+                    clauses.append("0" if operator == "$in" else "1")
+                    continue
+                compared = _comparison(field, operand, decimal)
+                if compared is None:
+                    return None
+                sql, operands = compared
+                placeholders = ", ".join("?" for _ in operands)
+                if operator == "$in":
+                    clauses.append(f"{sql} IN ({placeholders})")
+                    args.extend(field_args)
+                else:
+                    clauses.append(f"({field} IS NULL OR {sql} NOT IN ({placeholders}))")
+                    args.extend(field_args * 2)
+                args.extend(operands)
+            else:
+                return None
+
+    return (" AND ".join(clauses) if clauses else "1"), args
+
+
+def _comparison(field: str, operands: List[Any], decimal: bool) -> Optional[Tuple[str, List[Any]]]:
+    """
+    Return the SQL expression to compare a field with, and the operands to bind.
+
+    Decimal-string fields, and any field compared with a number, are cast to REAL with numeric
+    operands, since SQLite orders text character by character and every TEXT above every number.
+    Returns None when such a comparison has an operand that is not a number.
+    """
+    numeric = [operand for operand in operands if isinstance(operand, (int, float)) and not isinstance(operand, bool)]
+    if not decimal and not numeric:
+        return field, operands
+    values = []
+    for operand in operands:
+        try:
+            values.append(float(operand))
+        except (TypeError, ValueError):
+            return None
+    return f"CAST({field} AS REAL)", values
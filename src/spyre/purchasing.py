@@ -1,7 +1,8 @@
-from .client import APIResource, SpireClient
+from .client import APIResource, SpireClient, AsyncSpireClient
 from requests.exceptions import HTTPError, RequestException
 from .Exceptions import CreateRequestError
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Iterator, Iterable, Callable, Tuple, Union
+from .bulk import BulkResult, BulkCheckpoint, run_bulk, update_one, update_key
 from urllib.parse import urlparse
 from .utils import *
 import json
@@ -10,37 +11,84 @@ from .Models.purchasing_models import PurchaseOrder
 
 class PurchasingClient:
 
-    def __init__(self, client: SpireClient):
+    def __init__(self, client: SpireClient, cache_po_numbers: bool = False):
+        """
+        Args:
+            client (SpireClient): The authenticated Spire client.
+            cache_po_numbers (bool, optional): If True, remember the ID of every purchase order looked up by
+                PO number so repeated lookups skip the search query. The GET by ID is still sent
+                unless the client's response cache or mirror can answer it. Default is False.
+        """
         self.client = client
         self.endpoint = "purchasing/orders"
+        self.cache_po_numbers = cache_po_numbers
+        self._po_ids: Dict[str, int] = {}
 
-    def get_purchase_order(self, id: int = None, PO_number: str = None) -> 'purchaseOrder':
+    def get_purchase_order(self, id: int = None, PO_number: str = None, fields: Optional[List[str]] = None) -> 'purchaseOrder':
         """
         Retrieve a purchase order by its ID or PO number.
 
         Args:
             id (int, optional): The ID of the purchase order to retrieve.
             PO_number (str, optional): The purchase order number of the purchase order to retrieve.
+            fields (List[str], optional): Only fetch these fields (dotted paths for nested fields). The
+                result is a partial model; other fields are left unset.
 
         Returns:
             purchaseOrder: A `purchaseOrder` wrapper instance containing the retrieved data.
 
+        Lookups by PO number find the ID with an exact ``number`` filter limited to a single record,
+        then fetch the order by ID, so they return the same full record as lookups by ID. When
+        ``cache_po_numbers`` is enabled, the ID of a matched purchase order is remembered and later
+        lookups of the same PO number skip the search. An uncached lookup costs two requests (the
+        search and the GET by ID), and a cached one still costs the GET unless the client has a
+        `ResponseCache` or a mirror read with ``read_from_mirror``, which answer it without a round trip.
+
         Raises:
             ValueError: If neither id nor PO_number is provided, or if no matching order is found.
         """
         if id is not None:
-            response = self.client._get(f"/{self.endpoint}/{str(id)}")
+            response = self.client._get(f"/{self.endpoint}/{str(id)}", fields=fields)
             return purchaseOrder.from_json(response, self.client)
         elif PO_number is not None:
-            orders = self.query_purchase_order(query=PO_number)
+            cached_id = self._po_ids.get(PO_number)
+            if cached_id is not None:
+                try:
+                    return self.get_purchase_order(cached_id, fields=fields)
+                except HTTPError as http_err:
+                    if http_err.response is None or http_err.response.status_code != 404:
+                        raise
+                    # The purchase order is gone, forget it and search again
+                    self._po_ids.pop(PO_number, None)
+
+            orders = self.query_purchase_order(filter={"number": PO_number}, limit=1, fields=["number"])
             for order in orders:
                 if getattr(order, "number", None) == PO_number:
-                    return self.get_purchase_order(order.id)
+                    if self.cache_po_numbers:
+                        self._po_ids[PO_number] = order.id
+                    return self.get_purchase_order(order.id, fields=fields)
             raise ValueError(f"No purchase order found for purchase order {PO_number}")
         else:
             raise ValueError("Either 'id' or 'PO_number' must be provided.")
 
-    def create_purchase_order(self, purchase_order: 'PurchaseOrder') -> 'purchaseOrder':
+    def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "purchaseOrder"]:
+        """
+        Retrieve many purchase orders by ID in a handful of batched requests.
+
+        IDs are looked up through ``{"id": {"$in": [...]}}`` filter queries instead of one GET each.
+
+        Args:
+            ids (Iterable[int]): The IDs of the purchase orders to retrieve.
+            detail (bool, optional): If True, fetch each record with its own GET (in parallel) to get the
+                full record, as list records can omit details.
+            chunk_size (int, optional): Number of IDs per filter query. Default is 100.
+
+        Returns:
+            Dict[int, purchaseOrder]: The purchase orders keyed by ID. IDs that were not found are left out.
+        """
+        return self.client._get_many(self.endpoint, purchaseOrder, ids, chunk_size=chunk_size, detail=detail)
+
+    def create_purchase_order(self, purchase_order: 'PurchaseOrder', fetch: bool = True) -> 'purchaseOrder':
         """
         Create a new purchase order.
 
@@ -48,6 +96,8 @@ class PurchasingClient:
 
         Args:
             purchase_order (dict): A PurchaseOrder instance containing the purchase order details.
+            fetch (bool, optional): If False, skip the follow-up GET and return a deferred handle holding
+                the new ID and the submitted fields; the full record is fetched lazily. Default is True.
 
         Returns:
             purchaseOrder: The create PurchaseOrder instance.
@@ -77,6 +127,8 @@ class PurchasingClient:
             parsed_url = urlparse(location)
             path_segments = parsed_url.path.rstrip("/").split("/")
             id = path_segments[-1]
+            if not fetch:
+                return purchaseOrder.deferred(purchase_order, id, self.client)
             return self.get_purchase_order(id)
         else:
             error_message = response.get('content')
@@ -104,6 +156,68 @@ class PurchasingClient:
             response = self.client._put(f"/{self.endpoint}/{str(id)}", json=purchase_order.model_dump(exclude_none=True, exclude_unset=True))
         return purchaseOrder.from_json(response, self.client)
 
+    def create_many(
+        self,
+        purchase_orders: Iterable['PurchaseOrder'],
+        *,
+        fetch: bool = False,
+        key: Optional[Callable[['PurchaseOrder'], Any]] = None,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Create many purchase orders concurrently.
+
+        Writes run through a bounded worker pool, and failures are collected on the result
+        instead of raised, so one rejected record does not stop the run.
+
+        Args:
+            purchase_orders (Iterable[PurchaseOrder]): The purchase orders to create.
+            fetch (bool, optional): Fetch each created order after its POST, as `create_purchase_order` does by default.
+                Default is False (deferred handles, one request per record).
+            key (callable, optional): Returns the stable key of a order, used by the result and the checkpoint
+                (e.g. ``lambda po: po.number``). Defaults to the order's position in ``purchase_orders``.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            checkpoint (BulkCheckpoint, optional): Skips purchase orders created by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The created purchase orders and the errors, keyed by order key.
+        """
+        return run_bulk(
+            lambda model: self.create_purchase_order(model, fetch=fetch),
+            purchase_orders,
+            key=key,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+        )
+
+    def update_many(
+        self,
+        purchase_orders: Iterable[Union["purchaseOrder", Tuple[int, 'PurchaseOrder']]],
+        *,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Update many purchase orders concurrently.
+
+        Args:
+            purchase_orders (Iterable[purchaseOrder | Tuple[int, PurchaseOrder]]): Wrapped purchase orders saved with their own
+                ``update()``, or ``(id, PurchaseOrder)`` pairs sent to `update_purchase_order`.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            checkpoint (BulkCheckpoint, optional): Skips purchase orders updated by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The updated purchase orders and the errors, keyed by ID.
+        """
+        return run_bulk(
+            update_one(self.update_purchase_order),
+            purchase_orders,
+            key=update_key,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+        )
+
     def delete_purchase_order(self, id: int) -> bool:
         """
         Delete a purchase order by its ID.
@@ -121,7 +235,10 @@ class PurchasingClient:
         if order.model.status in ("I", "R"):
             raise ValueError(f"Cannot delete an issued or received purchase order for {order.number}")
         else:
-            return self.client._delete(f"/{self.endpoint}/{str(id)}")
+            deleted = self.client._delete(f"/{self.endpoint}/{str(id)}")
+            if deleted:
+                self._po_ids.pop(order.number, None)
+            return deleted
 
     def query_purchase_order(
             self,
@@ -161,6 +278,150 @@ class PurchasingClient:
             **extra_params
         )
 
+    def iter_purchase_orders(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        prefetch: bool = True,
+        **extra_params
+    ) -> Iterator["purchaseOrder"]:
+        """
+        Stream purchase orders page by page instead of loading every page into memory.
+
+        Accepts the same arguments as the list query, but yields each purchaseOrder as its page arrives.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"date": "desc", "number": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, streams all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            prefetch (bool, optional): If True, fetches the next page while the current one is processed.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Yields:
+            purchaseOrder: Wrapped purchase order resources, one at a time.
+        """
+        return self.client._iter_query(
+            endpoint=self.endpoint,
+            resource_cls=purchaseOrder,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            prefetch=prefetch,
+            **extra_params
+        )
+
+    def query_purchase_orders_df(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+        **extra_params
+    ) -> "pandas.DataFrame":
+        """
+        Query purchase orders into a pandas DataFrame built straight from the page JSON, without creating `purchaseOrder` wrappers.
+
+        Nested fields are flattened into dotted columns and numeric strings such as ``total`` are
+        converted to float64. Pages are converted as they arrive, so large extracts never hold a
+        list of wrappers in memory.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"date": "desc", "number": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to keep (e.g., ["number", "vendor.vendorNo", "total"]). Defaults to every field.
+            explode (str, optional): A list field turned into one row per element (e.g., "items").
+            dtype_backend (str, optional): Passed to ``DataFrame.convert_dtypes`` (e.g., "pyarrow"). Default keeps NumPy dtypes.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            pandas.DataFrame: One row per purchase order, or per exploded element.
+        """
+        return self.client._query_frame(
+            endpoint=self.endpoint,
+            resource_cls=purchaseOrder,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            dtype_backend=dtype_backend,
+            **extra_params
+        )
+
+    def export_purchase_orders(
+        self,
+        path: str,
+        *,
+        format: Optional[str] = None,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = True,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        **extra_params
+    ) -> int:
+        """
+        Export purchase orders to a CSV, Excel (.xlsx) or Parquet file, streaming one page at a time.
+
+        Args:
+            path (str): The file to write. The format is taken from its extension unless ``format`` is given.
+            format (str, optional): "csv", "xlsx" or "parquet".
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"date": "desc", "number": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, exports all pages of results. Default is True.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to export (e.g., ["number", "vendor.vendorNo", "total"]). Defaults to the fields of the first page.
+            explode (str, optional): A list field written as one row per element (e.g., "items").
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            int: The number of rows written.
+        """
+        return self.client._export(
+            endpoint=self.endpoint,
+            resource_cls=purchaseOrder,
+            path=path,
+            format=format,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            **extra_params
+        )
+
     def issue_purchase_order(self, id:int) -> 'purchaseOrder':
         """
         Issue a purchase order by its ID.
@@ -178,36 +439,140 @@ class PurchasingClient:
         Raises:
             CreateRequestError: If the request fails or the API returns an error status.
         """
-        response = self.client._post(f"/{self.endpoint}/{str(id)}/issue")
-        if response.get("status_code") != 200:
-            raise CreateRequestError(f"Failed to issue purchase order: {id}: {response.text}")
-        return purchaseOrder.from_json(response, self.client)
-
-    def receive_purchase_order(self, id: int, receiveAll: bool = None) -> 'purchaseOrder':
+        return _order_action(self.client, self.endpoint, id, "issue")
+
+    def receive_purchase_order(
+        self,
+        id: int,
+        receiveAll: bool = None,
+        quantities: Optional[Dict[int, Any]] = None,
+    ) -> 'purchaseOrder':
         """
         Receive a purchase order by its ID.
 
         This updates the order in Spire to reflect that items have been received. 
         Typically, this should only be called on purchase orders with status "Issued".
+
+        When quantities are set, only the lines are fetched (a ``fields`` projection) and only the
+        changed ``receiveQty`` values are sent before the receive; lines that already hold the
+        requested quantity cost nothing, and an order with nothing to change is received with a
+        single request.
        
         Args:
             id (int): The ID of the purchaseOrder to receive.
             receiveAll (bool, optional): An optional boolean to recieve all quantites on the purchase order.
+            quantities (Dict[int, Any], optional): Quantities to receive keyed by line ``sequence``, for
+                partial receipts (e.g. ``{1: "5", 3: 2}``). Applied after ``receiveAll``.
 
         Returns:
             purchaseOrder: The updated purchase order object with the status set to "R" (Received).
 
-        Raises: CreateRequestError: If the request fails or the API returns an error status.
+        Raises:
+            CreateRequestError: If the request fails or the API returns an error status.
+            ValueError: If ``quantities`` references a sequence that is not on the order.
         """
-        if receiveAll:
-            order = self.get_purchase_order(id)
-            for item in order.model.items:
-                item.receiveQty = item.orderQty
-            order.update()
-        response = self.client._post(f"/{self.endpoint}/{str(id)}/receive")
-        if response.get("status_code") != 200:
-            raise CreateRequestError(f"Failed to receive purchase order: {id}: {response.text}")
-        return purchaseOrder.from_json(response, self.client)
+        if receiveAll or quantities:
+            order = self.get_purchase_order(id, fields=RECEIVE_FIELDS)
+            if set_receive_quantities(order.model.items or [], receiveAll, quantities):
+                order.update()
+        return _order_action(self.client, self.endpoint, id, "receive")
+
+    def issue_many(
+        self,
+        ids: Optional[Iterable[int]] = None,
+        *,
+        query: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        retries: int = 0,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Issue many purchase orders concurrently, as `issue_purchase_order` does for one.
+
+        Args:
+            ids (Iterable[int], optional): The IDs of the purchase orders to issue.
+            query (str, optional): Full-text search selecting the orders to issue, when no IDs are given.
+            filter (dict, optional): Filter selecting the orders to issue, when no IDs are given
+                (e.g. ``{"status": "O"}``). Only the IDs of the matching orders are fetched.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            retries (int, optional): Times an order is sent again after a connection error, timeout or 429/5xx
+                response. These come on top of the client's `TransportPolicy` retries, which already repeat
+                GET/PUT requests and connection failures, and they resend non-idempotent POST actions the
+                policy does not retry. Default is 0.
+            checkpoint (BulkCheckpoint, optional): Skips purchase orders issued by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The issued purchase orders and the errors, keyed by ID.
+
+        Raises:
+            ValueError: If neither ids nor a query or filter is provided.
+        """
+        return run_bulk(
+            self.issue_purchase_order,
+            self.client._select_ids(self.endpoint, purchaseOrder, ids, query, filter),
+            key=int,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+            retries=retries,
+        )
+
+    def receive_many(
+        self,
+        orders: Optional[Iterable[Union[int, "purchaseOrder", Tuple[int, Dict[int, Any]]]]] = None,
+        *,
+        query: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        receiveAll: bool = True,
+        max_workers: Optional[int] = None,
+        retries: int = 0,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Receive many purchase orders concurrently.
+
+        Receiving is not idempotent, so failed requests are not retried by default. Pass a
+        ``checkpoint`` to resume a run safely instead.
+
+        Args:
+            orders (Iterable, optional): Purchase order IDs, wrapped purchase orders (received with their own
+                `purchaseOrder.receive`, without another fetch), or ``(id, quantities)`` pairs for
+                partial receipts by line sequence.
+            query (str, optional): Full-text search selecting the orders to receive, when no orders are given.
+            filter (dict, optional): Filter selecting the orders to receive, when no orders are given.
+            receiveAll (bool, optional): Receive every line in full, for IDs and wrapped orders. Default is True.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            retries (int, optional): Times an order is sent again after a connection error, timeout or 429/5xx
+                response. These come on top of the client's `TransportPolicy` retries, which already repeat
+                GET/PUT requests and connection failures, and they resend non-idempotent POST actions the
+                policy does not retry. Default is 0.
+            checkpoint (BulkCheckpoint, optional): Skips purchase orders received by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The received purchase orders and the errors, keyed by ID.
+
+        Raises:
+            ValueError: If neither orders nor a query or filter is provided.
+        """
+        if orders is None:
+            orders = self.client._select_ids(self.endpoint, purchaseOrder, None, query, filter)
+
+        def receive(order):
+            if isinstance(order, tuple):
+                id, quantities = order
+                return self.receive_purchase_order(id, quantities=quantities)
+            if isinstance(order, purchaseOrder):
+                return order.receive(receiveAll=receiveAll)
+            return self.receive_purchase_order(order, receiveAll=receiveAll)
+
+        return run_bulk(
+            receive,
+            orders,
+            key=_order_key,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+            retries=retries,
+        )
 
 class PurchasingHistoryClient:
 
@@ -241,6 +606,23 @@ class PurchasingHistoryClient:
         else:
             raise ValueError("Either 'id' or 'PO_number' must be provided.")
 
+    def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "purchaseOrder"]:
+        """
+        Retrieve many archived purchase orders by ID in a handful of batched requests.
+
+        IDs are looked up through ``{"id": {"$in": [...]}}`` filter queries instead of one GET each.
+
+        Args:
+            ids (Iterable[int]): The IDs of the archived purchase orders to retrieve.
+            detail (bool, optional): If True, fetch each record with its own GET (in parallel) to get the
+                full record, as list records can omit details.
+            chunk_size (int, optional): Number of IDs per filter query. Default is 100.
+
+        Returns:
+            Dict[int, purchaseOrder]: The archived purchase orders keyed by ID. IDs that were not found are left out.
+        """
+        return self.client._get_many(self.endpoint, purchaseOrder, ids, chunk_size=chunk_size, detail=detail)
+
     def query_purchase_history_order(
             self,
             *,
@@ -297,10 +679,7 @@ class purchaseOrder(APIResource[PurchaseOrder]):
         Raise:
             CreateRequestError: If the request fails or the API returns an error status.
         """
-        response = self._client._post(f"/{self.endpoint}/{str(self.id)}/issue")
-        if response.get("status_code") != 200:
-            raise CreateRequestError(f"Failed to issue purchase order: {self.id}: {response.text}")
-        return purchaseOrder.from_json(response, self._client)
+        return _order_action(self._sync_client, self.endpoint, self.id, "issue")
 
     def delete(self) -> bool:
         """
@@ -311,13 +690,14 @@ class purchaseOrder(APIResource[PurchaseOrder]):
         Returns:
             bool: True if the order was successfully deleted (HTTP 204 or 200), False otherwise.
         """
-        return self._client._delete(f"/{self.endpoint}/{str(self.id)}")
+        return self._sync_client._delete(f"/{self.endpoint}/{str(self.id)}")
     
     def update(self, order: "purchaseOrder" = None) -> 'purchaseOrder':
         """
         Update this sales order.
 
-        If no purchase order object is provided, updates the current instance on the server.
+        If no purchase order object is provided, sends only the fields changed since the instance was loaded
+        (see `APIResource.changes`), and nothing at all if no field changed.
         If a purchase order object is provided, updates the purchase order using the given data.
 
         Args:
@@ -326,20 +706,25 @@ class purchaseOrder(APIResource[PurchaseOrder]):
         Returns: 
             purchaseOrder: The updated purchaseOrder object reflecting the new status.
         """
-        data = order.model_dump(exclude_unset=True, exclude_none=True) if order else self.model_dump(exclude_unset=True, exclude_none=True)
-        response = self._client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
-        return purchaseOrder.from_json(response, self._client)
+        data = order.model_dump(exclude_unset=True, exclude_none=True) if order else self.changes()
+        if not data:
+            return self
+        response = self._sync_client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
+        return purchaseOrder.from_json(response, self._sync_client)
     
-    def receive(self, receiveAll: bool = None) -> 'purchaseOrder':
+    def receive(self, receiveAll: bool = None, quantities: Optional[Dict[int, Any]] = None) -> 'purchaseOrder':
         """
         Receive this purchase order.
 
         Sends a POST request to Spire to change the purchase order's status to
         "R" (Received). Receiving an order typically means the received quantites have been
-        entered and the order is ready to be invoiced.
+        entered and the order is ready to be invoiced. Changed receive quantities are saved
+        first with `update`, which only sends the changed lines. If the order was loaded without
+        its lines (e.g. from a list query), they are fetched first, as `receive_purchase_order` does.
 
         Args:
             receiveAll (bool, optional): An optional boolean to recieve all quantites on the purchase order.
+            quantities (Dict[int, Any], optional): Quantities to receive keyed by line ``sequence``, for partial receipts.
 
         Returns:
             purchaseOrder: The updated purchase order object with the status set to "R" (Received).
@@ -347,17 +732,228 @@ class purchaseOrder(APIResource[PurchaseOrder]):
         Raise: 
             CreateRequestError: If the request fails or the API returns an error status.
         """
-        if receiveAll:
-            for item in self.model.items:
-                item.receiveQty = item.orderQty
+        if (receiveAll or quantities) and self.model.items is None:
+            # List records can omit the lines; fetch them instead of receiving nothing
+            return PurchasingClient(self._sync_client).receive_purchase_order(self.id, receiveAll=receiveAll, quantities=quantities)
+        if (receiveAll or quantities) and set_receive_quantities(self.model.items, receiveAll, quantities):
             self.update()
-        response = self._client._post(f"/{self.endpoint}/{str(self.id)}/receive")
-        if response.get('status_code') != 200:
-            raise CreateRequestError(f"Failed to receive purchase order: {self.id}. (Check Order Quantites): {response.text}")
-        return purchaseOrder.from_json(response, self._client)
+        return _order_action(self._sync_client, self.endpoint, self.id, "receive")
       
         
         
             
     
 
+
+
+class AsyncPurchasingClient:
+    """
+    Asyncio counterpart of `PurchasingClient`.
+
+    Returned `purchaseOrder` resources are read-only: their own request helpers (``update()``,
+    ``issue()``, ``receive()``...) raise `TypeError`, so send writes through the coroutines on this
+    client (e.g. `update_purchase_order`).
+    """
+
+    def __init__(self, client: AsyncSpireClient):
+        self.client = client
+        self.endpoint = "purchasing/orders"
+
+    async def get_purchase_order(self, id: int = None, PO_number: str = None, fields: Optional[List[str]] = None) -> 'purchaseOrder':
+        """
+        Retrieve a purchase order by its ID or PO number.
+
+        Args:
+            id (int, optional): The ID of the purchase order to retrieve.
+            PO_number (str, optional): The purchase order number of the purchase order to retrieve.
+            fields (List[str], optional): Only fetch these fields (dotted paths for nested fields).
+
+        Returns:
+            purchaseOrder: A `purchaseOrder` wrapper instance containing the retrieved data.
+
+        Raises:
+            ValueError: If neither id nor PO_number is provided, or if no matching order is found.
+        """
+        if id is not None:
+            response = await self.client._get(f"/{self.endpoint}/{str(id)}", fields=fields)
+            return purchaseOrder.from_json(response, self.client)
+        elif PO_number is not None:
+            orders = await self.query_purchase_order(filter={"number": PO_number}, limit=1, fields=["number"])
+            for order in orders:
+                if getattr(order, "number", None) == PO_number:
+                    return await self.get_purchase_order(order.id, fields=fields)
+            raise ValueError(f"No purchase order found for purchase order {PO_number}")
+        else:
+            raise ValueError("Either 'id' or 'PO_number' must be provided.")
+
+    async def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "purchaseOrder"]:
+        """
+        Retrieve many purchase orders by ID in a handful of batched requests (see `PurchasingClient.get_many`).
+
+        Returns:
+            Dict[int, purchaseOrder]: The purchase orders keyed by ID. IDs that were not found are left out.
+        """
+        return await self.client._get_many(self.endpoint, purchaseOrder, ids, chunk_size=chunk_size, detail=detail)
+
+    async def create_purchase_order(self, purchase_order: 'PurchaseOrder') -> 'purchaseOrder':
+        """
+        Create a new purchase order.
+
+        Args:
+            purchase_order (PurchaseOrder): A PurchaseOrder instance containing the purchase order details.
+
+        Returns:
+            purchaseOrder: The created purchase order.
+
+        Raises:
+            CreateRequestError: If the creation fails or response is invalid.
+        """
+        payload = json.loads(purchase_order.model_dump_json(exclude_unset=True, exclude_none=True, by_alias=True))
+        response = await self.client._post(f"/{self.endpoint}", json=payload)
+        if response.get('status_code') == 201:
+            location = response.get('headers').get('location')
+            parsed_url = urlparse(location)
+            path_segments = parsed_url.path.rstrip("/").split("/")
+            id = path_segments[-1]
+            return await self.get_purchase_order(id)
+        else:
+            error_message = response.get('content')
+            raise CreateRequestError(self.endpoint, status_code=response.get('status_code'), error_message=error_message)
+
+    async def update_purchase_order(self, id: int, purchase_order: 'PurchaseOrder') -> 'purchaseOrder':
+        """
+        Update an existing purchase order by ID.
+
+        Args:
+            id (int): The ID of the purchase order to update.
+            purchase_order (PurchaseOrder): A PurchaseOrder instance with the purchase order details.
+
+        Returns:
+            purchaseOrder: The updated purchase order.
+
+        Raises:
+            ValueError: If the purchase order has already been issued.
+        """
+        if purchase_order.status == "I":
+            raise ValueError(f"Cannot update an issued purchase order for {purchase_order.number}")
+        response = await self.client._put(f"/{self.endpoint}/{str(id)}", json=purchase_order.model_dump(exclude_none=True, exclude_unset=True))
+        return purchaseOrder.from_json(response, self.client)
+
+    async def delete_purchase_order(self, id: int) -> bool:
+        """
+        Delete a purchase order by its ID.
+
+        Args:
+            id (int): The ID of the purchase order to delete.
+
+        Returns:
+            bool: True if the purchase order was successfully deleted, False otherwise.
+
+        Raises:
+            ValueError: If the purchase order has been issued or received.
+        """
+        order = await self.get_purchase_order(id)
+        if order.model.status in ("I", "R"):
+            raise ValueError(f"Cannot delete an issued or received purchase order for {order.number}")
+        return await self.client._delete(f"/{self.endpoint}/{str(id)}")
+
+    async def query_purchase_order(
+            self,
+            *,
+            query: Optional[str] = None,
+            sort: Optional[Dict[str,str]] = None,
+            filter: Optional[Dict[str, Any]] = None,
+            all: bool = False,
+            limit: int = 1000,
+            start: int = 0,
+            fields: Optional[List[str]] = None,
+            **extra_params
+    ) -> List["purchaseOrder"]:
+        """
+        Query purchase orders with optional full-text search, filtering, multi-field sorting, and pagination.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"date": "desc", "number": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            fields (List[str], optional): Only fetch these fields of each record (dotted paths for nested fields).
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            List[purchaseOrder]: List of wrapped purchase order resources.
+        """
+        return await self.client._query(
+            endpoint=self.endpoint,
+            resource_cls=purchaseOrder,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            fields=fields,
+            **extra_params
+        )
+
+
+# The line fields a receipt needs, fetched instead of the whole order
+RECEIVE_FIELDS = ["items.id", "items.sequence", "items.orderQty", "items.receiveQty"]
+
+
+def set_receive_quantities(items: List[Any], receive_all: bool = None, quantities: Optional[Dict[int, Any]] = None) -> bool:
+    """
+    Set the ``receiveQty`` of purchase order lines for a receipt.
+
+    Args:
+        items (List[PurchaseOrderItem]): The lines of the order.
+        receive_all (bool, optional): Receive the full ``orderQty`` of every line.
+        quantities (Dict[int, Any], optional): Quantities keyed by line ``sequence``, applied after ``receive_all``.
+
+    Returns:
+        bool: True if any line changed.
+
+    Raises:
+        ValueError: If ``quantities`` references a sequence that is not on the order.
+    """
+    targets = {line.sequence: line.orderQty for line in items} if receive_all else {}
+    if quantities:
+        unknown = set(quantities) - {line.sequence for line in items}
+        if unknown:
+            raise ValueError(f"No purchase order line with sequence {sorted(unknown)}")
+        targets.update({sequence: str(qty) for sequence, qty in quantities.items()})
+    changed = False
+    for line in items:
+        if line.sequence in targets and line.receiveQty != targets[line.sequence]:
+            line.receiveQty = targets[line.sequence]
+            changed = True
+    return changed
+
+
+def _order_action(client: SpireClient, endpoint: str, id: int, action: str) -> 'purchaseOrder':
+    """POST a purchase order action such as ``issue`` or ``receive`` and return the updated order."""
+    path = f"/{endpoint}/{str(id)}/{action}"
+    response = client._post(path)
+    status_code = response.get("status_code")
+    content = response.get("content")
+    if not 200 <= status_code < 300:
+        raise CreateRequestError(
+            path,
+            status_code=status_code,
+            error_message=f"Failed to {action} purchase order {id}: {content}",
+            response_body=content if isinstance(content, dict) else None,
+        )
+    if isinstance(content, dict) and content.get("id") is not None:
+        return purchaseOrder.from_json(content, client)
+    return purchaseOrder.from_json(client._get(f"{endpoint}/{str(id)}"), client)
+
+
+def _order_key(order: Union[int, 'purchaseOrder', Tuple[int, Dict[int, Any]]]) -> int:
+    """Return the ID of a record passed to ``receive_many``."""
+    if isinstance(order, tuple):
+        return order[0]
+    if isinstance(order, purchaseOrder):
+        return order.id
+    return int(order)
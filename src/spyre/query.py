@@ -0,0 +1,213 @@
+import json
+import types
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+COMPARISON_OPERATORS: FrozenSet[str] = frozenset({"$eq", "$ne", "$gt", "$gte", "$lt", "$lte", "$in", "$nin"})
+LOGICAL_OPERATORS: FrozenSet[str] = frozenset({"$and", "$or"})
+
+# ``X | Y`` unions have their own origin from Python 3.10
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+
+class Query():
+    """
+    A reusable query: free-text search, filter and sort, validated and serialised once.
+
+    The filter is encoded to JSON when the query is built, and validated against a model the
+    first time it is used with it: every field path, including dotted paths into nested models
+    (``customer.customerNo``) and the fields inside ``$and``/``$or`` branches, and every operator.
+    The resulting parameters are cached per model, so running the same query again, or paging
+    through it, does no further work.
+
+    A `Query` is passed as the ``query`` argument of any ``query_*``, ``iter_*``, ``*_df`` or
+    ``export_*`` method, in place of the ``query``, ``filter`` and ``sort`` arguments.
+
+    Example:
+        open_orders = Query({"$or": [{"status": "O"}, {"status": "H"}], "customer.customerNo": "C100"}, sort={"orderNo": "desc"})
+        orders = client.orders.query_sales_orders(query=open_orders, all=True)
+
+        # Saved queries round-trip through plain JSON
+        saved = json.dumps(open_orders.to_dict())
+        open_orders = Query.from_dict(json.loads(saved))
+    """
+
+    def __init__(self, filter: Optional[Dict[str, Any]] = None, *, sort: Optional[Dict[str, str]] = None, search: Optional[str] = None):
+        """
+        Args:
+            filter (dict, optional): Filter in the Spire JSON filter syntax.
+            sort (dict, optional): Sorting rules (e.g., {"orderDate": "desc", "orderNo": "asc"}).
+            search (str, optional): Free-text search, sent as the ``q`` parameter.
+
+        Raises:
+            ValueError: If a sort direction is not "asc" or "desc".
+            TypeError: If the filter cannot be encoded to JSON.
+        """
+        self._filter_json = json.dumps(filter) if filter else None
+        # A private copy, so later changes to the caller's dict cannot diverge from the encoded filter
+        self.filter: Optional[Dict[str, Any]] = json.loads(self._filter_json) if filter else None
+        self.sort: Optional[Dict[str, str]] = dict(sort) if sort else None
+        self.search = search or None
+
+        invalid_directions = [direction for direction in (self.sort or {}).values() if str(direction).lower() not in ("asc", "desc")]
+        if invalid_directions:
+            raise ValueError(f"Invalid sort direction(s): {invalid_directions}. Expected 'asc' or 'desc'")
+
+        params: List[Tuple[str, Any]] = []
+        if self.search:
+            params.append(("q", self.search))
+        if self._filter_json:
+            params.append(("filter", self._filter_json))
+        for field, direction in (self.sort or {}).items():
+            params.append(("sort", f"{'-' if direction.lower() == 'desc' else ''}{field}"))
+        self._params = tuple(params)
+        self._validated: Set[Type[BaseModel]] = set()
+
+    def params(self, model: Type[BaseModel]) -> List[Tuple[str, Any]]:
+        """
+        Return the query parameters (``q``, ``filter`` and ``sort``), validating them against a model on first use.
+
+        Raises:
+            ValueError: If the filter or sort references fields that are not on the model, or unknown operators.
+        """
+        if model not in self._validated:
+            validate_filter(self.filter, model)
+            validate_sort(self.sort, model)
+            self._validated.add(model)
+        return list(self._params)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the query as plain JSON-compatible data, for `from_dict`."""
+        return {key: value for key, value in (("filter", self.filter), ("sort", self.sort), ("search", self.search)) if value}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Query":
+        """Build a query saved with `to_dict`."""
+        return cls(data.get("filter"), sort=data.get("sort"), search=data.get("search"))
+
+    def __repr__(self) -> str:
+        return f"Query({self.to_dict()})"
+
+
+def as_query(query: Optional[Union[str, Query]], filter: Optional[Dict[str, Any]] = None, sort: Optional[Dict[str, str]] = None) -> Query:
+    """
+    Return ``query`` if it is a `Query`, or a new one built from free-text search, filter and sort arguments.
+
+    Raises:
+        ValueError: If a `Query` is combined with separate filter or sort arguments.
+    """
+    if isinstance(query, Query):
+        if filter or sort:
+            raise ValueError("Pass the filter and sort on the Query, not alongside it.")
+        return query
+    return Query(filter, sort=sort, search=query)
+
+
+def validate_filter(filter: Optional[Dict[str, Any]], model: Type[BaseModel]) -> None:
+    """
+    Check a Spire JSON filter against a model.
+
+    Field keys may be dotted paths into nested models; values are either a literal (equality)
+    or an object of comparison operators. ``$and`` and ``$or`` take a list of filters.
+
+    Raises:
+        ValueError: If the filter references fields that are not on the model, or unknown operators.
+    """
+    invalid_fields: List[str] = []
+    invalid_operators: List[str] = []
+    _check_filter(filter or {}, model, "", invalid_fields, invalid_operators)
+    if invalid_fields:
+        raise ValueError(f"Invalid filter field(s): {invalid_fields}. for {model.__name__} ")
+    if invalid_operators:
+        raise ValueError(f"Invalid filter operator(s): {invalid_operators}. for {model.__name__} ")
+
+
+def validate_sort(sort: Optional[Dict[str, str]], model: Type[BaseModel]) -> None:
+    """
+    Check the fields of sorting rules against a model, as `validate_filter` does for filter fields.
+
+    Raises:
+        ValueError: If a sort field is not on the model.
+    """
+    invalid_fields = [field for field in (sort or {}) if not _resolve_path(model, field.split("."))[0]]
+    if invalid_fields:
+        raise ValueError(f"Invalid sort field(s): {invalid_fields}. for {model.__name__} ")
+
+
+def _check_filter(filter: Any, model: Optional[Type[BaseModel]], prefix: str, invalid_fields: List[str], invalid_operators: List[str]) -> None:
+    if not isinstance(filter, dict):
+        invalid_operators.append(f"{prefix or 'filter'}: expected an object, got {type(filter).__name__}")
+        return
+    for key, value in filter.items():
+        if key in LOGICAL_OPERATORS:
+            if not isinstance(value, list) or not value:
+                invalid_operators.append(f"{key}: expected a non-empty list of filters")
+                continue
+            for branch in value:
+                _check_filter(branch, model, prefix, invalid_fields, invalid_operators)
+            continue
+        if key.startswith("$"):
+            invalid_operators.append(key)
+            continue
+
+        path = f"{prefix}{key}"
+        valid, nested = _resolve_path(model, key.split(".")) if model is not None else (True, None)
+        if not valid:
+            invalid_fields.append(path)
+            continue
+        if not isinstance(value, dict):
+            continue
+        operators = [name for name in value if name.startswith("$")]
+        if not operators:
+            # An object of nested fields, e.g. {"customer": {"customerNo": "C100"}}
+            _check_filter(value, nested, f"{path}.", invalid_fields, invalid_operators)
+            continue
+        for operator, operand in value.items():
+            if operator not in COMPARISON_OPERATORS:
+                invalid_operators.append(f"{path}: {operator}")
+            elif operator in ("$in", "$nin") and not isinstance(operand, list):
+                invalid_operators.append(f"{path}: {operator} expects a list")
+
+
+def _resolve_path(model: Type[BaseModel], parts: List[str]) -> Tuple[bool, Optional[Type[BaseModel]]]:
+    """
+    Follow a field path through nested models.
+
+    Returns whether the path exists, and the model the path ends on (None for plain values).
+    Paths into untyped values (``Dict[str, Any]``, ``Any``) are accepted as they are.
+    """
+    current: Optional[Type[BaseModel]] = model
+    for index, part in enumerate(parts):
+        if current is None:
+            return False, None
+        field = current.model_fields.get(part)
+        if field is None:
+            return False, None
+        current = _nested_model(field.annotation)
+        if current is None and index < len(parts) - 1 and _is_untyped(field.annotation):
+            return True, None
+    return True, current
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Return the model inside an annotation such as ``Optional[Address]`` or ``List[SalesOrderItem]``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+def _is_untyped(annotation: Any) -> bool:
+    """Return True for annotations whose nested keys are not described, such as ``Any``, ``dict`` or ``Dict[str, Any]``."""
+    if annotation is Any or annotation is dict or annotation is Dict:
+        return True
+    origin = get_origin(annotation)
+    if origin is dict:
+        return True
+    if origin in _UNION_ORIGINS:
+        return any(_is_untyped(arg) for arg in get_args(annotation))
+    return False
@@ -2,45 +2,95 @@ from .client import APIResource
 from .Models.sales_models import SalesOrder, SalesOrderItem, Invoice
 from .Models.shared_models import Note
 from .utils import *
-from .client import SpireClient
+from .client import SpireClient, AsyncSpireClient
 from urllib.parse import urlparse 
 from .Exceptions import CreateRequestError
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Iterator, Iterable, Callable, Tuple, Union
+from .bulk import BulkResult, BulkCheckpoint, run_bulk, update_one, update_key
 from .crm import note, CRMClient
+from requests.exceptions import HTTPError
 
 class OrdersClient():
 
-    def __init__(self, client: SpireClient):
+    def __init__(self, client: SpireClient, cache_order_numbers: bool = False):
+        """
+        Args:
+            client (SpireClient): The authenticated Spire client.
+            cache_order_numbers (bool, optional): If True, remember the ID of every order looked up by
+                order number so repeated lookups skip the search query. The GET by ID is still sent
+                unless the client's response cache or mirror can answer it. Default is False.
+        """
         self.client = client
         self.endpoint = "sales/orders"
+        self.cache_order_numbers = cache_order_numbers
+        self._order_ids: Dict[str, int] = {}
     
-    def get_sales_order(self, id: int = None, order_number: str = None) -> "salesOrder":
+    def get_sales_order(self, id: int = None, order_number: str = None, fields: Optional[List[str]] = None) -> "salesOrder":
         """
         Retrieve a sales order by its ID or order number.
 
         Args:
             id (int, optional): The ID of the sales order to retrieve.
             order_number (str, optional): The order number of the sales order to retrieve.
+            fields (List[str], optional): Only fetch these fields (dotted paths for nested fields). The
+                result is a partial model; other fields are left unset.
 
         Returns:
             salesOrder: A `salesOrder` wrapper instance containing the retrieved data.
 
+        Lookups by order number find the ID with an exact ``orderNo`` filter limited to a single
+        record, then fetch the order by ID, so they return the same full record as lookups by ID.
+        When ``cache_order_numbers`` is enabled, the ID of a matched order is remembered and later
+        lookups of the same order number skip the search. An uncached lookup costs two requests
+        (the search and the GET by ID), and a cached one still costs the GET unless the client has a
+        `ResponseCache` or a mirror read with ``read_from_mirror``, which answer it without a round trip.
+
         Raises:
             ValueError: If neither id nor order_number is provided, or if no matching order is found.
         """
         if id is not None:
-            response = self.client._get(f"/{self.endpoint}/{str(id)}")
+            response = self.client._get(f"/{self.endpoint}/{str(id)}", fields=fields)
             return salesOrder.from_json(response, self.client)
         elif order_number is not None:
-            orders = self.query_sales_orders(query=order_number)
+            cached_id = self._order_ids.get(order_number)
+            if cached_id is not None:
+                try:
+                    return self.get_sales_order(cached_id, fields=fields)
+                except HTTPError as http_err:
+                    if http_err.response is None or http_err.response.status_code != 404:
+                        raise
+                    # The order is gone, forget it and search again
+                    self._order_ids.pop(order_number, None)
+
+            # Only the ID is searched for; list records can omit details such as line items
+            orders = self.query_sales_orders(filter={"orderNo": order_number}, limit=1, fields=["orderNo"])
             for order in orders:
                 if getattr(order, "orderNo", None) == order_number:
-                    return order
+                    if self.cache_order_numbers:
+                        self._order_ids[order_number] = order.id
+                    return self.get_sales_order(order.id, fields=fields)
             raise ValueError(f"No order found for order number {order_number}")
         else:
             raise ValueError("Either 'id' or 'order_number' must be provided.")
-    
-    def create_sales_order(self, sales_order : 'SalesOrder') -> 'salesOrder':
+
+    def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "salesOrder"]:
+        """
+        Retrieve many sales orders by ID in a handful of batched requests.
+
+        IDs are looked up through ``{"id": {"$in": [...]}}`` filter queries instead of one GET each.
+
+        Args:
+            ids (Iterable[int]): The IDs of the sales orders to retrieve.
+            detail (bool, optional): If True, fetch each record with its own GET (in parallel) to get the
+                full record, as list records can omit details.
+            chunk_size (int, optional): Number of IDs per filter query. Default is 100.
+
+        Returns:
+            Dict[int, salesOrder]: The sales orders keyed by ID. IDs that were not found are left out.
+        """
+        return self.client._get_many(self.endpoint, salesOrder, ids, chunk_size=chunk_size, detail=detail)
+
+    def create_sales_order(self, sales_order : 'SalesOrder', fetch: bool = True) -> 'salesOrder':
         """
         Create a new sales order.
 
@@ -48,6 +98,8 @@ class OrdersClient():
 
         Args:
             sales_order (dict): A SalesOrder instance containing the sales order details.
+            fetch (bool, optional): If False, skip the follow-up GET and return a deferred handle holding
+                the new ID and the submitted fields; the full record is fetched lazily. Default is True.
 
         Returns:
             salesOrder: The created SalesOrder instance.
@@ -62,6 +114,8 @@ class OrdersClient():
             parsed_url = urlparse(location)
             path_segments = parsed_url.path.rstrip("/").split("/")
             id = path_segments[-1]
+            if not fetch:
+                return salesOrder.deferred(sales_order, id, self.client)
             return self.get_sales_order(id)
         else:
             error_message = response.get('content')
@@ -86,6 +140,194 @@ class OrdersClient():
         response = self.client._put(f"/{self.endpoint}/{str(id)}", json=sales_order.model_dump(exclude_none=True, exclude_unset=True))
         return salesOrder.from_json(response, self.client)
 
+    def create_many(
+        self,
+        sales_orders: Iterable['SalesOrder'],
+        *,
+        fetch: bool = False,
+        key: Optional[Callable[['SalesOrder'], Any]] = None,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Create many sales orders concurrently.
+
+        Writes run through a bounded worker pool, and failures are collected on the result
+        instead of raised, so one rejected record does not stop the run.
+
+        Args:
+            sales_orders (Iterable[SalesOrder]): The sales orders to create.
+            fetch (bool, optional): Fetch each created order after its POST, as `create_sales_order` does by default.
+                Default is False (deferred handles, one request per record).
+            key (callable, optional): Returns the stable key of a order, used by the result and the checkpoint
+                (e.g. ``lambda o: o.orderNo``). Defaults to the order's position in ``sales_orders``.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            checkpoint (BulkCheckpoint, optional): Skips sales orders created by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The created sales orders and the errors, keyed by order key.
+        """
+        return run_bulk(
+            lambda model: self.create_sales_order(model, fetch=fetch),
+            sales_orders,
+            key=key,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+        )
+
+    def update_many(
+        self,
+        sales_orders: Iterable[Union["salesOrder", Tuple[int, 'SalesOrder']]],
+        *,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Update many sales orders concurrently.
+
+        Args:
+            sales_orders (Iterable[salesOrder | Tuple[int, SalesOrder]]): Wrapped sales orders saved with their own
+                ``update()``, or ``(id, SalesOrder)`` pairs sent to `update_sales_order`.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            checkpoint (BulkCheckpoint, optional): Skips sales orders updated by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The updated sales orders and the errors, keyed by ID.
+        """
+        return run_bulk(
+            update_one(self.update_sales_order),
+            sales_orders,
+            key=update_key,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+        )
+
+    def process_sales_order(self, id: int) -> 'salesOrder':
+        """
+        Set the status of a sales order to 'Processed' (status = 'P').
+
+        Args:
+            id (int): The ID of the sales order to process.
+
+        Returns:
+            salesOrder: The updated sales order.
+        """
+        response = self.client._put(f"/{self.endpoint}/{str(id)}", json={"status": "P"})
+        return salesOrder.from_json(response, self.client)
+
+    def invoice_sales_order(self, id: int) -> 'invoice':
+        """
+        Invoice a sales order by its ID.
+
+        Quotes (sales orders with type "Q") cannot be invoiced.
+
+        Args:
+            id (int): The ID of the sales order to invoice.
+
+        Returns:
+            invoice: The created invoice.
+
+        Raises:
+            CreateRequestError: If invoice creation failed.
+        """
+        path = f"/{self.endpoint}/{str(id)}/invoice"
+        response = self.client._post(path)
+        status_code = response.get('status_code')
+        content = response.get('content')
+        if not 200 <= status_code < 300:
+            raise CreateRequestError(
+                path,
+                status_code=status_code,
+                error_message=f"Failed to invoice sales order {id}: {content}",
+                response_body=content if isinstance(content, dict) else None,
+            )
+        data = content.get('invoice') if isinstance(content, dict) else None
+        if not isinstance(data, dict):
+            raise CreateRequestError(path, status_code=status_code, error_message=f"Sales order {id} was invoiced but the response did not include the invoice: {content}")
+        return invoice.from_json(data, self.client)
+
+    def process_many(
+        self,
+        ids: Optional[Iterable[int]] = None,
+        *,
+        query: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        retries: int = 0,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Process many sales orders concurrently, as `process_sales_order` does for one.
+
+        Args:
+            ids (Iterable[int], optional): The IDs of the sales orders to process.
+            query (str, optional): Full-text search selecting the orders to process, when no IDs are given.
+            filter (dict, optional): Filter selecting the orders to process, when no IDs are given
+                (e.g. ``{"status": "O"}``). Only the IDs of the matching orders are fetched.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            retries (int, optional): Times an order is sent again after a connection error, timeout or 429/5xx
+                response. These come on top of the client's `TransportPolicy` retries, which already repeat
+                GET/PUT requests and connection failures, and they resend non-idempotent POST actions the
+                policy does not retry. Default is 0.
+            checkpoint (BulkCheckpoint, optional): Skips sales orders processed by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The processed sales orders and the errors, keyed by ID.
+
+        Raises:
+            ValueError: If neither ids nor a query or filter is provided.
+        """
+        return run_bulk(
+            self.process_sales_order,
+            self.client._select_ids(self.endpoint, salesOrder, ids, query, filter),
+            key=int,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+            retries=retries,
+        )
+
+    def invoice_many(
+        self,
+        ids: Optional[Iterable[int]] = None,
+        *,
+        query: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        retries: int = 0,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Invoice many sales orders concurrently, as `invoice_sales_order` does for one.
+
+        Invoicing is not idempotent, so failed requests are not retried by default: a timeout can
+        hide an invoice that was created. Pass a ``checkpoint`` to resume a run safely instead.
+
+        Args:
+            ids (Iterable[int], optional): The IDs of the sales orders to invoice.
+            query (str, optional): Full-text search selecting the orders to invoice, when no IDs are given.
+            filter (dict, optional): Filter selecting the orders to invoice, when no IDs are given.
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            retries (int, optional): Times an order is sent again after a connection error, timeout or 429/5xx
+                response. These come on top of the client's `TransportPolicy` retries, which already repeat
+                GET/PUT requests and connection failures, and they resend non-idempotent POST actions the
+                policy does not retry. Default is 0.
+            checkpoint (BulkCheckpoint, optional): Skips sales orders invoiced by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The created invoices and the errors, keyed by sales order ID.
+
+        Raises:
+            ValueError: If neither ids nor a query or filter is provided.
+        """
+        return run_bulk(
+            self.invoice_sales_order,
+            self.client._select_ids(self.endpoint, salesOrder, ids, query, filter),
+            key=int,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+            retries=retries,
+        )
+
     def delete_sales_order(self, id: int) -> bool:
         """
         Delete a sales order by its ID.
@@ -99,7 +341,10 @@ class OrdersClient():
         Returns:
             bool: True if the sales order was successfully deleted, False otherwise.
         """
-        return self.client._delete(f"/{self.endpoint}/{str(id)}")
+        deleted = self.client._delete(f"/{self.endpoint}/{str(id)}")
+        if deleted:
+            self._order_ids = {number: order_id for number, order_id in self._order_ids.items() if order_id != int(id)}
+        return deleted
 
     def query_sales_orders(
         self,
@@ -138,6 +383,150 @@ class OrdersClient():
             start=start,
             **extra_params
         )
+
+    def iter_sales_orders(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        prefetch: bool = True,
+        **extra_params
+    ) -> Iterator["salesOrder"]:
+        """
+        Stream sales orders page by page instead of loading every page into memory.
+
+        Accepts the same arguments as the list query, but yields each salesOrder as its page arrives.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"orderDate": "desc", "orderNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, streams all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            prefetch (bool, optional): If True, fetches the next page while the current one is processed.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Yields:
+            salesOrder: Wrapped sales order resources, one at a time.
+        """
+        return self.client._iter_query(
+            endpoint=self.endpoint,
+            resource_cls=salesOrder,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            prefetch=prefetch,
+            **extra_params
+        )
+
+    def query_sales_orders_df(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+        **extra_params
+    ) -> "pandas.DataFrame":
+        """
+        Query sales orders into a pandas DataFrame built straight from the page JSON, without creating `salesOrder` wrappers.
+
+        Nested fields are flattened into dotted columns and numeric strings such as ``total`` are
+        converted to float64. Pages are converted as they arrive, so large extracts never hold a
+        list of wrappers in memory.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"orderDate": "desc", "orderNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to keep (e.g., ["orderNo", "customer.customerNo", "total"]). Defaults to every field.
+            explode (str, optional): A list field turned into one row per element (e.g., "items").
+            dtype_backend (str, optional): Passed to ``DataFrame.convert_dtypes`` (e.g., "pyarrow"). Default keeps NumPy dtypes.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            pandas.DataFrame: One row per sales order, or per exploded element.
+        """
+        return self.client._query_frame(
+            endpoint=self.endpoint,
+            resource_cls=salesOrder,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            dtype_backend=dtype_backend,
+            **extra_params
+        )
+
+    def export_sales_orders(
+        self,
+        path: str,
+        *,
+        format: Optional[str] = None,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = True,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        **extra_params
+    ) -> int:
+        """
+        Export sales orders to a CSV, Excel (.xlsx) or Parquet file, streaming one page at a time.
+
+        Args:
+            path (str): The file to write. The format is taken from its extension unless ``format`` is given.
+            format (str, optional): "csv", "xlsx" or "parquet".
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"orderDate": "desc", "orderNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, exports all pages of results. Default is True.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to export (e.g., ["orderNo", "customer.customerNo", "total"]). Defaults to the fields of the first page.
+            explode (str, optional): A list field written as one row per element (e.g., "items").
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            int: The number of rows written.
+        """
+        return self.client._export(
+            endpoint=self.endpoint,
+            resource_cls=salesOrder,
+            path=path,
+            format=format,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            **extra_params
+        )
     
     def create_sales_order_note(self, id: int , note_body : str, note_subject : str = "Note") -> note:
         """
@@ -172,7 +561,7 @@ class InvoiceClient():
         self.client = client
         self.endpoint = "sales/invoices"
 
-    def get_invoice(self, id: int) -> 'invoice':
+    def get_invoice(self, id: int, fields: Optional[List[str]] = None) -> 'invoice':
         """
         Retrieve a sales invoice by its ID.
 
@@ -180,13 +569,32 @@ class InvoiceClient():
 
         Args:
             id (int): The ID of the invoice to retrieve.
+            fields (List[str], optional): Only fetch these fields (dotted paths for nested fields). The
+                result is a partial model; other fields are left unset.
 
         Returns:
             invoice: An invoice instance created from the response data.
         """
-        response = self.client._get(f"/{self.endpoint}/{id}")
+        response = self.client._get(f"/{self.endpoint}/{id}", fields=fields)
         return invoice.from_json(response, self.client)
 
+    def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "invoice"]:
+        """
+        Retrieve many invoices by ID in a handful of batched requests.
+
+        IDs are looked up through ``{"id": {"$in": [...]}}`` filter queries instead of one GET each.
+
+        Args:
+            ids (Iterable[int]): The IDs of the invoices to retrieve.
+            detail (bool, optional): If True, fetch each record with its own GET (in parallel) to get the
+                full record, as list records can omit details.
+            chunk_size (int, optional): Number of IDs per filter query. Default is 100.
+
+        Returns:
+            Dict[int, invoice]: The invoices keyed by ID. IDs that were not found are left out.
+        """
+        return self.client._get_many(self.endpoint, invoice, ids, chunk_size=chunk_size, detail=detail)
+
     def update_invoice(self, id: int, invoice : Invoice) -> 'invoice':
         """
         Update an existing invoice by ID.
@@ -202,6 +610,87 @@ class InvoiceClient():
         """
         response = self.client._put(f"/{self.endpoint}/{id}", json=invoice.model_dump(exclude_none=True, exclude_unset=True))
         return invoice.from_json(response, self.client)
+
+    def reverse_many(
+        self,
+        ids: Optional[Iterable[int]] = None,
+        *,
+        query: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        fetch: bool = False,
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BulkCheckpoint] = None,
+    ) -> BulkResult:
+        """
+        Reverse many invoices into sales orders, as `invoice.reverse` does for one.
+
+        The invoices are pulled with batched ``$in`` queries (by ID) or one paginated query (by
+        ``query``/``filter``); only invoices whose list record omits the lines are fetched again
+        individually. They are converted with `create_sales_orders_from_invoices` and the orders
+        are created concurrently through `run_bulk`.
+
+        Args:
+            ids (Iterable[int], optional): The IDs of the invoices to reverse.
+            query (str, optional): Full-text search selecting the invoices to reverse, when no IDs are given.
+            filter (dict, optional): Filter selecting the invoices to reverse, when no IDs are given.
+            fetch (bool, optional): Fetch each created order after its POST. Default is False (deferred handles).
+            max_workers (int, optional): Number of concurrent requests. Defaults to the client's ``max_workers``.
+            checkpoint (BulkCheckpoint, optional): Skips invoices reversed by an earlier run and records new ones.
+
+        Returns:
+            BulkResult: The created sales orders and the errors, keyed by invoice ID. Requested IDs
+                that do not exist, and invoices that cannot be converted, are reported as failures.
+
+        Raises:
+            ValueError: If neither ids nor a query or filter is provided.
+        """
+        missing: List[int] = []
+        if ids is not None:
+            ids = list(dict.fromkeys(int(id) for id in ids))
+            found = self.get_many(ids)
+            missing = [id for id in ids if id not in found]
+            invoices = list(found.values())
+        elif query is not None or filter is not None:
+            invoices = self.query_invoices(query=query, filter=filter, all=True)
+        else:
+            raise ValueError("Either 'ids' or a 'query' or 'filter' must be provided.")
+
+        # Invoices reversed by an earlier run are neither fetched again nor converted
+        done = [inv.id for inv in invoices if checkpoint is not None and inv.id in checkpoint]
+        invoices = [inv for inv in invoices if checkpoint is None or inv.id not in checkpoint]
+
+        # List records can omit the lines, which the reversal needs
+        without_lines = [inv.id for inv in invoices if inv.items is None]
+        if without_lines:
+            detailed = self.get_many(without_lines, detail=True)
+            invoices = [detailed.get(inv.id, inv) for inv in invoices]
+
+        orders = OrdersClient(self.client)
+        conversion_errors: Dict[int, Exception] = {}
+        try:
+            converted = create_sales_orders_from_invoices(inv.model for inv in invoices)
+        except Exception:
+            # Convert one at a time so a malformed invoice only fails itself
+            converted = []
+            for inv in invoices:
+                try:
+                    converted.extend(create_sales_orders_from_invoices([inv.model]))
+                except Exception as err:
+                    conversion_errors[inv.id] = err
+                    converted.append(None)
+        pairs = [(inv, order) for inv, order in zip(invoices, converted) if order is not None]
+        result = run_bulk(
+            lambda pair: orders.create_sales_order(pair[1], fetch=fetch),
+            pairs,
+            key=lambda pair: pair[0].id,
+            max_workers=max_workers or self.client.max_workers,
+            checkpoint=checkpoint,
+        )
+        result.skipped.extend(done)
+        result.failed.update(conversion_errors)
+        for id in missing:
+            result.failed[id] = ValueError(f"No invoice found with ID {id}")
+        return result
     
     def query_invoices(
         self,
@@ -241,6 +730,150 @@ class InvoiceClient():
             **extra_params
         )
 
+    def iter_invoices(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        prefetch: bool = True,
+        **extra_params
+    ) -> Iterator["invoice"]:
+        """
+        Stream invoices page by page instead of loading every page into memory.
+
+        Accepts the same arguments as the list query, but yields each invoice as its page arrives.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"orderDate": "desc", "orderNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, streams all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            prefetch (bool, optional): If True, fetches the next page while the current one is processed.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Yields:
+            invoice: Wrapped invoice resources, one at a time.
+        """
+        return self.client._iter_query(
+            endpoint=self.endpoint,
+            resource_cls=invoice,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            prefetch=prefetch,
+            **extra_params
+        )
+
+    def query_invoices_df(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        dtype_backend: Optional[str] = None,
+        **extra_params
+    ) -> "pandas.DataFrame":
+        """
+        Query invoices into a pandas DataFrame built straight from the page JSON, without creating `invoice` wrappers.
+
+        Nested fields are flattened into dotted columns and numeric strings such as ``total`` are
+        converted to float64. Pages are converted as they arrive, so large extracts never hold a
+        list of wrappers in memory.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"invoiceDate": "desc", "invoiceNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to keep (e.g., ["invoiceNo", "customer.customerNo", "items.partNo", "items.unitPrice"]). Defaults to every field.
+            explode (str, optional): A list field turned into one row per element (e.g., "items" for one row per invoice line).
+            dtype_backend (str, optional): Passed to ``DataFrame.convert_dtypes`` (e.g., "pyarrow"). Default keeps NumPy dtypes.
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            pandas.DataFrame: One row per invoice, or per exploded element.
+        """
+        return self.client._query_frame(
+            endpoint=self.endpoint,
+            resource_cls=invoice,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            dtype_backend=dtype_backend,
+            **extra_params
+        )
+
+    def export_invoices(
+        self,
+        path: str,
+        *,
+        format: Optional[str] = None,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = True,
+        limit: int = 1000,
+        start: int = 0,
+        columns: Optional[List[str]] = None,
+        explode: Optional[str] = None,
+        **extra_params
+    ) -> int:
+        """
+        Export invoices to a CSV, Excel (.xlsx) or Parquet file, streaming one page at a time.
+
+        Args:
+            path (str): The file to write. The format is taken from its extension unless ``format`` is given.
+            format (str, optional): "csv", "xlsx" or "parquet".
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"invoiceDate": "desc", "invoiceNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, exports all pages of results. Default is True.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            columns (List[str], optional): Dotted column paths to export (e.g., ["invoiceNo", "customer.customerNo", "items.partNo", "items.unitPrice"]). Defaults to the fields of the first page.
+            explode (str, optional): A list field written as one row per element (e.g., "items" for one row per invoice line).
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            int: The number of rows written.
+        """
+        return self.client._export(
+            endpoint=self.endpoint,
+            resource_cls=invoice,
+            path=path,
+            format=format,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            columns=columns,
+            explode=explode,
+            **extra_params
+        )
+
 
 class salesOrder(APIResource[SalesOrder]):
     endpoint = "sales/orders/"
@@ -260,13 +893,7 @@ class salesOrder(APIResource[SalesOrder]):
             CreateRequestError: If invoice creation failed.
  
         """
-        response = self._client._post(f"/{self.endpoint}/{str(self.id)}/invoice")
-        if response.get('status_code') == 200:
-            data = response.get('content').get('invoice')
-            return salesOrder.from_json(json_data=data, client= self._client)
-        else:
-            error_message = response.get('content')
-            raise CreateRequestError(self.endpoint, status_code=response.get('status_code'), error_message=error_message)
+        return OrdersClient(self._sync_client).invoice_sales_order(self.id)
     
     def process(self) -> 'salesOrder':
         """
@@ -277,11 +904,7 @@ class salesOrder(APIResource[SalesOrder]):
         Returns:
             salesOrder: The updated salesOrder object reflecting the new status.
         """
-        response = self._client._put(
-            f"/{self.endpoint}/{str(self.id)}",
-            json={"status": "P"}    
-        )
-        return salesOrder.from_json(response, self._client)
+        return OrdersClient(self._sync_client).process_sales_order(self.id)
     
     def delete(self) -> bool:
         """
@@ -293,13 +916,14 @@ class salesOrder(APIResource[SalesOrder]):
             bool: True if the order was successfully deleted (HTTP 204 or 200), False otherwise.
         """
         
-        return self._client._delete(f"/{self.endpoint}/{str(self.id)}")
+        return self._sync_client._delete(f"/{self.endpoint}/{str(self.id)}")
     
     def update(self, order: "salesOrder" = None) -> 'salesOrder':
         """
         Update the sales order.
 
-        If no order object is provided, updates the current instance on the server.
+        If no order object is provided, sends only the fields changed since the instance was loaded
+        (see `APIResource.changes`), and nothing at all if no field changed.
         If an order object is provided, updates the sales order using the given data.
 
         Args:
@@ -308,9 +932,11 @@ class salesOrder(APIResource[SalesOrder]):
         Returns:
             salesOrder: The updated salesOrder object reflecting the new status.
         """
-        data = order.model_dump(exclude_unset=True, exclude_none=True) if order else self.model_dump(exclude_unset=True, exclude_none=True)
-        response = self._client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
-        return salesOrder.from_json(response, self._client)    
+        data = order.model_dump(exclude_unset=True, exclude_none=True) if order else self.changes()
+        if not data:
+            return self
+        response = self._sync_client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
+        return salesOrder.from_json(response, self._sync_client)    
 
     def add_note(self, note_body : "str" , note_subject : "str" = "Note") -> note:
         """
@@ -325,13 +951,13 @@ class salesOrder(APIResource[SalesOrder]):
         """
 
         note_model = Note(body=note_body, subject=note_subject)
-        response =  self._client._post(f"/{self.endpoint}/{str(self.id)}/notes/", json=note_model.model_dump(exclude_unset=True, exclude_none=True))
+        response =  self._sync_client._post(f"/{self.endpoint}/{str(self.id)}/notes/", json=note_model.model_dump(exclude_unset=True, exclude_none=True))
         if response.get('status_code') == 201:
             location = response.get('headers').get('location')
             parsed_url = urlparse(location)
             path_segments = parsed_url.path.rstrip("/").split("/")
             id = path_segments[-1]
-            return CRMClient(client=self._client).get_note(id)
+            return CRMClient(client=self._sync_client).get_note(id)
         else:
             error_message = response.get('content')
             raise CreateRequestError(f"/{self.endpoint}/{str(self.id)}/notes/", status_code=response.get('status_code'), error_message=error_message)
@@ -351,15 +977,16 @@ class invoice(APIResource[Invoice]):
         Returns:
             salesOrder: The created sales order instance returned by the API.
         """
-        order_converted = create_sales_order_from_invoice(self._model)
-        return OrdersClient(self._client).create_sales_order(order_converted)
+        order_converted = create_sales_order_from_invoice(self.model)
+        return OrdersClient(self._sync_client).create_sales_order(order_converted)
 
     def update(self , invoice_: "Invoice" = None) -> 'invoice':
         """
         Update this invoice.
 
         Sends a PUT request with updated invoice data to the invoices endpoint.
-        If no order object is provided, updates the current instance on the server.
+        If no order object is provided, sends only the fields changed since the instance was loaded
+        (see `APIResource.changes`), and nothing at all if no field changed.
 
         Args:
             invoice_ (Invoice): The Invoice model instance containing updated data.
@@ -367,8 +994,242 @@ class invoice(APIResource[Invoice]):
         Returns:
             invoice: The updated invoice instance created from the response data.
         """
-        data = invoice_.model_dump(exclude_unset=True, exclude_none=True) if invoice_ else self.model_dump(exclude_unset=True, exclude_none=True)
-        response = self._client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
-        return invoice.from_json(response, self._client)   
+        data = invoice_.model_dump(exclude_unset=True, exclude_none=True) if invoice_ else self.changes()
+        if not data:
+            return self
+        response = self._sync_client._put(f"/{self.endpoint}/{str(self.id)}", json=data)
+        return invoice.from_json(response, self._sync_client)   
     
 
+
+
+class AsyncOrdersClient():
+    """
+    Asyncio counterpart of `OrdersClient`.
+
+    Returned `salesOrder` resources are read-only: their own request helpers (``update()``,
+    ``process()``...) raise `TypeError`, so send writes through the coroutines on this client
+    (e.g. `update_sales_order`).
+    """
+
+    def __init__(self, client: AsyncSpireClient):
+        self.client = client
+        self.endpoint = "sales/orders"
+
+    async def get_sales_order(self, id: int = None, order_number: str = None, fields: Optional[List[str]] = None) -> "salesOrder":
+        """
+        Retrieve a sales order by its ID or order number.
+
+        Args:
+            id (int, optional): The ID of the sales order to retrieve.
+            order_number (str, optional): The order number of the sales order to retrieve.
+            fields (List[str], optional): Only fetch these fields (see `OrdersClient.get_sales_order`).
+
+        Returns:
+            salesOrder: A `salesOrder` wrapper instance containing the retrieved data.
+
+        Raises:
+            ValueError: If neither id nor order_number is provided, or if no matching order is found.
+        """
+        if id is not None:
+            response = await self.client._get(f"/{self.endpoint}/{str(id)}", fields=fields)
+            return salesOrder.from_json(response, self.client)
+        elif order_number is not None:
+            orders = await self.query_sales_orders(filter={"orderNo": order_number}, limit=1, fields=["orderNo"])
+            for order in orders:
+                if getattr(order, "orderNo", None) == order_number:
+                    return await self.get_sales_order(order.id, fields=fields)
+            raise ValueError(f"No order found for order number {order_number}")
+        else:
+            raise ValueError("Either 'id' or 'order_number' must be provided.")
+
+    async def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "salesOrder"]:
+        """
+        Retrieve many sales orders by ID in a handful of batched requests (see `OrdersClient.get_many`).
+
+        Returns:
+            Dict[int, salesOrder]: The sales orders keyed by ID. IDs that were not found are left out.
+        """
+        return await self.client._get_many(self.endpoint, salesOrder, ids, chunk_size=chunk_size, detail=detail)
+
+    async def create_sales_order(self, sales_order: 'SalesOrder') -> 'salesOrder':
+        """
+        Create a new sales order.
+
+        Args:
+            sales_order (SalesOrder): A SalesOrder instance containing the sales order details.
+
+        Returns:
+            salesOrder: The created SalesOrder instance.
+
+        Raises:
+            CreateRequestError: If the creation fails or response is invalid.
+        """
+        response = await self.client._post(f"/{self.endpoint}", json=sales_order.model_dump(exclude_unset=True, exclude_none=True))
+        if response.get('status_code') == 201:
+            location = response.get('headers').get('location')
+            parsed_url = urlparse(location)
+            path_segments = parsed_url.path.rstrip("/").split("/")
+            id = path_segments[-1]
+            return await self.get_sales_order(id)
+        else:
+            error_message = response.get('content')
+            raise CreateRequestError(self.endpoint, status_code=response.get('status_code'), error_message=error_message)
+
+    async def update_sales_order(self, id: int, sales_order: 'SalesOrder') -> 'salesOrder':
+        """
+        Update an existing sales order by ID.
+
+        Args:
+            id (int): The ID of the sales order to update.
+            sales_order (SalesOrder): A SalesOrder instance with the sales order details.
+
+        Returns:
+            salesOrder: The updated sales order.
+        """
+        response = await self.client._put(f"/{self.endpoint}/{str(id)}", json=sales_order.model_dump(exclude_none=True, exclude_unset=True))
+        return salesOrder.from_json(response, self.client)
+
+    async def delete_sales_order(self, id: int) -> bool:
+        """
+        Delete a sales order by its ID.
+
+        Args:
+            id (int): The ID of the sales order to delete.
+
+        Returns:
+            bool: True if the sales order was successfully deleted, False otherwise.
+        """
+        return await self.client._delete(f"/{self.endpoint}/{str(id)}")
+
+    async def query_sales_orders(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        fields: Optional[List[str]] = None,
+        **extra_params
+    ) -> List["salesOrder"]:
+        """
+        Query sales orders with optional full-text search, filtering, multi-field sorting, and pagination.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"orderDate": "desc", "orderNo": "asc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            fields (List[str], optional): Only fetch these fields of each record (dotted paths for nested fields).
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            List[salesOrder]: List of wrapped sales order resources.
+        """
+        return await self.client._query(
+            endpoint=self.endpoint,
+            resource_cls=salesOrder,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            fields=fields,
+            **extra_params
+        )
+
+
+class AsyncInvoiceClient():
+    """
+    Asyncio counterpart of `InvoiceClient`.
+
+    Returned `invoice` resources are read-only: their own request helpers raise `TypeError`,
+    so send writes through the coroutines on this client (e.g. `update_invoice`).
+    """
+
+    def __init__(self, client: AsyncSpireClient):
+        self.client = client
+        self.endpoint = "sales/invoices"
+
+    async def get_invoice(self, id: int, fields: Optional[List[str]] = None) -> 'invoice':
+        """
+        Retrieve a sales invoice by its ID.
+
+        Args:
+            id (int): The ID of the invoice to retrieve.
+            fields (List[str], optional): Only fetch these fields (dotted paths for nested fields).
+
+        Returns:
+            invoice: An invoice instance created from the response data.
+        """
+        response = await self.client._get(f"/{self.endpoint}/{id}", fields=fields)
+        return invoice.from_json(response, self.client)
+
+    async def get_many(self, ids: Iterable[int], detail: bool = False, chunk_size: int = 100) -> Dict[int, "invoice"]:
+        """
+        Retrieve many invoices by ID in a handful of batched requests (see `InvoiceClient.get_many`).
+
+        Returns:
+            Dict[int, invoice]: The invoices keyed by ID. IDs that were not found are left out.
+        """
+        return await self.client._get_many(self.endpoint, invoice, ids, chunk_size=chunk_size, detail=detail)
+
+    async def update_invoice(self, id: int, invoice_: Invoice) -> 'invoice':
+        """
+        Update an existing invoice by ID.
+
+        Args:
+            id (int): The ID of the invoice to update.
+            invoice_ (Invoice): The Invoice model instance containing updated data.
+
+        Returns:
+            invoice: The updated invoice instance created from the response data.
+        """
+        response = await self.client._put(f"/{self.endpoint}/{id}", json=invoice_.model_dump(exclude_none=True, exclude_unset=True))
+        return invoice.from_json(response, self.client)
+
+    async def query_invoices(
+        self,
+        *,
+        query: Optional[str] = None,
+        sort: Optional[Dict[str, str]] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        all: bool = False,
+        limit: int = 1000,
+        start: int = 0,
+        fields: Optional[List[str]] = None,
+        **extra_params
+    ) -> List["invoice"]:
+        """
+        Query invoices with optional full-text search, filtering, multi-field sorting, and pagination.
+
+        Args:
+            query (str, optional): Full-text search string.
+            sort (dict, optional): Dictionary of sorting rules (e.g., {"invoiceDate": "desc"}).
+            filter (dict, optional): Dictionary of filters to apply (will be JSON-encoded and URL-safe).
+            all (bool, optional): If True, retrieves all pages of results.
+            limit (int, optional): Number of results per page (max 1000).
+            start (int, optional): Starting offset for pagination.
+            fields (List[str], optional): Only fetch these fields of each record (dotted paths for nested fields).
+            **extra_params (Any): Any additional parameters to include in the query.
+
+        Returns:
+            List[invoice]: List of wrapped invoice resources.
+        """
+        return await self.client._query(
+            endpoint=self.endpoint,
+            resource_cls=invoice,
+            query=query,
+            sort=sort,
+            filter=filter,
+            all=all,
+            limit=limit,
+            start=start,
+            fields=fields,
+            **extra_params
+        )
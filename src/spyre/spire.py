@@ -1,8 +1,12 @@
-from .client import SpireClient
-from .sales import OrdersClient, InvoiceClient
-from .customers import CustomerClient
-from .inventory import InventoryClient
-from .purchasing import PurchasingClient, PurchasingHistoryClient
+from typing import Optional
+from .client import SpireClient, AsyncSpireClient
+from .cache import ResponseCache
+from .mirror import SQLiteMirror
+from .transport import TransportPolicy, RateLimiter
+from .sales import OrdersClient, InvoiceClient, AsyncOrdersClient, AsyncInvoiceClient
+from .customers import CustomerClient, AsyncCustomerClient
+from .inventory import InventoryClient, AsyncInventoryClient
+from .purchasing import PurchasingClient, PurchasingHistoryClient, AsyncPurchasingClient
 
 class Spire:
     """
@@ -20,7 +24,23 @@ class Spire:
         purchasing (PurchasingClient): Client for accessing purchasing records.
         purchasingHistory (PurchasingHistoryClient): Client for accessing purchasing history records.
     """
-    def __init__(self, host : str, company : str, username : str, password : str):
+    def __init__(
+        self,
+        host : str,
+        company : str,
+        username : str,
+        password : str,
+        max_workers : int = 4,
+        cache : Optional[ResponseCache] = None,
+        mirror : Optional[SQLiteMirror] = None,
+        read_from_mirror : bool = False,
+        validate : bool = False,
+        policy : Optional[TransportPolicy] = None,
+        rate_limiter : Optional[RateLimiter] = None,
+        cache_order_numbers : bool = False,
+        cache_po_numbers : bool = False,
+        **client_options,
+    ):
         """
         Creates a Spire session.
 
@@ -29,13 +49,93 @@ class Spire:
             company (str): Spire company.
             username (str): Spire user username.
             password (str): Spire user password.
+            max_workers (int, optional): Maximum number of pages fetched concurrently when querying. Default is 4.
+            cache (ResponseCache, optional): Opt-in cache for single-record GET responses. Default is None.
+            mirror (SQLiteMirror, optional): Local SQLite store of fetched records. Default is None.
+            read_from_mirror (bool, optional): Answer lookups and filtered queries from the mirror. Default is False.
+            validate (bool, optional): Check the credentials and company with `SpireClient.ping()` right away
+                instead of on the first request. Default is False.
+            policy (TransportPolicy, optional): Timeouts and retry rules for every request. Defaults to `TransportPolicy()`.
+            rate_limiter (RateLimiter, optional): Client-side request rate limit. Default is None.
+            cache_order_numbers (bool, optional): Remember the ID behind every order number looked up with
+                `OrdersClient.get_sales_order` so repeated lookups skip the search. Repeated lookups only
+                cost no round trip when ``cache`` (or ``mirror`` with ``read_from_mirror``) is also set;
+                otherwise the order is still fetched by ID. Default is False.
+            cache_po_numbers (bool, optional): Remember the ID behind every PO number looked up with
+                `PurchasingClient.get_purchase_order`, with the same dependency on ``cache``. Default is False.
+            **client_options: Connection pool options passed to `SpireClient` (e.g. ``pool_maxsize``,
+                ``keep_alive``, ``thread_local_sessions``).
+
+        Raises:
+            AuthenticationError: If ``validate`` is True and the credentials are rejected.
+            CompanyNotFoundError: If ``validate`` is True and the company does not exist.
         """
-        self.client = SpireClient(host, company, username, password)
-        self.orders = OrdersClient(self.client)
+        self.client = SpireClient(
+            host, company, username, password,
+            max_workers=max_workers, cache=cache, mirror=mirror, read_from_mirror=read_from_mirror,
+            policy=policy, rate_limiter=rate_limiter, **client_options
+        )
+        self.orders = OrdersClient(self.client, cache_order_numbers=cache_order_numbers)
         self.invoices = InvoiceClient(self.client)
         self.customers = CustomerClient(self.client)
         self.inventory = InventoryClient(self.client)
-        self.purchasing = PurchasingClient(self.client)
+        self.purchasing = PurchasingClient(self.client, cache_po_numbers=cache_po_numbers)
         self.purchasingHistory = PurchasingHistoryClient(self.client)
+        if validate:
+            self.client.ping()
+
+    def __enter__(self) -> "Spire":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the underlying connection pool."""
+        self.client.close()
+
+
+
+
+class AsyncSpire:
+    """
+    High-level asyncio interface to interact with the Spire API.
+
+    Mirrors `Spire` with async resource clients sharing a single `AsyncSpireClient`
+    connection pool. Use it as an async context manager, or call `aclose()` when done.
+
+    Attributes:
+        client (AsyncSpireClient): Authenticated async Spire API client.
+        orders (AsyncOrdersClient): Client for accessing sales orders.
+        invoices (AsyncInvoiceClient): Client for accessing invoices.
+        customers (AsyncCustomerClient): Client for accessing customer records.
+        inventory (AsyncInventoryClient): Client for accessing inventory items.
+        purchasing (AsyncPurchasingClient): Client for accessing purchasing records.
+    """
+    def __init__(self, host : str, company : str, username : str, password : str, **client_options):
+        """
+        Creates an async Spire session.
+
+        Args:
+            host (str): Spire Server host (e.g., black-disk-5630.spirelan.com:10880).
+            company (str): Spire company.
+            username (str): Spire user username.
+            password (str): Spire user password.
+            **client_options: Connection options passed to `AsyncSpireClient` (e.g. ``http2``, ``max_connections``).
+        """
+        self.client = AsyncSpireClient(host, company, username, password, **client_options)
+        self.orders = AsyncOrdersClient(self.client)
+        self.invoices = AsyncInvoiceClient(self.client)
+        self.customers = AsyncCustomerClient(self.client)
+        self.inventory = AsyncInventoryClient(self.client)
+        self.purchasing = AsyncPurchasingClient(self.client)
+
+    async def __aenter__(self) -> "AsyncSpire":
+        return self
 
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self.client.aclose()
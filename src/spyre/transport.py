@@ -0,0 +1,203 @@
+import random
+import ssl
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional, Tuple
+
+import httpx
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+
+
+class TransportPolicy():
+    """
+    Timeouts and retry rules applied to every request sent by `SpireClient` and `AsyncSpireClient`.
+
+    Failed requests are retried with exponential backoff and jitter: the n-th retry waits a
+    random time of up to ``backoff_factor * 2 ** n`` seconds, capped at ``max_backoff``. When the
+    server answers with a ``Retry-After`` header (typically on 429 and 503), that delay is used
+    instead, capped at ``max_retry_after``. Only idempotent methods are retried by default; POSTs are retried only when
+    ``retry_post`` is set, or when the connection could not be opened at all.
+
+    Example:
+        policy = TransportPolicy(connect_timeout=3, read_timeout=120, max_retries=5)
+        client = Spire(host, company, username, password, policy=policy)
+    """
+
+    def __init__(
+        self,
+        connect_timeout: Optional[float] = 5.0,
+        read_timeout: Optional[float] = 60.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        retry_methods: Iterable[str] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+        retry_post: bool = False,
+        respect_retry_after: bool = True,
+        max_retry_after: Optional[float] = 120.0,
+    ):
+        """
+        Args:
+            connect_timeout (float, optional): Seconds to wait for a connection. None waits forever. Default is 5.
+            read_timeout (float, optional): Seconds to wait for the server to answer. None waits forever. Default is 60.
+            max_retries (int, optional): Number of retries after the first attempt. 0 disables retries. Default is 3.
+            backoff_factor (float, optional): Base delay of the exponential backoff, in seconds. Default is 0.5.
+            max_backoff (float, optional): Upper bound of a single backoff delay, in seconds. Default is 30.
+            jitter (bool, optional): Randomise each delay between 0 and its backoff ("full jitter") so
+                concurrent workers do not retry in lockstep. Default is True.
+            retry_statuses (Iterable[int], optional): Response status codes that are retried. Default is 429 and 5xx gateway errors.
+            retry_methods (Iterable[str], optional): HTTP methods that are safe to retry. Default is GET, HEAD, OPTIONS, PUT and DELETE.
+            retry_post (bool, optional): Also retry POSTs. Only enable this when duplicate creates are acceptable. Default is False.
+            respect_retry_after (bool, optional): Wait as long as the server's ``Retry-After`` header asks. Default is True.
+            max_retry_after (float, optional): Upper bound of a ``Retry-After`` delay, in seconds, so a server or proxy
+                asking for an hour cannot stall every worker. None waits as long as asked. Default is 120.
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.retry_post = retry_post
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    @property
+    def timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        """The ``(connect, read)`` timeout pair passed to requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def can_retry(self, method: str) -> bool:
+        """Return True if requests with this HTTP method may be sent again."""
+        method = method.upper()
+        return method in self.retry_methods or (method == "POST" and self.retry_post)
+
+    def should_retry(self, method: str, attempt: int, status_code: Optional[int] = None, error: Optional[Exception] = None) -> bool:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            method (str): The HTTP method of the request.
+            attempt (int): Number of retries already made.
+            status_code (int, optional): Status code of the response, if one was received.
+            error (Exception, optional): The connection error or timeout raised instead of a response,
+                from requests or httpx.
+
+        Returns:
+            bool: True if the request should be sent again.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            # The request never reached the server if the connection could not be opened
+            if isinstance(error, (ConnectTimeout, httpx.ConnectError, httpx.ConnectTimeout)):
+                return True
+            return isinstance(error, (ConnectionError, Timeout, httpx.TransportError)) and self.can_retry(method)
+        return status_code in self.retry_statuses and self.can_retry(method)
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Return the number of seconds to wait before the next retry.
+
+        Args:
+            attempt (int): Number of retries already made.
+            retry_after (str, optional): The ``Retry-After`` header of the failed response.
+        """
+        if self.respect_retry_after and retry_after:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return delay if self.max_retry_after is None else min(delay, self.max_retry_after)
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class RateLimiter():
+    """
+    Thread-safe token bucket that keeps the client under a request rate.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per second. Every
+    request takes a token; when the bucket is empty the caller waits until its token is due.
+    Share one limiter between clients to cap their combined rate.
+
+    Example:
+        limiter = RateLimiter(rate=20, burst=40)   # 20 requests per second, bursts of 40
+        client = Spire(host, company, username, password, rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate (float): Sustained number of requests allowed per second.
+            burst (int, optional): Maximum number of requests sent back to back. Defaults to ``rate`` (at least 1).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket and return how many seconds the caller must wait before using them.
+
+        Tokens are reserved even when the bucket is empty, so waiting callers are served in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Block until the tokens are available. Returns the number of seconds waited."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    `HTTPAdapter` whose connection pools can share one TLS context.
+
+    urllib3 pool managers are thread-safe, so a single adapter can be mounted on several
+    sessions and all of them draw on the same pool of kept-alive connections.
+    """
+
+    def __init__(self, *args, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        """
+        Args:
+            *args: Passed to `HTTPAdapter` (pool_connections, pool_maxsize...).
+            ssl_context (ssl.SSLContext, optional): TLS context used by every pooled HTTPS connection.
+            **kwargs: Passed to `HTTPAdapter`.
+        """
+        self.ssl_context = ssl_context
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.ssl_context is not None:
+            kwargs.setdefault("ssl_context", self.ssl_context)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Parse a ``Retry-After`` header given either in seconds or as an HTTP date."""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -1,7 +1,8 @@
 from .Models.sales_models import SalesOrder, Invoice
-from typing import TypeVar, Optional, Type, List, Set
+from typing import TypeVar, Optional, Type, List, Set, Any, Iterable, Dict, Tuple, FrozenSet, get_args, get_origin
 from copy import deepcopy
-from pydantic import BaseModel
+from decimal import Decimal, InvalidOperation
+from pydantic import BaseModel, TypeAdapter
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -16,63 +17,118 @@ def normalize_path(path: str) -> str:
 def should_exclude(field_path: str, exclude_paths: Set[str]) -> bool:
     return field_path in exclude_paths or field_path.split('.')[-1] in exclude_paths
 
+# Compiled exclusion masks of create_duplicate_record, keyed by model class and exclude paths
+_duplicate_masks: Dict[Tuple[Type[BaseModel], FrozenSet[str]], Dict[str, Any]] = {}
+
+def duplicate_mask(model_cls: Type[BaseModel], exclude_fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Return the pydantic ``exclude`` mask that `create_duplicate_record` applies to a model class.
+
+    Fields are excluded when their path (``contacts.contact_type``) or their own name (``id``) is
+    listed, on the model itself and one level down: in nested models, dicts and list elements.
+    The mask is compiled from the model's fields once per class and set of exclude paths.
+    """
+    paths = frozenset(normalize_path(f) for f in DEFAULT_EXCLUDE_FIELDS.union(exclude_fields or ()))
+    key = (model_cls, paths)
+    mask = _duplicate_masks.get(key)
+    if mask is not None:
+        return mask
+
+    names = {path for path in paths if "." not in path}
+    mask = {}
+    for field_name, field in model_cls.model_fields.items():
+        if should_exclude(field_name, paths):
+            mask[field_name] = True
+            continue
+        shape = _container_shape(field.annotation)
+        if shape is None:
+            continue
+        nested = dict.fromkeys(names | {path[len(field_name) + 1:] for path in paths if path.startswith(f"{field_name}.")}, True)
+        mask[field_name] = {"__all__": nested} if shape == "list" else nested
+    _duplicate_masks[key] = mask
+    return mask
+
+def _container_shape(annotation: Any) -> Optional[str]:
+    """Return "list" for list fields, "mapping" for model and dict fields, and None for scalars."""
+    origin = get_origin(annotation)
+    if origin is list:
+        return "list"
+    if origin is dict or (isinstance(annotation, type) and issubclass(annotation, (BaseModel, dict))):
+        return "mapping"
+    for arg in get_args(annotation):
+        shape = _container_shape(arg)
+        if shape is not None:
+            return shape
+    return None
+
 def create_duplicate_record(
     instance: T,
-    exclude_fields: Optional[List[str]] = None,
-    _prefix: str = ""
+    exclude_fields: Optional[List[str]] = None
 ) -> T:
-    if exclude_fields is None:
-        exclude_fields = []
+    """
+    Copy a model without its IDs and link fields, ready to be created as a new record.
 
-    # Normalize exclude paths so comparisons are wildcard-friendly
-    full_exclude_paths = {normalize_path(f) for f in DEFAULT_EXCLUDE_FIELDS.union(set(exclude_fields))}
-    cleaned_data = {}
+    The fields in `DEFAULT_EXCLUDE_FIELDS` and ``exclude_fields`` are dropped using the compiled
+    mask of `duplicate_mask`, in a single dump that is validated back into the model class.
 
-    for field_name, value in instance.model_dump().items():
-        full_path = f"{_prefix}.{field_name}" if _prefix else field_name
+    Args:
+        instance (BaseModel): The model to copy.
+        exclude_fields (List[str], optional): More field names or dotted paths to drop.
 
-        if should_exclude(full_path, full_exclude_paths):
-            continue
+    Returns:
+        BaseModel: A new instance of the same class.
+    """
+    model_cls = instance.__class__
+    return model_cls.model_validate(instance.model_dump(exclude=duplicate_mask(model_cls, exclude_fields)))
 
-        if isinstance(value, BaseModel):
-            cleaned_data[field_name] = create_duplicate_record(value, exclude_fields, _prefix=full_path)
-
-        elif isinstance(value, list):
-            cleaned_items = []
-            for i, item in enumerate(value):
-                if isinstance(item, BaseModel):
-                    cleaned_items.append(create_duplicate_record(item, exclude_fields, _prefix=full_path))
-                elif isinstance(item, dict):
-                    cleaned_dict = {}
-                    for k, v in item.items():
-                        field_k_path = f"{full_path}.{k}"
-                        if isinstance(v, BaseModel):
-                            cleaned_dict[k] = create_duplicate_record(v, exclude_fields, _prefix=field_k_path)
-                        elif should_exclude(field_k_path, full_exclude_paths):
-                            continue
-                        else:
-                            cleaned_dict[k] = deepcopy(v)
-                    cleaned_items.append(cleaned_dict)
-                else:
-                    cleaned_items.append(deepcopy(item))
-            cleaned_data[field_name] = cleaned_items
-
-        elif isinstance(value, dict):
-            cleaned_dict = {}
-            for k, v in value.items():
-                dict_path = f"{full_path}.{k}"
-                if isinstance(v, BaseModel):
-                    cleaned_dict[k] = create_duplicate_record(v, exclude_fields, _prefix=dict_path)
-                elif should_exclude(dict_path, full_exclude_paths):
-                    continue
-                else:
-                    cleaned_dict[k] = deepcopy(v)
-            cleaned_data[field_name] = cleaned_dict
+def create_duplicate_records(
+    instances: Iterable[T],
+    exclude_fields: Optional[List[str]] = None
+) -> List[T]:
+    """
+    Copy many models at once, as `create_duplicate_record` does for one.
 
-        else:
-            cleaned_data[field_name] = deepcopy(value)
+    Records of the same class share one compiled mask and are validated together in a
+    single call, which is much faster than copying them one by one.
 
-    return instance.__class__(**cleaned_data)
+    Returns:
+        List[BaseModel]: The copies, in the order of ``instances``.
+    """
+    instances = list(instances)
+    copies: List[Optional[T]] = [None] * len(instances)
+    by_class: Dict[Type[BaseModel], List[int]] = {}
+    for index, instance in enumerate(instances):
+        by_class.setdefault(instance.__class__, []).append(index)
+    for model_cls, indexes in by_class.items():
+        mask = duplicate_mask(model_cls, exclude_fields)
+        validated = _list_adapter(model_cls).validate_python([instances[index].model_dump(exclude=mask) for index in indexes])
+        for index, copy in zip(indexes, validated):
+            copies[index] = copy
+    return copies
+
+_list_adapters: Dict[Type[BaseModel], TypeAdapter] = {}
+
+def _list_adapter(model_cls: Type[BaseModel]) -> TypeAdapter:
+    adapter = _list_adapters.get(model_cls)
+    if adapter is None:
+        adapter = _list_adapters[model_cls] = TypeAdapter(List[model_cls])
+    return adapter
+
+def negate_amount(value: Optional[str]) -> Optional[str]:
+    """
+    Negate an amount given as a decimal string, keeping zero and missing values as they are.
+
+    Example:
+        negate_amount("12.50")   # "-12.50"
+        negate_amount("-3")      # "3"
+    """
+    if value is None or value == "":
+        return value
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"Cannot negate non-numeric amount {value!r}") from None
+    return value if amount.is_zero() else str(-amount)
 
 def create_sales_order_from_invoice(invoice: Invoice) -> SalesOrder:
     """
@@ -89,13 +145,31 @@ def create_sales_order_from_invoice(invoice: Invoice) -> SalesOrder:
 
     Notes:
         - Freight amount is negated.
-        - Order and committed quantities are negated unless zero.
+        - Order and committed quantities are negated unless zero (see `negate_amount`).
         - Shipping carrier and tracking number fields are reset to None.
         - Duplicate records are created for address, shipping address, and items 
           to avoid mutating the original invoice data.
     """
+    return _sales_order_from_invoice(invoice, create_duplicate_records(invoice.items or []))
 
+def create_sales_orders_from_invoices(invoices: Iterable[Invoice]) -> List[SalesOrder]:
+    """
+    Convert many invoices into Sales Orders, as `create_sales_order_from_invoice` does for one.
+
+    The lines of every invoice are duplicated together in a single `create_duplicate_records` call.
 
+    Returns:
+        List[SalesOrder]: The sales orders, in the order of ``invoices``.
+    """
+    invoices = list(invoices)
+    duplicates = iter(create_duplicate_records([item for invoice in invoices for item in invoice.items or []]))
+    return [
+        _sales_order_from_invoice(invoice, [next(duplicates) for _ in invoice.items or []])
+        for invoice in invoices
+    ]
+
+def _sales_order_from_invoice(invoice: Invoice, items: List[Any]) -> SalesOrder:
+    """Build the Sales Order of an invoice from duplicates of its lines, given in the same order."""
     return SalesOrder(
         orderNo=invoice.orderNo,
         division=invoice.division,
@@ -119,15 +193,116 @@ def create_sales_order_from_invoice(invoice: Invoice) -> SalesOrder:
         trackingNo=None,
         termsCode=invoice.termsCode,
         termsText=invoice.termsText,
-        freight=f"-{invoice.freight}",
+        freight=negate_amount(invoice.freight),
         subtotal=invoice.subtotal,
         total=invoice.total,
         items = [
-            create_duplicate_record(item).model_copy(update={
-                "orderQty": f"-{item.orderQty}" if item.orderQty != "0" else item.orderQty ,
-                "committedQty": f"-{item.committedQty}" if item.committedQty != "0" else item.committedQty
+            duplicate.model_copy(update={
+                "orderQty": negate_amount(item.orderQty),
+                "committedQty": negate_amount(item.committedQty)
             })
-            for item in invoice.items or []
+            for item, duplicate in zip(invoice.items or [], items)
         ],
         udf=deepcopy(invoice.udf),
-    )
\ No newline at end of file
+    )
+
+def diff_payload(original: dict, current: dict) -> dict:
+    """
+    Return the parts of ``current`` that differ from ``original``, for a minimal update payload.
+
+    Nested objects only carry their changed fields (plus their ``id``). Lists of records with IDs,
+    such as order lines, are diffed line by line: unchanged lines are sent as ``{"id": ...}`` so the
+    server keeps them, changed lines carry their ID and changed fields, and new lines are sent whole.
+    Any other changed list, or a list that lost a line, is sent whole.
+
+    A removed line is simply left out of the list that is sent; nothing marks it for deletion. It is
+    only dropped because Spire replaces the whole list with the one in an update, which is why every
+    remaining line is always included, even unchanged ones.
+
+    Args:
+        original (dict): The record as it was loaded.
+        current (dict): The record as it is now.
+
+    Returns:
+        dict: The changed fields. Empty if nothing changed.
+    """
+    changes = {}
+    for key, value in current.items():
+        if key not in original:
+            changes[key] = value
+            continue
+        old = original[key]
+        if value == old:
+            continue
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = diff_payload(old, value)
+            # Fields dropped from a nested object cannot be cleared by a payload, so there is nothing to send
+            if nested:
+                changes[key] = {"id": value["id"], **nested} if "id" in value else nested
+        elif isinstance(value, list) and isinstance(old, list):
+            changes[key] = _diff_list(old, value)
+        else:
+            changes[key] = value
+    return changes
+
+def _diff_list(original: list, current: list) -> list:
+    if not all(isinstance(line, dict) and line.get("id") is not None for line in original):
+        return current
+    if not all(isinstance(line, dict) for line in current):
+        return current
+    original_lines = {line["id"]: line for line in original}
+    current_ids = {line.get("id") for line in current}
+    if any(id not in current_ids for id in original_lines):
+        return current
+
+    lines = []
+    for line in current:
+        id = line.get("id")
+        if id is None or id not in original_lines:
+            lines.append(line)
+        else:
+            lines.append({"id": id, **diff_payload(original_lines[id], line)})
+    return lines
+
+def compile_projection(fields: Iterable[str]) -> dict:
+    """
+    Turn a list of field paths into a projection tree for `project_record`.
+
+    Dotted paths select nested fields (``customer.customerNo``) and apply to every element of a
+    list (``items.partNo``). A field listed on its own keeps the whole value.
+
+    Example:
+        compile_projection(["orderNo", "customer.customerNo"])
+        # {"orderNo": {}, "customer": {"customerNo": {}}}
+    """
+    tree: dict = {}
+    for path in fields:
+        node = tree
+        parts = path.split(".")
+        for i, part in enumerate(parts):
+            if part in node and not node[part]:
+                # A shorter path already keeps the whole value
+                break
+            if i == len(parts) - 1:
+                node[part] = {}
+            else:
+                node = node.setdefault(part, {})
+    return tree
+
+def project_record(record: Any, tree: dict) -> Any:
+    """
+    Trim a raw JSON record to a projection tree built by `compile_projection`.
+
+    The ``id`` of the record and of every nested object is always kept so projected
+    resources can still be refreshed and updated.
+    """
+    if not tree:
+        return record
+    if isinstance(record, list):
+        return [project_record(element, tree) for element in record]
+    if not isinstance(record, dict):
+        return record
+    projected = {key: project_record(record[key], subtree) for key, subtree in tree.items() if key in record}
+    if "id" in record:
+        projected["id"] = record["id"]
+    return projected
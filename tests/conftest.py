@@ -0,0 +1,22 @@
+import pytest
+
+from spyre import Spire
+from spyre.transport import TransportPolicy
+
+from .fake_spire import FakeSpire
+
+
+@pytest.fixture
+def server() -> FakeSpire:
+    return FakeSpire()
+
+
+@pytest.fixture
+def make_spire(server):
+    """Build a `Spire` client whose requests are answered by ``server``."""
+    def make(**options) -> Spire:
+        options.setdefault("policy", TransportPolicy(max_retries=0))
+        spire = Spire("fake", "acme", "user", "password", **options)
+        spire.client.session.mount("https://", server)
+        return spire
+    return make
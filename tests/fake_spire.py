@@ -0,0 +1,165 @@
+import json
+import threading
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+
+from spyre.Models.typed_models import DECIMAL_FIELDS
+
+COMPANY_PATH = "/api/v2/companies/acme/"
+
+
+class FakeSpire(HTTPAdapter):
+    """
+    In-memory Spire server mounted as the transport of a `requests.Session`.
+
+    Records live in ``collections`` keyed by endpoint (``"sales/orders"``) and ID. List requests
+    apply ``filter``, ``sort``, ``start`` and ``limit`` with the semantics of `matches`, PUTs
+    replace whole lists as Spire does, and every request is appended to ``requests``.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.collections: Dict[str, Dict[int, dict]] = {}
+        self.requests: List[tuple] = []
+        self.fail_next: List[int] = []
+        self._lock = threading.Lock()
+
+    def add(self, endpoint: str, records: List[dict]):
+        self.collections.setdefault(endpoint, {}).update({record["id"]: dict(record) for record in records})
+
+    def count(self, method: Optional[str] = None) -> int:
+        return sum(1 for request in self.requests if method is None or request[0] == method)
+
+    def send(self, request, **kwargs):
+        url = urlparse(request.url)
+        params = {key: values[-1] if key != "sort" else values for key, values in parse_qs(url.query).items()}
+        body = json.loads(request.body) if request.body else None
+        with self._lock:
+            self.requests.append((request.method, url.path, params, body))
+            failure = self.fail_next.pop(0) if self.fail_next else None
+        if failure:
+            return _response(request, failure, {"message": "failure"})
+        parts = url.path.split(COMPANY_PATH, 1)[-1].strip("/").split("/")
+        store = self.collections.get("/".join(parts[:2]))
+        if store is None:
+            return _response(request, 404, {"message": "Not Found"})
+        with self._lock:
+            return self._handle(request, "/".join(parts[:2]), parts[2:], store, params, body)
+
+    def _handle(self, request, endpoint, rest, store, params, body):
+        if not rest:
+            if request.method == "POST":
+                id = max(store, default=0) + 1
+                store[id] = {**body, "id": id}
+                return _response(request, 201, None, {"location": f"https://fake{COMPANY_PATH}{endpoint}/{id}"})
+            records = sorted(store.values(), key=lambda record: record["id"])
+            if "filter" in params:
+                records = [record for record in records if matches(record, json.loads(params["filter"]))]
+            for term in reversed(params.get("sort", [])):
+                field = term.lstrip("-")
+                records.sort(key=lambda record: _sort_key(record, field), reverse=term.startswith("-"))
+            start, limit = int(params.get("start", 0)), int(params.get("limit", 1000))
+            return _response(request, 200, {"records": records[start:start + limit], "count": len(records), "start": start, "limit": limit})
+
+        id = int(rest[0])
+        if id not in store:
+            return _response(request, 404, {"message": "Not Found"})
+        if len(rest) > 1:
+            # Actions such as /process or /issue
+            return _response(request, 200, store[id])
+        if request.method == "GET":
+            return _response(request, 200, store[id])
+        if request.method == "PUT":
+            store[id].update(_merge_lists(store[id], body))
+            return _response(request, 200, store[id])
+        if request.method == "DELETE":
+            del store[id]
+            return _response(request, 204, None)
+        return _response(request, 405, {"message": "Method Not Allowed"})
+
+
+def matches(record: dict, filter: Dict[str, Any]) -> bool:
+    """
+    Evaluate a Spire JSON filter the way the server does.
+
+    Decimal-string fields compare as numbers, other fields by value, and records without the
+    field match ``$ne`` and ``$nin``.
+    """
+    for key, condition in filter.items():
+        if key == "$and":
+            if not all(matches(record, branch) for branch in condition):
+                return False
+            continue
+        if key == "$or":
+            if not any(matches(record, branch) for branch in condition):
+                return False
+            continue
+        value = _lookup(record, key)
+        numeric = key.split(".")[-1] in DECIMAL_FIELDS
+        for operator, operand in (condition.items() if isinstance(condition, dict) else [("$eq", condition)]):
+            if not _compare(value, operator, operand, numeric):
+                return False
+    return True
+
+
+def _compare(value: Any, operator: str, operand: Any, numeric: bool) -> bool:
+    if operator in ("$in", "$nin"):
+        found = any(_compare(value, "$eq", item, numeric) for item in operand)
+        return found if operator == "$in" else not found
+    if value is None or operand is None:
+        equal = value is None and operand is None
+        return equal if operator == "$eq" else (not equal if operator == "$ne" else False)
+    if numeric or (isinstance(operand, (int, float)) and not isinstance(operand, bool)):
+        value, operand = _number(value), _number(operand)
+    return {
+        "$eq": lambda: value == operand,
+        "$ne": lambda: value != operand,
+        "$gt": lambda: value > operand,
+        "$gte": lambda: value >= operand,
+        "$lt": lambda: value < operand,
+        "$lte": lambda: value <= operand,
+    }[operator]()
+
+
+def _number(value: Any) -> Decimal:
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return Decimal(0)
+
+
+def _lookup(record: dict, path: str) -> Any:
+    value: Any = record
+    for part in path.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def _sort_key(record: dict, field: str):
+    value = _lookup(record, field)
+    return (value is not None, _number(value) if field.split(".")[-1] in DECIMAL_FIELDS else value)
+
+
+def _merge_lists(current: dict, update: dict) -> dict:
+    """Replace lists of lines with the one sent, filling lines sent as a bare ``{"id": ...}`` from the stored line."""
+    merged = dict(update)
+    for key, value in update.items():
+        old = current.get(key)
+        if isinstance(value, list) and isinstance(old, list):
+            lines = {line.get("id"): line for line in old if isinstance(line, dict)}
+            merged[key] = [{**lines.get(line.get("id"), {}), **line} if isinstance(line, dict) else line for line in value]
+    return merged
+
+
+def _response(request, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    response = Response()
+    response.status_code = status
+    response._content = b"" if payload is None else json.dumps(payload).encode()
+    response.headers.update(headers or {})
+    response.url = request.url
+    response.request = request
+    return response
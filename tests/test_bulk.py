@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from spyre import BulkCheckpoint
+from spyre.bulk import run_bulk
+
+
+def test_results_keep_the_key_values(tmp_path):
+    result = run_bulk(lambda id: id * 10, [1, 2, 3], key=int, checkpoint=BulkCheckpoint(str(tmp_path / "run.jsonl")))
+    assert result.succeeded == {1: 10, 2: 20, 3: 30}
+
+
+def test_resume_from_checkpoint_skips_completed_records(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    written = []
+
+    def write(id):
+        if id == 3:
+            raise ValueError("rejected")
+        written.append(id)
+        return id
+
+    first = run_bulk(write, [1, 2, 3], key=int, checkpoint=BulkCheckpoint(path))
+    assert sorted(first.succeeded) == [1, 2]
+    assert list(first.failed) == [3]
+
+    written.clear()
+    second = run_bulk(lambda id: written.append(id) or id, [1, 2, 3, 4], key=int, checkpoint=BulkCheckpoint(path))
+    assert sorted(written) == [3, 4]
+    assert sorted(second.skipped) == [1, 2]
+    assert sorted(second.succeeded) == [3, 4]
+
+
+def test_checkpoint_stores_keys_as_strings_and_ignores_a_torn_last_line(tmp_path):
+    path = tmp_path / "run.jsonl"
+    path.write_text(json.dumps({"key": "7", "id": 70}) + "\n" + '{"key": "8", "i')
+    checkpoint = BulkCheckpoint(str(path))
+    assert 7 in checkpoint and "7" in checkpoint
+    assert 8 not in checkpoint
+    assert checkpoint.get(7) == 70
+
+
+def test_transient_failures_are_retried():
+    attempts = []
+
+    def write(id):
+        attempts.append(id)
+        if len(attempts) == 1:
+            raise ConnectionError("reset")
+        return id
+
+    result = run_bulk(write, [5], key=int, retries=1, backoff=0)
+    assert result.succeeded == {5: 5}
+    assert attempts == [5, 5]
+
+
+def test_permanent_failures_are_not_retried():
+    attempts = []
+
+    def write(id):
+        attempts.append(id)
+        raise ValueError("rejected")
+
+    result = run_bulk(write, [5], retries=3, backoff=0)
+    assert isinstance(result.failed[0], ValueError)
+    assert attempts == [5]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_every_record_is_written_once(max_workers):
+    result = run_bulk(lambda id: id, range(50), key=int, max_workers=max_workers)
+    assert sorted(result.succeeded) == list(range(50))
+
+
+def test_process_many_resumes_by_order_id(server, make_spire, tmp_path):
+    server.add("sales/orders", [{"id": id, "orderNo": f"{id:08d}", "status": "O"} for id in (1, 2, 3)])
+    spire = make_spire()
+    path = str(tmp_path / "process.jsonl")
+
+    server.fail_next = [None, None, 400]
+    first = spire.orders.process_many([1, 2, 3], max_workers=1, checkpoint=BulkCheckpoint(path))
+    assert sorted(first.succeeded) == [1, 2] and list(first.failed) == [3]
+    assert first.succeeded[1].model.status == "P"
+
+    second = spire.orders.process_many([1, 2, 3], max_workers=1, checkpoint=BulkCheckpoint(path))
+    assert sorted(second.skipped) == [1, 2]
+    assert list(second.succeeded) == [3]
+    assert server.count("PUT") == 4
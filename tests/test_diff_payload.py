@@ -0,0 +1,77 @@
+from spyre.utils import diff_payload
+
+ORDER = {
+    "id": 7,
+    "orderNo": "00000007",
+    "status": "O",
+    "customer": {"id": 3, "customerNo": "C100", "name": "Acme"},
+    "items": [
+        {"id": 70, "sequence": 1, "partNo": "A100", "orderQty": "2"},
+        {"id": 71, "sequence": 2, "partNo": "A200", "orderQty": "1"},
+    ],
+}
+
+
+def edited(**changes):
+    order = {**ORDER, "customer": dict(ORDER["customer"]), "items": [dict(line) for line in ORDER["items"]]}
+    order.update(changes)
+    return order
+
+
+def test_unchanged_record_has_no_changes():
+    assert diff_payload(ORDER, edited()) == {}
+
+
+def test_changed_fields_only():
+    assert diff_payload(ORDER, edited(status="H")) == {"status": "H"}
+
+
+def test_nested_object_sends_changed_fields_with_its_id():
+    order = edited()
+    order["customer"]["name"] = "Acme Ltd"
+    assert diff_payload(ORDER, order) == {"customer": {"id": 3, "name": "Acme Ltd"}}
+
+
+def test_changed_line_keeps_the_other_lines_by_id():
+    order = edited()
+    order["items"][1]["orderQty"] = "5"
+    assert diff_payload(ORDER, order) == {"items": [{"id": 70}, {"id": 71, "orderQty": "5"}]}
+
+
+def test_added_line_is_sent_whole():
+    line = {"sequence": 3, "partNo": "B100", "orderQty": "4"}
+    order = edited()
+    order["items"].append(line)
+    assert diff_payload(ORDER, order) == {"items": [{"id": 70}, {"id": 71}, line]}
+
+
+def test_removed_line_sends_the_remaining_list_whole():
+    order = edited(items=[dict(ORDER["items"][0])])
+    assert diff_payload(ORDER, order) == {"items": [ORDER["items"][0]]}
+
+
+def test_list_without_line_ids_is_sent_whole():
+    assert diff_payload({"tags": ["a", "b"]}, {"tags": ["a"]}) == {"tags": ["a"]}
+
+
+def test_removed_line_is_dropped_by_the_server_list_replacement(server, make_spire):
+    server.add("sales/orders", [ORDER])
+    spire = make_spire()
+    order = spire.orders.get_sales_order(7)
+
+    order.model.items = order.model.items[:1]
+    order.model.items[0].orderQty = "3"
+    order.update()
+
+    method, _, _, body = server.requests[-1]
+    assert method == "PUT"
+    assert [line["id"] for line in body["items"]] == [70]
+    assert [line["id"] for line in server.collections["sales/orders"][7]["items"]] == [70]
+    assert server.collections["sales/orders"][7]["items"][0]["orderQty"] == "3"
+
+
+def test_unchanged_resource_sends_nothing(server, make_spire):
+    server.add("sales/orders", [ORDER])
+    order = make_spire().orders.get_sales_order(7)
+    order.update()
+    assert server.count("PUT") == 0
@@ -0,0 +1,93 @@
+import pytest
+
+from spyre import SQLiteMirror
+
+from .fake_spire import matches
+
+ITEMS = [
+    {"id": 1, "partNo": "A100", "whse": "00", "availableQty": "10", "description": "Bolt", "pricing": {"sellPrice": ["1.50"]}, "level": 3},
+    {"id": 2, "partNo": "A200", "whse": "00", "availableQty": "9", "description": "Nut", "level": 12},
+    {"id": 3, "partNo": "B100", "whse": "01", "description": "Washer"},
+    {"id": 4, "partNo": "B200", "whse": "01", "availableQty": "10.50", "description": None, "level": 2},
+    {"id": 5, "partNo": "C100", "whse": "00", "availableQty": "-1", "description": "Bolt", "level": 12},
+]
+
+
+@pytest.fixture
+def mirror():
+    mirror = SQLiteMirror()
+    mirror.save("inventory/items", ITEMS, complete=True)
+    mirror.mark_loaded("inventory/items")
+    yield mirror
+    mirror.close()
+
+
+def ids(mirror, filter=None, sort=None):
+    result = mirror.query("inventory/items", filter=filter, sort=sort)
+    return None if result is None else [record["id"] for record in result[0]]
+
+
+@pytest.mark.parametrize("filter", [
+    {"partNo": "A100"},
+    {"whse": {"$ne": "00"}},
+    {"description": {"$ne": "Bolt"}},
+    {"description": {"$nin": ["Bolt", "Nut"]}},
+    {"description": None},
+    {"description": {"$ne": None}},
+    {"availableQty": {"$gt": "5"}},
+    {"availableQty": {"$gt": 5}},
+    {"availableQty": {"$lte": "9"}},
+    {"availableQty": "10.5"},
+    {"availableQty": {"$ne": "10"}},
+    {"availableQty": {"$in": [9, "10.50"]}},
+    {"availableQty": {"$nin": ["10"]}},
+    {"level": {"$gt": 2}},
+    {"level": {"$gte": 3, "$lt": 12}},
+    {"partNo": {"$gte": "A200", "$lt": "C"}},
+    {"$or": [{"whse": "01"}, {"availableQty": {"$lt": 0}}]},
+    {"$and": [{"whse": "00"}, {"description": "Bolt"}]},
+    {"pricing.sellPrice": {"$ne": None}},
+])
+def test_filters_match_server_semantics(mirror, filter):
+    assert ids(mirror, filter) == [item["id"] for item in ITEMS if matches(item, filter)]
+
+
+def test_numeric_comparison_with_text_operand_is_left_to_server(mirror):
+    assert ids(mirror, {"availableQty": {"$gt": "many"}}) is None
+
+
+def test_unknown_operator_is_left_to_server(mirror):
+    assert ids(mirror, {"partNo": {"$like": "A%"}}) is None
+
+
+def test_sort_and_paging(mirror):
+    assert ids(mirror, sort={"whse": "desc", "partNo": "asc"}) == [3, 4, 1, 2, 5]
+    records, count = mirror.query("inventory/items", filter={"whse": "00"}, sort={"partNo": "desc"}, limit=2, start=1)
+    assert [record["id"] for record in records] == [2, 1]
+    assert count == 3
+
+
+@pytest.mark.parametrize("field", ["a'||(select sqlite_version())||'", 'a"b', "x') --", "pricing..sellPrice"])
+def test_field_names_are_never_pasted_into_sql(mirror, field):
+    assert ids(mirror, {field: "x"}) in (None, [])
+    assert ids(mirror, sort={field: "asc"}) in (None, [1, 2, 3, 4, 5])
+
+
+def test_unloaded_endpoint_is_left_to_server(mirror):
+    assert mirror.query("sales/orders", filter={"orderNo": "1"}) is None
+
+
+def test_refresh_reads_the_server_and_updates_the_mirror(server, make_spire):
+    server.add("sales/orders", [{"id": 7, "orderNo": "00000007", "status": "O", "modified": "2024-01-01T00:00:00"}])
+    mirror = SQLiteMirror()
+    spire = make_spire(mirror=mirror, read_from_mirror=True)
+
+    order = spire.orders.get_sales_order(7)
+    server.collections["sales/orders"][7].update(status="H", modified="2024-02-01T00:00:00")
+    assert spire.orders.get_sales_order(7).model.status == "O"
+    requests = server.count()
+
+    order.refresh()
+    assert server.count() == requests + 1
+    assert order.model.status == "H"
+    assert mirror.get("sales/orders", 7)["status"] == "H"
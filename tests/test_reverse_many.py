@@ -0,0 +1,52 @@
+from spyre import BulkCheckpoint
+
+
+def invoice(id, **changes):
+    record = {
+        "id": id,
+        "invoiceNo": f"I{id}",
+        "orderNo": f"{id:08d}",
+        "freight": "3.00",
+        "customer": {"customerNo": "C100"},
+        "address": {"id": 1, "name": "Acme"},
+        "shippingAddress": {"id": 2, "name": "Acme Warehouse"},
+        "items": [{"id": id * 10, "partNo": "A100", "orderQty": "2", "committedQty": "2", "unitPrice": "5.25"}],
+    }
+    record.update(changes)
+    return record
+
+
+def test_reversal_creates_negated_orders(server, make_spire):
+    server.add("sales/invoices", [invoice(1)])
+    server.add("sales/orders", [])
+    result = make_spire().invoices.reverse_many([1])
+
+    assert list(result.succeeded) == [1] and result.ok
+    created = server.requests[-1][3]
+    assert created["freight"] == "-3.00"
+    assert created["items"][0]["orderQty"] == "-2"
+
+
+def test_conversion_errors_are_reported_per_invoice(server, make_spire):
+    bad_line = {"id": 20, "partNo": "A100", "orderQty": "two", "committedQty": "2", "unitPrice": "5.25"}
+    server.add("sales/invoices", [invoice(1), invoice(2, items=[bad_line]), invoice(3), invoice(4, address=None)])
+    server.add("sales/orders", [])
+    result = make_spire().invoices.reverse_many([1, 2, 3, 4, 99])
+
+    assert sorted(result.succeeded) == [1, 3]
+    assert sorted(result.failed) == [2, 4, 99]
+    assert server.count("POST") == 2
+
+
+def test_reversed_invoices_are_skipped_on_resume(server, make_spire, tmp_path):
+    server.add("sales/invoices", [invoice(1), invoice(2)])
+    server.add("sales/orders", [])
+    spire = make_spire()
+    path = str(tmp_path / "reverse.jsonl")
+
+    spire.invoices.reverse_many([1], checkpoint=BulkCheckpoint(path))
+    result = spire.invoices.reverse_many([1, 2], checkpoint=BulkCheckpoint(path))
+
+    assert result.skipped == [1]
+    assert list(result.succeeded) == [2]
+    assert server.count("POST") == 2